@@ -7,7 +7,11 @@ Provides a web interface to run test cases and visualize results
 import streamlit as st
 import json
 import subprocess
-import re
+import threading
+import time
+
+from json_utils import find_json
+from report_cache import ReportCache, report_key
 
 # Page configuration
 st.set_page_config(
@@ -488,162 +492,444 @@ st.markdown(
 )
 
 
-def extract_json_from_output(output, debug=False):
-    """Extract JSON from agent output using multiple methods"""
-    if not output or not output.strip():
+TEST_CASE_DATES = {
+    "test_case_1": ("2024-01-01", "2024-01-03"),
+    "test_case_2": ("2024-01-07", "2024-01-14"),
+    "test_case_3": ("2024-02-01", "2024-02-14"),
+}
+TEST_CASE_TIMEOUT = 300  # seconds
+POLL_INTERVAL = 0.5  # seconds between progress updates while a run is going
+TIMELINE_LENGTH = 15  # most recent progress events shown in the timeline
+
+
+def test_case_command(test_case):
+    """Command line that runs the agent for a test case, or None if unknown"""
+    dates = TEST_CASE_DATES.get(test_case)
+    if dates is None:
         return None
+    # --progress makes every stdout line a JSON event, the report last;
+    # --stream sends P0 items as soon as the model has written them
+    return ["python3", "summarizer.py", *dates, "--progress", "--stream"]
 
-    output = output.strip()
 
-    if debug:
-        print(f"DEBUG: Input output length: {len(output)}")
-        print(f"DEBUG: First 200 chars: {output[:200]}")
+def parse_progress_line(line):
+    """Progress event on an output line, or None for anything else"""
+    try:
+        event = json.loads(line)
+    except json.JSONDecodeError:
+        return None
+    return event if isinstance(event, dict) and "event" in event else None
 
-    # Method 1: Look for markdown code blocks
-    if "```json" in output:
-        json_start = output.find("```json") + 7
-        json_end = output.find("```", json_start)
-        if json_end > json_start:
-            json_str = output[json_start:json_end].strip()
-            if debug:
-                print(
-                    f"DEBUG: Method 1 - Found markdown JSON block: {json_str[:100]}..."
-                )
-            try:
-                result = json.loads(json_str)
-                if debug:
-                    print("DEBUG: Method 1 - Successfully parsed JSON")
-                return result
-            except json.JSONDecodeError as e:
-                if debug:
-                    print(f"DEBUG: Method 1 - JSON decode error: {e}")
-                pass
-
-    # Method 2: Look for JSON object starting with { and ending with }
-    if "{" in output and "}" in output:
-        json_start = output.find("{")
-        json_end = output.rfind("}") + 1
-        if json_end > json_start:
-            json_str = output[json_start:json_end].strip()
-            if debug:
-                print(f"DEBUG: Method 2 - Found JSON object: {json_str[:100]}...")
-            try:
-                result = json.loads(json_str)
-                if debug:
-                    print("DEBUG: Method 2 - Successfully parsed JSON")
-                return result
-            except json.JSONDecodeError as e:
-                if debug:
-                    print(f"DEBUG: Method 2 - JSON decode error: {e}")
-                pass
-
-    # Method 3: Try to find JSON using regex
-    json_pattern = r"\{.*\}"
-    matches = re.findall(json_pattern, output, re.DOTALL)
-    if debug:
-        print(f"DEBUG: Method 3 - Found {len(matches)} regex matches")
-    for i, match in enumerate(matches):
-        if debug:
-            print(f"DEBUG: Method 3 - Trying match {i+1}: {match[:100]}...")
-        try:
-            result = json.loads(match)
-            if debug:
-                print(f"DEBUG: Method 3 - Successfully parsed JSON from match {i+1}")
-            return result
-        except json.JSONDecodeError as e:
-            if debug:
-                print(f"DEBUG: Method 3 - JSON decode error for match {i+1}: {e}")
+
+def report_from_output(output, debug=False):
+    """Final report from the agent output, read from its "report" event"""
+    found_events = False
+    for line in reversed(output.splitlines()):
+        event = parse_progress_line(line)
+        if event is None:
             continue
+        if event["event"] == "report":
+            return event.get("report")
+        found_events = True
+    if found_events:
+        # The run ended without a report; an event is not one
+        return None
+    # Output from an agent without --progress support
+    report = find_json(output)
+    if debug and report is None:
+        print("DEBUG: No JSON object found in output")
+    return report
+
+
+def describe_event(event):
+    """One timeline line for a progress event"""
+    kind = event.get("event")
+    if kind == "run_started":
+        return (
+            f"🚀 Started {event.get('start_date')} to {event.get('end_date')} "
+            f"({event.get('collection_mode')} collection, "
+            f"{event.get('analysis_mode')} analysis)"
+        )
+    if kind == "tool_call_started":
+        return f"🔧 Calling {event.get('tool')}"
+    if kind == "tool_call_finished":
+        if "error" in event:
+            return f"⚠️ {event.get('tool')} failed: {event['error']}"
+        rows = f", {event['rows']} rows" if "rows" in event else ""
+        return (
+            f"🔧 {event.get('tool')} returned in {event.get('seconds', 0):.2f}s{rows}"
+        )
+    if kind == "collection_finished":
+        items = event.get("items") or {}
+        return (
+            f"📥 Collected {sum(items.values())} items "
+            f"in {event.get('seconds', 0):.2f}s"
+        )
+    if kind == "items_filtered":
+        dropped = event.get("dropped") or {}
+        return f"🧹 Dropped {sum(dropped.values())} noise items"
+    if kind == "llm_call_started":
+        return "🤖 LLM call started"
+    if kind == "llm_call_finished":
+        if "error" in event:
+            return f"⚠️ LLM call failed: {event['error']}"
+        tokens = ""
+        if "input_tokens" in event:
+            tokens = (
+                f" ({event['input_tokens']} in / "
+                f"{event.get('output_tokens', 0)} out tokens)"
+            )
+        return f"🤖 LLM call finished in {event.get('seconds', 0):.2f}s{tokens}"
+    if kind == "llm_cache_hit":
+        return "💾 Reused a cached LLM response"
+    if kind == "section":
+        return f"📄 {event.get('name')} ready"
+    if kind == "priority_item":
+        item = event.get("item") or {}
+        path = "/".join(event.get("path") or [])
+        return f"🚨 {path}: {item.get('title', item.get('id'))}"
+    if kind == "report":
+        return "✅ Report ready"
+    if kind == "error":
+        return f"❌ {event.get('message')}"
+    return str(kind)
+
+
+def render_timeline(placeholder, events):
+    """Show the most recent progress events, oldest first"""
+    if not events:
+        return
+    lines = [
+        f"{event.get('t', 0):7.1f}s  {describe_event(event)}"
+        for event in events[-TIMELINE_LENGTH:]
+    ]
+    placeholder.code("\n".join(lines), language=None)
 
-    # Method 4: Try the entire output as JSON
-    if debug:
-        print("DEBUG: Method 4 - Trying entire output as JSON")
-    try:
-        result = json.loads(output)
-        if debug:
-            print("DEBUG: Method 4 - Successfully parsed entire output as JSON")
-        return result
-    except json.JSONDecodeError as e:
-        if debug:
-            print(f"DEBUG: Method 4 - JSON decode error: {e}")
-        pass
-
-    if debug:
-        print("DEBUG: All methods failed to parse JSON")
-    return None
-
-
-def run_test_case(test_case, debug=False):
-    """Run a specific test case and return the agent report"""
-    try:
-        # Run the agent for the specific test case
-        if test_case == "test_case_1":
-            cmd = ["python3", "summarizer.py", "2024-01-01", "2024-01-03"]
-        elif test_case == "test_case_2":
-            cmd = ["python3", "summarizer.py", "2024-01-07", "2024-01-14"]
-        elif test_case == "test_case_3":
-            cmd = ["python3", "summarizer.py", "2024-02-01", "2024-02-14"]
-        else:
-            return None
 
-        # Execute the command
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+def _count_items(section):
+    """Number of items in a priority -> items mapping"""
+    if not isinstance(section, dict):
+        return 0
+    return sum(len(items) for items in section.values() if isinstance(items, list))
 
-        if result.returncode == 0:
-            # Parse the JSON output using the helper function
-            parsed_json = extract_json_from_output(result.stdout, debug=debug)
 
-            if parsed_json:
-                # Ensure we return a dictionary
-                if isinstance(parsed_json, dict):
-                    return parsed_json
-                else:
-                    st.error(
-                        f"JSON parsing returned {type(parsed_json).__name__}, expected dict"
-                    )
-                    if debug:
-                        st.text("Parsed JSON:")
-                        st.text(str(parsed_json))
-                    return None
+def render_sections(placeholder, events):
+    """Show the report sections that have arrived so far"""
+    sections = {
+        event.get("name"): event.get("data")
+        for event in events
+        if event.get("event") == "section"
+    }
+    urgent = [
+        event.get("item") or {}
+        for event in events
+        if event.get("event") == "priority_item"
+    ]
+    if not sections and not urgent:
+        return
+
+    with placeholder.container():
+        if urgent and "action_items" not in sections:
+            st.markdown(f"**P0 items so far ({len(urgent)}):**")
+            for item in urgent:
+                st.markdown(f"- 🚨 {item.get('title', item.get('id'))}")
+        if "summary" in sections:
+            st.markdown(f"**Summary:** {sections['summary']}")
+        action_items = sections.get("action_items")
+        if isinstance(action_items, dict):
+            counts = ", ".join(
+                f"{priority}: {_count_items({priority: items})}"
+                for priority, items in action_items.items()
+            )
+            st.markdown(f"**Action items:** {counts}")
+        updates = sections.get("updates")
+        if isinstance(updates, dict):
+            counts = ", ".join(
+                f"{source}: {_count_items(items)}" for source, items in updates.items()
+            )
+            st.markdown(f"**Updates:** {counts}")
+
+
+def parse_test_case_output(returncode, stdout, stderr, debug=False):
+    """Turn a finished agent run into its report, showing any failure in the UI"""
+    if returncode == 0:
+        # Parse the JSON output using the helper function
+        parsed_json = report_from_output(stdout, debug=debug)
+
+        if parsed_json:
+            # Ensure we return a dictionary
+            if isinstance(parsed_json, dict):
+                return parsed_json
             else:
-                st.error("No valid JSON found in output")
+                st.error(
+                    f"JSON parsing returned {type(parsed_json).__name__}, expected dict"
+                )
                 if debug:
-                    st.text("Raw output:")
-                    st.text(result.stdout if result.stdout else "(empty)")
-                    if result.stderr:
-                        st.text("Raw stderr:")
-                        st.text(result.stderr)
+                    st.text("Parsed JSON:")
+                    st.text(str(parsed_json))
                 return None
         else:
-            st.error(f"Command failed with return code {result.returncode}")
-            if result.stderr:
-                st.text("Error output:")
-                st.text(result.stderr)
+            st.error("No valid JSON found in output")
+            if debug:
+                st.text("Raw output:")
+                st.text(stdout if stdout else "(empty)")
+                if stderr:
+                    st.text("Raw stderr:")
+                    st.text(stderr)
             return None
+    else:
+        st.error(f"Command failed with return code {returncode}")
+        if stderr:
+            st.text("Error output:")
+            st.text(stderr)
+        return None
+
 
-    except subprocess.TimeoutExpired:
-        st.error("Test case execution timed out (5 minutes)")
+class TestCaseRun:
+    """
+    One agent run in the background, with its progress events as they arrive.
+
+    Reader threads drain stdout and stderr as the run writes them, so a
+    chatty run never blocks on a full pipe while the UI is only polling it.
+    """
+
+    def __init__(self, test_case):
+        self.test_case = test_case
+        self.started = time.monotonic()
+        self.finished = None
+        self.events = []
+        self._stdout = []
+        self._stderr = []
+        self.process = subprocess.Popen(
+            test_case_command(test_case),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+        )
+        self._readers = [
+            threading.Thread(target=self._drain, args=args, daemon=True)
+            for args in (
+                (self.process.stdout, self._stdout, True),
+                (self.process.stderr, self._stderr, False),
+            )
+        ]
+        for reader in self._readers:
+            reader.start()
+
+    def _drain(self, stream, lines, parse_events):
+        for line in stream:
+            lines.append(line)
+            event = parse_progress_line(line) if parse_events else None
+            if event is not None:
+                self.events.append(event)
+
+    @property
+    def elapsed(self):
+        return (self.finished or time.monotonic()) - self.started
+
+    @property
+    def status(self):
+        """The latest progress event, described for a status line"""
+        if not self.events:
+            return "starting"
+        return describe_event(self.events[-1])
+
+    def poll(self):
+        """Return code once the run has exited, otherwise None"""
+        returncode = self.process.poll()
+        if returncode is not None and self.finished is None:
+            self.finished = time.monotonic()
+        return returncode
+
+    def output(self):
+        """Everything the run wrote, as (stdout, stderr)"""
+        for reader in self._readers:
+            reader.join(timeout=5)
+        return "".join(self._stdout), "".join(self._stderr)
+
+    def cancel(self):
+        """Stop the run if it is still going"""
+        if self.process.poll() is not None:
+            return
+        self.process.terminate()
+        try:
+            self.process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+
+    def close(self):
+        self.cancel()
+        for reader in self._readers:
+            reader.join(timeout=5)
+
+
+@st.cache_resource
+def report_cache():
+    """Report cache shared by every session of this app"""
+    return ReportCache()
+
+
+def clear_report_cache():
+    """Clear button callback: drop every cached report"""
+    report_cache().clear()
+    st.toast("🗑 Cleared cached reports")
+
+
+def cached_test_case_report(test_case, use_cache=True):
+    """
+    Cache key for a test case's current inputs, and its cached report.
+
+    The key covers the databases and prompts as they are now, so the report
+    is None whenever they changed since it was cached (or use_cache is off).
+    """
+    key = report_key(*TEST_CASE_DATES[test_case])
+    return key, (report_cache().get_report(key) if use_cache else None)
+
+
+def run_test_case(test_case, debug=False, use_cache=True):
+    """Run a specific test case, showing its progress live, and return the report"""
+    if test_case_command(test_case) is None:
         return None
+
+    started = time.perf_counter()
+    key, report = cached_test_case_report(test_case, use_cache)
+    if report is not None:
+        st.caption(
+            f"💾 Served from the report cache in "
+            f"{(time.perf_counter() - started) * 1000:.0f} ms"
+        )
+        return report
+
+    timeline = st.empty()
+    sections = st.empty()
+    try:
+        run = TestCaseRun(test_case)
     except Exception as e:
         st.error(f"Error running test case: {e}")
         return None
 
+    try:
+        while run.poll() is None and run.elapsed < TEST_CASE_TIMEOUT:
+            render_timeline(timeline, run.events)
+            render_sections(sections, run.events)
+            time.sleep(POLL_INTERVAL)
+
+        if run.poll() is None:
+            st.error("Test case execution timed out (5 minutes)")
+            return None
+
+        stdout, stderr = run.output()
+        render_timeline(timeline, run.events)
+        # The full report is shown once this returns
+        sections.empty()
+        report = parse_test_case_output(run.poll(), stdout, stderr, debug=debug)
+        if report:
+            report_cache().set_report(key, report)
+        return report
+
+    except Exception as e:
+        st.error(f"Error running test case: {e}")
+        return None
+    finally:
+        run.close()
+
+
+def cancel_all_test_cases():
+    """Cancel button callback: stop every run started by run_all_test_cases"""
+    for run in st.session_state.get("running_test_cases", {}).values():
+        run.cancel()
+    st.session_state.running_test_cases = {}
+    st.session_state.run_all_cancelled = True
 
-def run_all_test_cases(debug=False):
-    """Run all test cases and return their reports"""
+
+def run_all_test_cases(debug=False, use_cache=True):
+    """
+    Run all test cases concurrently and return their reports.
+
+    Cases with a cached report for their current inputs are served from the
+    cache; every other case is its own agent process, so the wall time is
+    roughly that of the slowest case. Each case shows its own live status, and
+    its report is stored in st.session_state.all_reports and shown as soon as
+    it finishes.
+    Cancelling (or leaving the page) reruns the script, which interrupts the
+    polling loop here; whatever is still running is then terminated.
+    """
     reports = {}
-    test_cases = ["test_case_1", "test_case_2", "test_case_3"]
+    st.session_state.all_reports = reports
+    st.session_state.run_all_cancelled = False
+    test_cases = list(TEST_CASE_DATES)
 
     progress_bar = st.progress(0)
-    status_text = st.empty()
-
-    for i, test_case in enumerate(test_cases):
-        status_text.text(f"Running {test_case}...")
-        report = run_test_case(test_case, debug=debug)
-        reports[test_case] = report
-        progress_bar.progress((i + 1) / len(test_cases))
+    status = {test_case: st.empty() for test_case in test_cases}
+    st.button("⏹ Cancel", on_click=cancel_all_test_cases)
+    # Reports stream in here and are replaced by the full listing at the end
+    live_results = st.empty()
+    live_container = live_results.container()
+
+    runs = {}
+    keys = {}
+    st.session_state.running_test_cases = runs
+    try:
+        for test_case in test_cases:
+            keys[test_case], report = cached_test_case_report(test_case, use_cache)
+            if report is None:
+                runs[test_case] = TestCaseRun(test_case)
+                continue
 
-    status_text.text("All test cases completed!")
+            with live_container:
+                display_report(report, test_case)
+                st.markdown("---")
+            reports[test_case] = report
+            status[test_case].text(f"💾 {test_case}: served from the report cache")
+            progress_bar.progress(len(reports) / len(test_cases))
+
+        while len(reports) < len(test_cases):
+            for test_case, run in runs.items():
+                if test_case in reports:
+                    continue
+
+                returncode = run.poll()
+                if returncode is None and run.elapsed < TEST_CASE_TIMEOUT:
+                    status[test_case].text(
+                        f"⏳ {test_case}: {run.status} ({run.elapsed:.0f}s)"
+                    )
+                    continue
+
+                with live_container:
+                    if returncode is None:
+                        run.cancel()
+                        st.error(f"{test_case} timed out (5 minutes)")
+                        report = None
+                    else:
+                        stdout, stderr = run.output()
+                        report = parse_test_case_output(
+                            returncode, stdout, stderr, debug=debug
+                        )
+                    if report:
+                        display_report(report, test_case)
+                        st.markdown("---")
+
+                reports[test_case] = report
+                if report:
+                    report_cache().set_report(keys[test_case], report)
+                icon = "✅" if report else "❌"
+                status[test_case].text(
+                    f"{icon} {test_case}: finished in {run.elapsed:.0f}s"
+                )
+                progress_bar.progress(len(reports) / len(test_cases))
+
+            if len(reports) < len(test_cases):
+                time.sleep(POLL_INTERVAL)
+    except OSError as e:
+        st.error(f"Error running test cases: {e}")
+    finally:
+        for run in runs.values():
+            run.close()
+        st.session_state.running_test_cases = {}
+
+    live_results.empty()
     return reports
 
 
@@ -896,6 +1182,13 @@ def main():
             debug_mode = st.checkbox(
                 "🐛 Debug Mode", help="Show raw output for troubleshooting"
             )
+            use_cache = st.checkbox(
+                "💾 Use Cached Reports",
+                value=True,
+                help="Reuse a report while the databases, prompts and model "
+                "are unchanged; untick to force a fresh run",
+            )
+            st.button("🗑 Clear Report Cache", on_click=clear_report_cache)
 
         with gap_col:
             st.empty()  # Gap between button and checkbox
@@ -908,31 +1201,36 @@ def main():
             ):
                 if selected_test_case == "Test Case 1 (3-day OOO)":
                     with st.spinner("Running Test Case 1..."):
-                        report = run_test_case("test_case_1", debug=debug_mode)
+                        report = run_test_case(
+                            "test_case_1", debug=debug_mode, use_cache=use_cache
+                        )
                         if report:
                             st.session_state.current_report = report
                             st.session_state.current_test_case = "Test Case 1"
 
                 elif selected_test_case == "Test Case 2 (7-day OOO)":
                     with st.spinner("Running Test Case 2..."):
-                        report = run_test_case("test_case_2", debug=debug_mode)
+                        report = run_test_case(
+                            "test_case_2", debug=debug_mode, use_cache=use_cache
+                        )
                         if report:
                             st.session_state.current_report = report
                             st.session_state.current_test_case = "Test Case 2"
 
                 elif selected_test_case == "Test Case 3 (14-day OOO)":
                     with st.spinner("Running Test Case 3..."):
-                        report = run_test_case("test_case_3", debug=debug_mode)
+                        report = run_test_case(
+                            "test_case_3", debug=debug_mode, use_cache=use_cache
+                        )
                         if report:
                             st.session_state.current_report = report
                             st.session_state.current_test_case = "Test Case 3"
 
                 elif selected_test_case == "Run All Test Cases":
-                    with st.spinner("Running all test cases..."):
-                        reports = run_all_test_cases(debug=debug_mode)
-                        if reports:
-                            st.session_state.all_reports = reports
-                            st.session_state.current_test_case = "All Test Cases"
+                    # Let the streamed results replace any single report
+                    st.session_state.current_report = None
+                    st.session_state.current_test_case = "All Test Cases"
+                    run_all_test_cases(debug=debug_mode, use_cache=use_cache)
 
     with col3:
         st.empty()  # Empty space for centering
@@ -948,6 +1246,8 @@ def main():
     # Display all reports
     elif hasattr(st.session_state, "all_reports") and st.session_state.all_reports:
         st.markdown("## All Test Cases Results")
+        if st.session_state.get("run_all_cancelled"):
+            st.warning("Run cancelled; showing the test cases that had finished")
 
         for test_case, report in st.session_state.all_reports.items():
             if report:
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Batch report generation for many users and date ranges in one process
+
+main.py handles one date range per launch, paying for a fresh interpreter,
+LLM client and MCP server subprocesses every time. This entry point reads a
+JSONL file of jobs, keeps one agent (and its MCP sessions and HTTP client)
+warm across all of them, runs jobs concurrently up to a limit, and writes a
+per-job status/latency summary.
+
+Each line of the jobs file is a JSON object:
+    {"user": "john.doe", "start": "2024-01-01", "end": "2024-01-03",
+     "output": "reports/john.doe_2024-01-01.json"}
+Only "start" and "end" are required.
+
+Usage:
+    python batch.py jobs.jsonl [--concurrency 4] [--summary PATH] [--direct] ...
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, List
+
+from main import DEFAULT_USER, OOOSummarizerAgent, add_agent_arguments, agent_kwargs
+
+DEFAULT_CONCURRENCY = int(os.getenv("OOO_BATCH_CONCURRENCY", "4"))
+DEFAULT_SUMMARY_PATH = "reports/batch_summary.json"
+
+
+def load_jobs(path: str) -> List[Dict[str, Any]]:
+    """
+    Read and normalize jobs from a JSONL file.
+
+    Blank lines are skipped. Jobs get an "id" (1-based line number unless
+    given), a "user" (DEFAULT_USER unless given) and an "output" path.
+
+    Raises:
+        ValueError: If a line is not a JSON object with "start" and "end"
+    """
+    jobs = []
+    with open(path, "r") as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                job = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path}:{line_number}: invalid JSON: {e}") from e
+            if not isinstance(job, dict) or not job.get("start") or not job.get("end"):
+                raise ValueError(
+                    f"{path}:{line_number}: each job needs 'start' and 'end' dates"
+                )
+
+            job_id = str(job.get("id", line_number))
+            user = job.get("user") or DEFAULT_USER
+            jobs.append(
+                {
+                    "id": job_id,
+                    "user": user,
+                    "start": job["start"],
+                    "end": job["end"],
+                    "output": job.get("output")
+                    or os.path.join(
+                        "reports",
+                        "batch",
+                        f"{job_id}_{user}_{job['start']}_{job['end']}.json",
+                    ),
+                }
+            )
+    return jobs
+
+
+async def run_job(agent, job: Dict[str, Any], semaphore: asyncio.Semaphore):
+    """Generate one report, recording its status and latency"""
+    async with semaphore:
+        start = time.perf_counter()
+        try:
+            await agent.generate_report(
+                job["start"],
+                job["end"],
+                output_path=job["output"],
+                emit_stdout=False,
+                user=job["user"],
+            )
+            status, error = "ok", None
+        except Exception as e:
+            status, error = "error", str(e)
+        return {
+            **job,
+            "status": status,
+            "error": error,
+            "seconds": round(time.perf_counter() - start, 3),
+        }
+
+
+async def run_batch(
+    agent, jobs: List[Dict[str, Any]], concurrency: int = DEFAULT_CONCURRENCY
+) -> Dict[str, Any]:
+    """
+    Run every job on one agent whose MCP sessions stay open throughout.
+
+    Returns:
+        Summary with totals and one result per job, in input order
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    start = time.perf_counter()
+    await agent.open_sessions()
+    try:
+        results = await asyncio.gather(
+            *(run_job(agent, job, semaphore) for job in jobs)
+        )
+    finally:
+        await agent.close_sessions()
+
+    succeeded = sum(1 for result in results if result["status"] == "ok")
+    return {
+        "jobs": len(results),
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "concurrency": concurrency,
+        "wall_seconds": round(time.perf_counter() - start, 3),
+        "results": list(results),
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="OOO Summarizer batch runner")
+    parser.add_argument("jobs", help="JSONL file with one job per line")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument("--summary", default=DEFAULT_SUMMARY_PATH)
+    add_agent_arguments(parser)
+    args = parser.parse_args()
+
+    jobs = load_jobs(args.jobs)
+    agent = OOOSummarizerAgent(**agent_kwargs(args))
+    summary = await run_batch(agent, jobs, args.concurrency)
+
+    os.makedirs(os.path.dirname(args.summary) or ".", exist_ok=True)
+    with open(args.summary, "w") as f:
+        json.dump(summary, f, indent=2)
+
+    print(json.dumps(summary))
+    return summary
+
+
+if __name__ == "__main__":
+    try:
+        summary = asyncio.run(main())
+    except KeyboardInterrupt:
+        print("\n⚠️ Interrupted by user")
+        sys.exit(130)
+    sys.exit(1 if summary["failed"] else 0)
@@ -0,0 +1,7 @@
+"""
+Performance benchmarks for the OOO Summarizer Agent
+
+Run from the repository root after seeding the databases, e.g.:
+    bash scripts/seed.sh
+    python -m benchmarks.bench_db_pool
+"""
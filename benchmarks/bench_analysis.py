@@ -0,0 +1,112 @@
+"""
+Tokens and latency of report analysis, three calls vs one structured call.
+
+Collects each seeded test case's data directly, applies the noise filter,
+then runs the "multi" (summary, action items, priorities) and "single"
+(one structured-output call) analysis paths. Token usage is read from the
+usage metadata of every chat completion. Requires OPENAI_API_KEY.
+
+Usage:
+    python -m benchmarks.bench_analysis [--repeat 1] [--modes multi single]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+from collection import collect_data
+from main import ANALYSIS_MODES, OOOSummarizerAgent, prefilter_data
+
+TEST_CASES = ["test_case_1", "test_case_2", "test_case_3"]
+
+
+class UsageCounter(BaseCallbackHandler):
+    """Sum token usage over every chat completion"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.calls = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+
+    def on_llm_end(self, response, **kwargs):
+        for generations in response.generations:
+            for generation in generations:
+                usage = getattr(
+                    getattr(generation, "message", None), "usage_metadata", None
+                )
+                if usage:
+                    self.calls += 1
+                    self.input_tokens += usage.get("input_tokens", 0)
+                    self.output_tokens += usage.get("output_tokens", 0)
+
+
+def load_date_range(test_case):
+    path = os.path.join("tests", "test_data", f"{test_case}.json")
+    with open(path, "r") as f:
+        date_range = json.load(f)["date_range"]
+    return date_range["start"], date_range["end"]
+
+
+async def run(modes, repeat):
+    counter = UsageCounter()
+    agents = {
+        mode: OOOSummarizerAgent(collection_mode="direct", analysis_mode=mode)
+        for mode in modes
+    }
+    for agent in agents.values():
+        agent.llm.callbacks = [counter]
+        await agent.mcp_client.create_all_sessions()
+
+    results = {}
+    try:
+        for test_case in TEST_CASES:
+            start_date, end_date = load_date_range(test_case)
+            first = next(iter(agents.values()))
+            collected = await collect_data(first.mcp_client, start_date, end_date)
+            data_result = prefilter_data(json.dumps(collected))
+
+            case_results = {}
+            for mode, agent in agents.items():
+                analyze = (
+                    agent.analyze_single if mode == "single" else agent.analyze_multi
+                )
+                counter.reset()
+                start = time.perf_counter()
+                for _ in range(repeat):
+                    report = await analyze(data_result)
+                seconds = (time.perf_counter() - start) / repeat
+                case_results[mode] = {
+                    "seconds": round(seconds, 2),
+                    "llm_calls": counter.calls / repeat,
+                    "input_tokens": counter.input_tokens / repeat,
+                    "output_tokens": counter.output_tokens / repeat,
+                    # analyze_single returns None when it would fall back
+                    "valid": report is not None,
+                }
+            results[test_case] = case_results
+    finally:
+        for agent in agents.values():
+            await agent.mcp_client.close_all_sessions()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument(
+        "--modes", nargs="+", choices=ANALYSIS_MODES, default=list(ANALYSIS_MODES)
+    )
+    args = parser.parse_args()
+
+    print(json.dumps(asyncio.run(run(args.modes, args.repeat)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Seed loading throughput: per-row inserts vs executemany vs bulk_loader.
+
+For each --sizes row count, generates that many Slack messages with the
+synthetic data generator and loads them into a fresh, migrated slack.db
+(date index and FTS triggers in place, as after a server has started) three
+ways: one execute() per row as the seed scripts used to, one executemany
+with the indexes and triggers live, and bulk_insert. Reports rows/sec for
+each.
+
+Usage:
+    python -m benchmarks.bench_bulk_load [--sizes 10000 100000 1000000]
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import sqlite3
+import tempfile
+import time
+from datetime import date
+
+from data.bulk_loader import MESSAGE_COLUMNS, bulk_insert
+from data.generate_data import SCHEMAS, Config, generate_messages
+from mcp_servers.migrations import migrate
+
+INSERT = (
+    f"INSERT OR IGNORE INTO messages ({', '.join(MESSAGE_COLUMNS)}) "
+    f"VALUES ({', '.join('?' for _ in MESSAGE_COLUMNS)})"
+)
+
+# Missing databases are expected while the scenarios set up
+logging.getLogger("mcp_servers.migrations").setLevel(logging.ERROR)
+
+
+def make_rows(size):
+    config = Config(
+        start=date(2024, 3, 1),
+        days=1,
+        users=50,
+        emails_per_day=0,
+        events_per_day=0,
+        messages_per_day=size,
+        noise_ratio=0.8,
+        thread_depth=4,
+        channels=10,
+        conflict_density=0.0,
+        seed=7,
+        prefix="bench_",
+    )
+    return list(generate_messages(config, random.Random(7), bytearray()))
+
+
+def fresh_database(directory, name):
+    path = os.path.join(directory, f"{name}.db")
+    conn = sqlite3.connect(path)
+    conn.execute(SCHEMAS["messages"])
+    conn.commit()
+    conn.close()
+    migrate(path, "slack")
+    return path
+
+
+def load_per_row(path, rows):
+    conn = sqlite3.connect(path)
+    cursor = conn.cursor()
+    for row in rows:
+        cursor.execute(INSERT, row)
+    conn.commit()
+    conn.close()
+
+
+def load_executemany(path, rows):
+    conn = sqlite3.connect(path)
+    conn.executemany(INSERT, rows)
+    conn.commit()
+    conn.close()
+
+
+def load_bulk(path, rows):
+    bulk_insert(path, "messages", MESSAGE_COLUMNS, rows)
+
+
+SCENARIOS = {
+    "per_row": load_per_row,
+    "executemany": load_executemany,
+    "bulk_loader": load_bulk,
+}
+
+
+def run(sizes):
+    results = {}
+    for size in sizes:
+        rows = make_rows(size)
+        results[size] = {}
+        with tempfile.TemporaryDirectory() as tmp:
+            for name, load in SCENARIOS.items():
+                path = fresh_database(tmp, name)
+                start = time.perf_counter()
+                load(path, rows)
+                seconds = time.perf_counter() - start
+                results[size][name] = {
+                    "seconds": round(seconds, 3),
+                    "rows_per_sec": round(size / seconds),
+                }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--sizes", nargs="+", type=int, default=[10_000, 100_000, 1_000_000]
+    )
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.sizes), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Wall-clock time of the data collection phase, agentic vs direct.
+
+Starts the MCP servers once, then for each seeded test case's date range
+collects data by calling the tools directly and, when OPENAI_API_KEY is set,
+by running the data collection prompt through the MCP agent.
+
+Usage:
+    python -m benchmarks.bench_collection [--repeat 3] [--modes direct agentic]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import time
+
+from collection import collect_data
+from main import COLLECTION_MODES, OOOSummarizerAgent
+from mcp_utils import get_mcp_client
+
+TEST_CASES = ["test_case_1", "test_case_2", "test_case_3"]
+
+
+def load_date_range(test_case):
+    path = os.path.join("tests", "test_data", f"{test_case}.json")
+    with open(path, "r") as f:
+        date_range = json.load(f)["date_range"]
+    return date_range["start"], date_range["end"]
+
+
+async def time_mode(mode, repeat):
+    if mode == "direct":
+        client = get_mcp_client()
+        collect = lambda start, end: collect_data(client, start, end)
+    else:
+        agent = OOOSummarizerAgent(collection_mode=mode)
+        client = agent.mcp_client
+        collect = agent.collect_data_agentic
+
+    await client.create_all_sessions()
+    try:
+        results = {}
+        for test_case in TEST_CASES:
+            start_date, end_date = load_date_range(test_case)
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                await collect(start_date, end_date)
+                timings.append(time.perf_counter() - start)
+            results[test_case] = {
+                "median_s": round(statistics.median(timings), 3),
+                "min_s": round(min(timings), 3),
+            }
+        return results
+    finally:
+        await client.close_all_sessions()
+
+
+async def run(modes, repeat):
+    results = {}
+    for mode in modes:
+        if mode == "agentic" and not os.getenv("OPENAI_API_KEY"):
+            results[mode] = "skipped: OPENAI_API_KEY is not set"
+            continue
+        results[mode] = await time_mode(mode, repeat)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--modes", nargs="+", choices=COLLECTION_MODES, default=list(COLLECTION_MODES)
+    )
+    args = parser.parse_args()
+
+    print(json.dumps(asyncio.run(run(args.modes, args.repeat)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Calendar conflict detection: SQL self-join vs sweep-line.
+
+Generates synthetic events in a temporary calendar database and times the
+original ``events e1 JOIN events e2`` query against the sweep-line detector
+used by ``get_conflicts``. The self-join is quadratic, so it is skipped above
+``--sql-max`` events.
+
+Usage:
+    python -m benchmarks.bench_conflicts [--sizes 10000 100000] [--sql-max 10000]
+"""
+
+import argparse
+import json
+import os
+import random
+import sqlite3
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from mcp_servers.conflicts import find_overlaps, group_conflicts
+from mcp_servers.migrations import migrate
+
+SELF_JOIN_QUERY = """
+SELECT e1.id, e1.title, e1.start_time, e1.end_time, e2.id, e2.title, e2.start_time, e2.end_time
+FROM events e1
+JOIN events e2 ON e1.id != e2.id
+WHERE e1.start_time BETWEEN ? AND ?
+AND e2.start_time BETWEEN ? AND ?
+AND (
+    (e1.start_time < e2.end_time AND e1.end_time > e2.start_time)
+)
+ORDER BY e1.start_time
+"""
+
+SWEEP_QUERY = """
+SELECT id, custom_id, title, start_time, end_time
+FROM events
+WHERE start_time BETWEEN ? AND ?
+ORDER BY start_time ASC, id ASC
+"""
+
+WINDOW_START = datetime(2024, 2, 1)
+
+
+def build_events_db(db_path, count, seed=42):
+    """Create an events table with ``count`` events, starting on average once an hour"""
+    rng = random.Random(seed)
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        """
+        CREATE TABLE events (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            custom_id TEXT UNIQUE,
+            title TEXT NOT NULL,
+            description TEXT,
+            start_time TEXT NOT NULL,
+            end_time TEXT NOT NULL,
+            event_type TEXT DEFAULT 'meeting'
+        )
+    """
+    )
+    rows = []
+    for i in range(count):
+        start = WINDOW_START + timedelta(minutes=rng.randint(0, count * 60))
+        end = start + timedelta(minutes=rng.choice([15, 30, 45, 60, 90]))
+        rows.append(
+            (
+                f"event_{i:07d}",
+                f"Meeting {i}",
+                start.strftime("%Y-%m-%d %H:%M:%S"),
+                end.strftime("%Y-%m-%d %H:%M:%S"),
+            )
+        )
+    conn.executemany(
+        "INSERT INTO events (custom_id, title, start_time, end_time) VALUES (?, ?, ?, ?)",
+        rows,
+    )
+    conn.commit()
+    conn.close()
+    migrate(db_path, "calendar")
+
+    window_end = WINDOW_START + timedelta(minutes=count * 60 + 90)
+    return WINDOW_START.strftime("%Y-%m-%d"), window_end.strftime("%Y-%m-%d")
+
+
+def time_self_join(conn, start_date, end_date):
+    start = time.perf_counter()
+    rows = conn.execute(
+        SELF_JOIN_QUERY, [start_date, end_date, start_date, end_date]
+    ).fetchall()
+    return time.perf_counter() - start, len(rows)
+
+
+def time_sweep(conn, start_date, end_date, group=False):
+    start = time.perf_counter()
+    events = (
+        {
+            "id": row[0],
+            "custom_id": row[1],
+            "title": row[2],
+            "start_time": row[3],
+            "end_time": row[4],
+        }
+        for row in conn.execute(SWEEP_QUERY, [start_date, end_date])
+    )
+    if group:
+        found = len(group_conflicts(events))
+    else:
+        found = sum(1 for _ in find_overlaps(events))
+    return time.perf_counter() - start, found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--sql-max", type=int, default=10_000)
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            db_path = os.path.join(tmp, f"calendar_{size}.db")
+            start_date, end_date = build_events_db(db_path, size)
+            conn = sqlite3.connect(db_path)
+
+            result = {"events": size}
+            if size <= args.sql_max:
+                seconds, rows = time_self_join(conn, start_date, end_date)
+                # The self-join reports every conflict twice (a, b) and (b, a)
+                result["self_join"] = {"seconds": round(seconds, 4), "rows": rows}
+            else:
+                result["self_join"] = "skipped"
+
+            seconds, pairs = time_sweep(conn, start_date, end_date)
+            result["sweep_pairs"] = {"seconds": round(seconds, 4), "pairs": pairs}
+            seconds, clusters = time_sweep(conn, start_date, end_date, group=True)
+            result["sweep_clusters"] = {
+                "seconds": round(seconds, 4),
+                "clusters": clusters,
+            }
+
+            conn.close()
+            results.append(result)
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
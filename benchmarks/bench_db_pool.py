@@ -0,0 +1,87 @@
+"""
+Per-call latency of the MCP server queries: connect-per-call vs pooled connections.
+
+Builds a copy of the seeded emails database scaled up to ``--rows`` rows and
+runs the ``get_emails`` query for the test case 3 window both ways.
+
+Usage:
+    python -m benchmarks.bench_db_pool [--rows 1000000] [--calls 200]
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import statistics
+import tempfile
+import time
+
+from benchmarks.datasets import scale_table
+from mcp_servers.db import ConnectionPool
+
+QUERY = """
+SELECT custom_id, sender, subject, body, received_date, is_read, thread_id
+FROM emails
+WHERE received_date BETWEEN ? AND ?
+ORDER BY received_date DESC LIMIT ?
+"""
+PARAMS = ["2024-02-01", "2024-02-14", 50]
+
+
+def connect_per_call(db_path):
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+    cursor.execute(QUERY, PARAMS)
+    rows = cursor.fetchall()
+    conn.close()
+    return rows
+
+
+def pooled_call(pool):
+    with pool.connection() as conn:
+        return conn.execute(QUERY, PARAMS).fetchall()
+
+
+def measure(fn, calls):
+    timings = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return {
+        "calls": calls,
+        "mean_ms": round(statistics.mean(timings), 3),
+        "p50_ms": round(timings[len(timings) // 2], 3),
+        "p95_ms": round(timings[int(len(timings) * 0.95) - 1], 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--source", default="data/databases/emails.db")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "emails.db")
+        rows = scale_table(args.source, db_path, "emails", args.rows)
+
+        pool = ConnectionPool(db_path)
+        # Warm both paths once so neither pays first-touch page faults
+        connect_per_call(db_path)
+        pooled_call(pool)
+
+        results = {
+            "rows": rows,
+            "connect_per_call": measure(lambda: connect_per_call(db_path), args.calls),
+            "pooled": measure(lambda: pooled_call(pool), args.calls),
+        }
+        pool.close()
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
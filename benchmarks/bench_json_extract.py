@@ -0,0 +1,143 @@
+"""
+JSON extraction from LLM output: json_utils vs the extractors it replaced.
+
+For each --sizes output size (bytes), builds three model outputs: a report
+in a ```json fence with prose around it, an unfenced report between prose
+lines that contain stray {placeholder} braces, and a truncated output of
+false starts ({"item" with no value or closing brace) holding no JSON at
+all. Each is parsed by json_utils.find_json and by copies of the two
+extractors it replaced (app.py's four-method fallback chain and main.py's
+fenced-block regex). Reports seconds, MB/s and whether the right result
+came back. The old app extractor's regex is quadratic on unclosed braces
+(about 80 s at 1 MB), so it is skipped above --legacy-max-bytes for the
+false starts.
+
+Usage:
+    python -m benchmarks.bench_json_extract [--sizes 1000000 4000000 16000000]
+"""
+
+import argparse
+import json
+import re
+import time
+
+from json_utils import find_json
+
+
+def legacy_app_extract(output):
+    """app.py's extract_json_from_output, without its debug prints"""
+    if not output or not output.strip():
+        return None
+    output = output.strip()
+
+    if "```json" in output:
+        json_start = output.find("```json") + 7
+        json_end = output.find("```", json_start)
+        if json_end > json_start:
+            try:
+                return json.loads(output[json_start:json_end].strip())
+            except json.JSONDecodeError:
+                pass
+
+    if "{" in output and "}" in output:
+        json_start = output.find("{")
+        json_end = output.rfind("}") + 1
+        if json_end > json_start:
+            try:
+                return json.loads(output[json_start:json_end].strip())
+            except json.JSONDecodeError:
+                pass
+
+    for match in re.findall(r"\{.*\}", output, re.DOTALL):
+        try:
+            return json.loads(match)
+        except json.JSONDecodeError:
+            continue
+
+    try:
+        return json.loads(output)
+    except json.JSONDecodeError:
+        return None
+
+
+def legacy_main_extract(text):
+    """main.py's extract_json_from_markdown followed by json.loads"""
+    json_match = re.search(r"```(?:json)?\s*(\{.*?\})\s*```", text, re.DOTALL)
+    try:
+        return json.loads(json_match.group(1) if json_match else text)
+    except json.JSONDecodeError:
+        return None
+
+
+EXTRACTORS = {
+    "json_utils": find_json,
+    "legacy_app": legacy_app_extract,
+    "legacy_main": legacy_main_extract,
+}
+
+
+def make_report(size):
+    """A report whose JSON is roughly size bytes"""
+    item = {
+        "id": "email_000000",
+        "title": "Review the rollout plan before the deadline",
+        "details": {"from": "ana@example.com", "channel": "#release"},
+    }
+    per_item = len(json.dumps(item)) + 2
+    items = [dict(item, id=f"email_{n:06d}") for n in range(max(1, size // per_item))]
+    return {"summary": "Busy week", "action_items": {"P0": items, "P1": [], "P2": []}}
+
+
+def make_outputs(size):
+    report = make_report(size)
+    body = json.dumps(report, indent=2)
+    prose = "Replace {placeholder} with the {owner} of each item.\n"
+    filler = prose * max(1, size // (10 * len(prose)))
+    outputs = {
+        "fenced": f"Here is the report:\n```json\n{body}\n```\nLet me know!\n",
+        "prose": f"{filler}{json.dumps(report)}\n{filler}",
+        "false_starts": "Template: " + '{"item" ' * (size // 8),
+    }
+    return report, outputs
+
+
+def run(sizes, legacy_max_bytes):
+    results = {}
+    for size in sizes:
+        report, outputs = make_outputs(size)
+        results[size] = {}
+        for scenario, output in outputs.items():
+            expected = None if scenario == "false_starts" else report
+            results[size][scenario] = {}
+            for name, extract in EXTRACTORS.items():
+                if (
+                    name == "legacy_app"
+                    and scenario == "false_starts"
+                    and len(output) > legacy_max_bytes
+                ):
+                    results[size][scenario][name] = "skipped (quadratic)"
+                    continue
+                start = time.perf_counter()
+                found = extract(output)
+                seconds = time.perf_counter() - start
+                results[size][scenario][name] = {
+                    "seconds": round(seconds, 4),
+                    "mb_per_sec": round(len(output) / 1e6 / seconds, 1),
+                    "correct": found == expected,
+                }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--sizes", nargs="+", type=int, default=[1_000_000, 4_000_000, 16_000_000]
+    )
+    parser.add_argument("--legacy-max-bytes", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.sizes, args.legacy_max_bytes), indent=2))
+
+
+if __name__ == "__main__":
+    main()
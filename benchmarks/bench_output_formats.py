@@ -0,0 +1,82 @@
+"""
+Token counts and serialization time of MCP tool output per encoding.
+
+Calls get_emails, get_events and get_messages for each seeded test case's
+date range and measures the encoded payload in every output_format, plus
+compact output with truncated text fields.
+
+Usage:
+    python -m benchmarks.bench_output_formats [--max-chars 80]
+"""
+
+import argparse
+import json
+import os
+import time
+
+from mcp_servers.calendar_server import get_events
+from mcp_servers.email_server import get_emails
+from mcp_servers.encoding import FORMATS
+from mcp_servers.migrations import migrate_all
+from mcp_servers.slack_server import get_messages
+from token_budget import count_tokens, tokenizer_name
+
+TEST_CASES = ["test_case_1", "test_case_2", "test_case_3"]
+TOOLS = {
+    "emails": get_emails,
+    "calendar_events": get_events,
+    "slack_messages": get_messages,
+}
+
+
+def load_date_range(test_case):
+    path = os.path.join("tests", "test_data", f"{test_case}.json")
+    with open(path, "r") as f:
+        date_range = json.load(f)["date_range"]
+    return date_range["start"], date_range["end"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--max-chars", type=int, default=80)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    # The tools are called directly, so migrate as a starting server would
+    migrate_all()
+    variants = [(fmt, 0) for fmt in FORMATS] + [("compact", args.max_chars)]
+
+    results = {"tokenizer": tokenizer_name(), "test_cases": {}}
+    for test_case in TEST_CASES:
+        start_date, end_date = load_date_range(test_case)
+        case_results = {}
+        for output_format, max_chars in variants:
+            label = output_format if not max_chars else f"{output_format}+truncated"
+            tokens = 0
+            chars = 0
+            seconds = 0.0
+            for tool in TOOLS.values():
+                start = time.perf_counter()
+                for _ in range(args.repeat):
+                    payload = tool(
+                        start_date,
+                        end_date,
+                        page_size=500,
+                        output_format=output_format,
+                        max_chars=max_chars,
+                    )
+                seconds += (time.perf_counter() - start) / args.repeat
+                tokens += count_tokens(payload)
+                chars += len(payload)
+            case_results[label] = {
+                "tokens": tokens,
+                "chars": chars,
+                "ms_per_call_set": round(seconds * 1000, 3),
+            }
+        results["test_cases"][test_case] = case_results
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
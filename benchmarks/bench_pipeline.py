@@ -0,0 +1,211 @@
+"""
+End-to-end pipeline timings and peak memory with a local fake LLM.
+
+For each --scales factor, densifies the test case 3 window of the seeded
+databases to that many times its rows, then in a fresh interpreter times:
+direct and agentic collection, the noise filter and token budget, each
+analysis path (three parallel calls, one structured call, map-reduce), JSON
+extraction, and a full generate_report that writes the report file. Every
+LLM call goes to FakeChatModel with --latency seconds of simulated delay, so
+no API key or network is needed and the numbers only move when the pipeline
+does. Each scenario reports the median of --repeat untraced runs plus the
+tracemalloc peak of one traced run. Results are written as JSON to --output.
+
+Usage:
+    python -m benchmarks.bench_pipeline [--scales 1 10 100] [--latency 0.2]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.datasets import build_scaled_dataset
+from benchmarks.fake_llm import FakeChatModel, canned_report
+from collection import collect_data
+from json_utils import extract_json
+from main import OOOSummarizerAgent, prefilter_data
+from mcp_utils import MCP_TRANSPORTS
+
+TEST_CASE = "test_case_3"
+DATASET_DIR = os.path.join(".cache", "bench")
+DEFAULT_OUTPUT = os.path.join("reports", "benchmarks", "pipeline.json")
+EXTRACT_CALLS = 100
+
+
+def load_date_range(test_case):
+    path = os.path.join("tests", "test_data", f"{test_case}.json")
+    with open(path, "r") as f:
+        date_range = json.load(f)["date_range"]
+    return date_range["start"], date_range["end"]
+
+
+async def measure(scenario, repeat):
+    """Median of untraced runs, then one run under tracemalloc for peak memory"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = await scenario()
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        await scenario()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return result, {
+        "median_s": round(statistics.median(timings), 4),
+        "min_s": round(min(timings), 4),
+        "peak_mb": round(peak / 2**20, 2),
+    }
+
+
+async def run_scale(latency, transport, repeat):
+    start_date, end_date = load_date_range(TEST_CASE)
+    llm = FakeChatModel(latency=latency, collection_window=(start_date, end_date))
+    agent = OOOSummarizerAgent(
+        collection_mode="direct",
+        use_cache=False,
+        mcp_transport=transport,
+        llm=llm,
+    )
+    results = {}
+
+    async def collect_direct():
+        return await collect_data(agent.mcp_client, start_date, end_date)
+
+    async def collect_agentic():
+        return await agent.collect_data_agentic(start_date, end_date)
+
+    await agent.open_sessions()
+    try:
+        collected, results["collect_direct"] = await measure(collect_direct, repeat)
+        _, results["collect_agentic"] = await measure(collect_agentic, repeat)
+
+        async def filter_and_budget():
+            return agent.budget_data(prefilter_data(json.dumps(collected)))[0]
+
+        data_result, results["filter_and_budget"] = await measure(
+            filter_and_budget, repeat
+        )
+
+        async def analyze_multi():
+            return await agent.analyze_multi(data_result)
+
+        async def analyze_single():
+            return await agent.analyze_single(data_result)
+
+        async def analyze_mapreduce():
+            return await agent.analyze_mapreduce(data_result)
+
+        _, results["analyze_multi"] = await measure(analyze_multi, repeat)
+        _, results["analyze_single"] = await measure(analyze_single, repeat)
+        _, results["analyze_mapreduce"] = await measure(analyze_mapreduce, repeat)
+
+        fenced = "```json\n" + json.dumps(canned_report(collected)) + "\n```"
+
+        async def extract_fenced():
+            for _ in range(EXTRACT_CALLS):
+                extract_json(fenced)
+
+        _, results["extract_json"] = await measure(extract_fenced, repeat)
+        results["extract_json"]["calls"] = EXTRACT_CALLS
+
+        with tempfile.TemporaryDirectory() as tmp:
+
+            async def generate_report():
+                return await agent.generate_report(
+                    start_date,
+                    end_date,
+                    output_path=os.path.join(tmp, "report.json"),
+                    emit_stdout=False,
+                )
+
+            _, results["generate_report"] = await measure(generate_report, repeat)
+    finally:
+        await agent.close_sessions()
+
+    return {
+        "items": {key: len(items) for key, items in collected.items()},
+        "scenarios": results,
+    }
+
+
+def run_scale_subprocess(factor, args):
+    """Run one scale in a fresh interpreter pointed at its densified databases"""
+    start_date, end_date = load_date_range(TEST_CASE)
+    data_dir = os.path.join(DATASET_DIR, f"x{factor}")
+    if args.rebuild or not os.path.isdir(data_dir):
+        build_scaled_dataset(data_dir, start_date, end_date, factor)
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "benchmarks.bench_pipeline",
+            "--scale-run",
+            "--latency",
+            str(args.latency),
+            "--transport",
+            args.transport,
+            "--repeat",
+            str(args.repeat),
+        ],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "OOO_DATA_DIR": data_dir},
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{factor}x run failed:\n{result.stderr[-2000:]}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scales", nargs="+", type=int, default=[1, 10, 100])
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--transport", choices=MCP_TRANSPORTS, default="inprocess")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    parser.add_argument(
+        "--rebuild", action="store_true", help="Rebuild the scaled databases"
+    )
+    parser.add_argument("--scale-run", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.scale_run:
+        # The pipeline narrates progress on stdout; keep it for the JSON line
+        with contextlib.redirect_stdout(open(os.devnull, "w")):
+            result = asyncio.run(run_scale(args.latency, args.transport, args.repeat))
+        print(json.dumps(result))
+        return
+
+    results = {
+        "test_case": TEST_CASE,
+        "latency_s": args.latency,
+        "transport": args.transport,
+        "repeat": args.repeat,
+        "python": platform.python_version(),
+        "scales": {
+            f"{factor}x": run_scale_subprocess(factor, args) for factor in args.scales
+        },
+    }
+
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
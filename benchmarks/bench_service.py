@@ -0,0 +1,146 @@
+"""
+Load test: report service vs one process per report.
+
+Submits --jobs reports (cycling through the seeded test cases' date ranges)
+to an in-process report service over HTTP and polls until all finish, then
+runs the same jobs as `python summarizer.py <start> <end>` subprocesses with
+the same concurrency. Reports throughput and latency percentiles for both.
+Requires OPENAI_API_KEY.
+
+Usage:
+    python -m benchmarks.bench_service [--jobs 12] [--concurrency 4] [--direct]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+
+from main import OOOSummarizerAgent, add_agent_arguments, agent_kwargs
+from service import serve
+
+TEST_CASES = ["test_case_1", "test_case_2", "test_case_3"]
+AGENT_FLAGS = {
+    "direct": "--direct",
+    "single_call": "--single-call",
+    "map_reduce": "--map-reduce",
+    "in_process": "--in-process",
+}
+
+
+def load_date_range(test_case):
+    path = os.path.join("tests", "test_data", f"{test_case}.json")
+    with open(path, "r") as f:
+        date_range = json.load(f)["date_range"]
+    return date_range["start"], date_range["end"]
+
+
+def summarize(latencies, wall_seconds, failures):
+    ordered = sorted(latencies)
+    return {
+        "jobs": len(latencies),
+        "failed": failures,
+        "wall_s": round(wall_seconds, 2),
+        "throughput_per_min": round(60 * len(latencies) / wall_seconds, 2),
+        "p50_s": round(statistics.median(ordered), 2),
+        "p95_s": round(ordered[max(0, int(len(ordered) * 0.95) - 1)], 2),
+    }
+
+
+async def http_json(port, method, path, payload=None):
+    body = json.dumps(payload).encode() if payload is not None else b""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: localhost\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+    )
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    return json.loads(response.partition(b"\r\n\r\n")[2])
+
+
+async def run_service(jobs, concurrency, args, port):
+    ready = asyncio.Event()
+    agent = OOOSummarizerAgent(**agent_kwargs(args))
+    server = asyncio.create_task(serve(agent, "127.0.0.1", port, concurrency, ready))
+    await ready.wait()
+    try:
+        start = time.perf_counter()
+        ids = [
+            (await http_json(port, "POST", "/reports", {"start": s, "end": e}))["id"]
+            for s, e in jobs
+        ]
+        pending = set(ids)
+        results = {}
+        while pending:
+            await asyncio.sleep(0.2)
+            for job_id in list(pending):
+                job = await http_json(port, "GET", f"/reports/{job_id}")
+                if job["status"] in ("done", "error"):
+                    results[job_id] = job
+                    pending.discard(job_id)
+        wall = time.perf_counter() - start
+    finally:
+        server.cancel()
+        await asyncio.gather(server, return_exceptions=True)
+
+    latencies = [job["finished_at"] - job["submitted_at"] for job in results.values()]
+    failures = sum(1 for job in results.values() if job["status"] == "error")
+    return summarize(latencies, wall, failures)
+
+
+async def run_processes(jobs, concurrency, args):
+    flags = [flag for name, flag in AGENT_FLAGS.items() if getattr(args, name)]
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(start_date, end_date):
+        async with semaphore:
+            started = time.perf_counter()
+            process = await asyncio.create_subprocess_exec(
+                sys.executable,
+                "summarizer.py",
+                start_date,
+                end_date,
+                *flags,
+                stdout=asyncio.subprocess.DEVNULL,
+            )
+            code = await process.wait()
+            return time.perf_counter() - started, code
+
+    start = time.perf_counter()
+    outcomes = await asyncio.gather(*(one(s, e) for s, e in jobs))
+    wall = time.perf_counter() - start
+    return summarize(
+        [seconds for seconds, _ in outcomes],
+        wall,
+        sum(1 for _, code in outcomes if code != 0),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=12)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--port", type=int, default=8765)
+    add_agent_arguments(parser)
+    args = parser.parse_args()
+
+    if not os.getenv("OPENAI_API_KEY"):
+        sys.exit("OPENAI_API_KEY is not set")
+
+    ranges = [load_date_range(test_case) for test_case in TEST_CASES]
+    jobs = [ranges[i % len(ranges)] for i in range(args.jobs)]
+
+    results = {
+        "service": asyncio.run(run_service(jobs, args.concurrency, args, args.port)),
+        "process_per_report": asyncio.run(run_processes(jobs, args.concurrency, args)),
+    }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+MCP session startup and per-call latency, stdio vs in-process transport.
+
+For each transport, opens sessions to all three servers --repeat times
+(startup), then times --calls small get_emails calls and one full direct
+collection of the largest seeded test case over a single open client. The
+first in-process startup includes importing the server modules.
+
+Usage:
+    python -m benchmarks.bench_transport [--repeat 3] [--calls 200]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import time
+
+from collection import collect_data
+from mcp_utils import MCP_TRANSPORTS, get_mcp_client
+
+LARGEST_TEST_CASE = "test_case_3"
+
+# Out-of-order stdio session cleanup is noisy but harmless
+logging.getLogger("mcp_use").setLevel(logging.ERROR)
+
+
+def load_date_range(test_case):
+    path = os.path.join("tests", "test_data", f"{test_case}.json")
+    with open(path, "r") as f:
+        date_range = json.load(f)["date_range"]
+    return date_range["start"], date_range["end"]
+
+
+def percentile_ms(timings, fraction):
+    ordered = sorted(timings)
+    return round(1000 * ordered[max(0, int(len(ordered) * fraction) - 1)], 3)
+
+
+async def startup_once(transport):
+    start = time.perf_counter()
+    client = get_mcp_client(transport)
+    await client.create_all_sessions()
+    seconds = time.perf_counter() - start
+    await client.close_all_sessions()
+    return seconds
+
+
+def time_startup(transport, repeat):
+    # A fresh event loop per run: stdio sessions closed out of order can leave
+    # anyio cancel scopes behind on the loop that opened them
+    timings = [asyncio.run(startup_once(transport)) for _ in range(repeat)]
+    return {
+        "first_s": round(timings[0], 3),
+        "median_s": round(statistics.median(timings), 3),
+    }
+
+
+async def time_calls(transport, calls):
+    start_date, end_date = load_date_range(LARGEST_TEST_CASE)
+    client = get_mcp_client(transport)
+    await client.create_all_sessions()
+    try:
+        connector = client.get_session("email").connector
+        arguments = {
+            "start_date": start_date,
+            "end_date": end_date,
+            "page_size": 10,
+            "output_format": "compact",
+        }
+        timings = []
+        for _ in range(calls):
+            start = time.perf_counter()
+            await connector.call_tool("get_emails", arguments)
+            timings.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await collect_data(client, start_date, end_date)
+        collect_seconds = time.perf_counter() - start
+    finally:
+        await client.close_all_sessions()
+
+    return {
+        "call_p50_ms": percentile_ms(timings, 0.5),
+        "call_p95_ms": percentile_ms(timings, 0.95),
+        "collect_s": round(collect_seconds, 3),
+    }
+
+
+def run(transports, repeat, calls):
+    results = {}
+    for transport in transports:
+        results[transport] = {
+            **time_startup(transport, repeat),
+            **asyncio.run(time_calls(transport, calls)),
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument(
+        "--transports",
+        nargs="+",
+        choices=MCP_TRANSPORTS,
+        default=list(MCP_TRANSPORTS),
+    )
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.transports, args.repeat, args.calls), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+Helpers for building scaled-up copies of the seeded SQLite databases.
+
+The seed scripts only produce a few hundred rows; benchmarks replicate the
+seeded rows (shifting their dates forward one window at a time) so queries
+over the original OOO window still return the same rows while the table
+grows to the requested size.
+"""
+
+import os
+import shutil
+import sqlite3
+
+# Date column used for range queries in each seeded table
+DATE_COLUMNS = {
+    "emails": ["received_date", "meeting_date"],
+    "events": ["start_time", "end_time"],
+    "messages": ["timestamp"],
+}
+
+
+def scale_table(src_db, dst_db, table, target_rows, shift_days=14):
+    """
+    Copy ``src_db`` to ``dst_db`` and replicate ``table`` up to ``target_rows``.
+
+    Each replica is shifted ``shift_days`` further into the future and gets a
+    unique ``custom_id`` suffix, so the original rows keep their position.
+
+    Returns:
+        Number of rows in the scaled table
+    """
+    if not os.path.exists(src_db):
+        raise FileNotFoundError(
+            f"Seeded database not found: {src_db} (run bash scripts/seed.sh first)"
+        )
+
+    os.makedirs(os.path.dirname(os.path.abspath(dst_db)), exist_ok=True)
+    shutil.copyfile(src_db, dst_db)
+
+    conn = sqlite3.connect(dst_db)
+    try:
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+
+        columns = [
+            row[1]
+            for row in conn.execute(f"PRAGMA table_info({table})")
+            if row[1] != "id"
+        ]
+        base_rows = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        if base_rows == 0:
+            raise ValueError(f"Table {table} in {src_db} is empty")
+
+        copies = max(0, -(-target_rows // base_rows) - 1)
+        select_columns = []
+        for column in columns:
+            if column in DATE_COLUMNS.get(table, []):
+                select_columns.append(
+                    f"datetime({column}, '+' || (n * {shift_days}) || ' days')"
+                )
+            elif column == "custom_id":
+                select_columns.append("custom_id || '_x' || n")
+            else:
+                select_columns.append(column)
+
+        conn.execute("BEGIN")
+        conn.execute(
+            f"""
+            WITH RECURSIVE copies(n) AS (
+                SELECT 1 UNION ALL SELECT n + 1 FROM copies WHERE n < ?
+            )
+            INSERT INTO {table} ({", ".join(columns)})
+            SELECT {", ".join(select_columns)}
+            FROM copies, (SELECT * FROM {table} ORDER BY id)
+            WHERE n <= ?
+            LIMIT ?
+            """,
+            [copies, copies, max(0, target_rows - base_rows)],
+        )
+        conn.commit()
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+    finally:
+        conn.close()
+
+
+# Database file -> table, as laid out by the seed scripts
+DATABASES = {
+    "emails.db": "emails",
+    "calendar.db": "events",
+    "slack.db": "messages",
+}
+
+
+def densify_window(src_db, dst_db, table, start_date, end_date, factor):
+    """
+    Copy ``src_db`` to ``dst_db`` with ``factor`` times the rows in a window.
+
+    Every row dated between ``start_date`` and ``end_date`` (inclusive) is
+    replicated ``factor - 1`` times. Copy ``n`` is shifted ``n`` seconds
+    later and gets a ``_x<n>`` custom_id suffix, so a query over the window
+    returns ``factor`` times as many rows in the same order.
+
+    Returns:
+        Number of rows in the window after densifying
+    """
+    if not os.path.exists(src_db):
+        raise FileNotFoundError(
+            f"Seeded database not found: {src_db} (run bash scripts/seed.sh first)"
+        )
+
+    os.makedirs(os.path.dirname(os.path.abspath(dst_db)), exist_ok=True)
+    shutil.copyfile(src_db, dst_db)
+
+    window_column = DATE_COLUMNS[table][0]
+    window = f"{window_column} BETWEEN ? AND ?"
+    bounds = [f"{start_date} 00:00:00", f"{end_date} 23:59:59"]
+
+    conn = sqlite3.connect(dst_db)
+    try:
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+
+        columns = [
+            row[1]
+            for row in conn.execute(f"PRAGMA table_info({table})")
+            if row[1] != "id"
+        ]
+        select_columns = []
+        for column in columns:
+            if column in DATE_COLUMNS[table]:
+                select_columns.append(f"datetime({column}, '+' || n || ' seconds')")
+            elif column == "custom_id":
+                select_columns.append("custom_id || '_x' || n")
+            else:
+                select_columns.append(column)
+
+        conn.execute("BEGIN")
+        conn.execute(
+            f"""
+            WITH RECURSIVE copies(n) AS (
+                SELECT 1 UNION ALL SELECT n + 1 FROM copies WHERE n < ?
+            )
+            INSERT INTO {table} ({", ".join(columns)})
+            SELECT {", ".join(select_columns)}
+            FROM copies, (SELECT * FROM {table} WHERE {window} ORDER BY id)
+            WHERE n < ?
+            """,
+            [max(1, factor - 1), *bounds, factor],
+        )
+        conn.commit()
+        return conn.execute(
+            f"SELECT COUNT(*) FROM {table} WHERE {window}", bounds
+        ).fetchone()[0]
+    finally:
+        conn.close()
+
+
+def build_scaled_dataset(
+    out_dir, start_date, end_date, factor, source_dir="data/databases"
+):
+    """
+    Densify all three seeded databases into ``out_dir``.
+
+    Point the servers at the result with ``OOO_DATA_DIR=<out_dir>``.
+
+    Returns:
+        Dict of table -> rows in the window
+    """
+    return {
+        table: densify_window(
+            os.path.join(source_dir, filename),
+            os.path.join(out_dir, filename),
+            table,
+            start_date,
+            end_date,
+            factor,
+        )
+        for filename, table in DATABASES.items()
+    }
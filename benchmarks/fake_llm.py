@@ -0,0 +1,314 @@
+"""
+Deterministic local stand-in for ChatOpenAI.
+
+Lets the benchmarks drive the whole pipeline without an API key or network.
+Every call sleeps for a configurable latency, then answers from the prompt
+alone:
+
+- A prompt without a "## Data Collected" block (agentic collection) gets
+  calls to the three listing tools, follow-up calls for every page with a
+  next_cursor, then their combined items as JSON.
+- The summary, action item and priority prompts get canned JSON built from
+  the highest-scoring items in the data they carry, fenced like a real model
+  reply.
+- with_structured_output returns the full report in the REPORT_SCHEMA shape.
+
+Usage metadata is filled from count_tokens so token accounting still works.
+
+FakeAgent stands in for OOOSummarizerAgent one level up, for callers that
+only schedule reports (the service and the batch runner).
+"""
+
+import asyncio
+import json
+import re
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.runnables import RunnableLambda
+from langchain_core.utils.function_calling import convert_to_openai_tool
+from pydantic import Field
+
+from collection import COLLECTION_TOOLS
+from report_schema import ACTION_PRIORITIES, UPDATE_PRIORITIES
+from token_budget import count_tokens
+
+# Collected-data key -> report source name
+REPORT_SOURCES = {
+    "emails": "email",
+    "calendar_events": "calendar",
+    "slack_messages": "slack",
+}
+TITLE_FIELDS = ("subject", "title", "message")
+DATE_FIELDS = ("meeting_date", "start_time", "timestamp", "received_date")
+
+_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+_DATA_BLOCK = re.compile(r"## Data Collected\n```json\n(.*?)\n```", re.DOTALL)
+
+
+def _report_item(collected_key: str, item: Dict[str, Any]) -> Dict[str, Any]:
+    title = next((item[f] for f in TITLE_FIELDS if item.get(f)), item.get("id", ""))
+    return {
+        "id": str(item.get("id", "")),
+        "title": str(title)[:80],
+        "due_date": next((item[f] for f in DATE_FIELDS if item.get(f)), None),
+        "source": REPORT_SOURCES[collected_key],
+        "context": f"score {item.get('score', 0)}",
+    }
+
+
+def canned_report(collected: Dict[str, Any], per_bucket: int = 3) -> Dict[str, Any]:
+    """
+    Build a schema-valid report from the highest-scoring collected items.
+
+    Items are ranked by their "score" (as added by the noise filter) and
+    dealt into priority buckets in order, so the output depends only on the
+    input data.
+    """
+    ranked = {
+        key: sorted(
+            (i for i in collected.get(key) or [] if isinstance(i, dict)),
+            key=lambda item: -item.get("score", 0),
+        )
+        for key in REPORT_SOURCES
+    }
+    everything = sorted(
+        ((key, item) for key, items in ranked.items() for item in items),
+        key=lambda pair: -pair[1].get("score", 0),
+    )
+
+    action_items = {}
+    for index, priority in enumerate(ACTION_PRIORITIES):
+        picked = everything[index * per_bucket : (index + 1) * per_bucket]
+        action_items[priority] = [_report_item(key, item) for key, item in picked]
+
+    updates = {}
+    for key, source in REPORT_SOURCES.items():
+        updates[source] = {
+            priority: [
+                _report_item(key, item)
+                for item in ranked[key][index * per_bucket : (index + 1) * per_bucket]
+            ]
+            for index, priority in enumerate(UPDATE_PRIORITIES)
+        }
+
+    counts = ", ".join(f"{len(ranked[key])} {key}" for key in REPORT_SOURCES)
+    return {
+        "summary": f"While you were out: {counts}.",
+        "action_items": action_items,
+        "updates": updates,
+    }
+
+
+def _fenced(payload: Any) -> str:
+    return f"```json\n{json.dumps(payload)}\n```"
+
+
+def _tool_call(name: str, args: Dict[str, Any], call_id: str) -> Dict[str, Any]:
+    return {"name": name, "args": args, "id": call_id, "type": "tool_call"}
+
+
+class FakeChatModel(BaseChatModel):
+    """Chat model that answers the OOO prompts locally after a fixed delay"""
+
+    latency: float = 0.0
+    model_name: str = "fake-ooo"
+    temperature: float = 0.0
+    collection_window: Tuple[str, str] = ("2024-01-01", "2024-01-03")
+    # Page size asked of the listing tools; None leaves the tools' default
+    page_size: Optional[int] = 500
+    tool_names: List[str] = Field(default_factory=list)
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-ooo"
+
+    def bind_tools(self, tools, **kwargs):
+        names = [convert_to_openai_tool(tool)["function"]["name"] for tool in tools]
+        return self.model_copy(update={"tool_names": names})
+
+    def with_structured_output(self, schema, *, include_raw: bool = False, **kwargs):
+        def respond(prompt):
+            text = prompt if isinstance(prompt, str) else str(prompt)
+            report = canned_report(self._data_in(text))
+            if not include_raw:
+                return report
+            raw = self._message(text, json.dumps(report))
+            return {"raw": raw, "parsed": report, "parsing_error": None}
+
+        def invoke(prompt):
+            time.sleep(self.latency)
+            return respond(prompt)
+
+        async def ainvoke(prompt):
+            await asyncio.sleep(self.latency)
+            return respond(prompt)
+
+        return RunnableLambda(invoke, afunc=ainvoke)
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        time.sleep(self.latency)
+        return ChatResult(generations=[ChatGeneration(message=self._reply(messages))])
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+        await asyncio.sleep(self.latency)
+        return ChatResult(generations=[ChatGeneration(message=self._reply(messages))])
+
+    def _message(self, prompt: str, content: str, **kwargs) -> AIMessage:
+        input_tokens = count_tokens(prompt)
+        output_tokens = count_tokens(content)
+        return AIMessage(
+            content=content,
+            usage_metadata={
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "total_tokens": input_tokens + output_tokens,
+            },
+            **kwargs,
+        )
+
+    @staticmethod
+    def _data_in(prompt: str) -> Dict[str, Any]:
+        match = _DATA_BLOCK.search(prompt)
+        if not match:
+            return {}
+        try:
+            data = json.loads(match.group(1))
+        except json.JSONDecodeError:
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _reply(self, messages) -> AIMessage:
+        prompt = "\n".join(
+            str(m.content) for m in messages if isinstance(m, HumanMessage)
+        )
+        # Analysis prompts carry their data; only collection prompts need tools
+        data = self._data_in(prompt)
+        tool_messages = [m for m in messages if isinstance(m, ToolMessage)]
+        if self.tool_names and tool_messages:
+            follow_ups = self._follow_up_calls(messages, tool_messages)
+            if follow_ups:
+                return self._message(prompt, "", tool_calls=follow_ups)
+            return self._message(prompt, self._collected(messages, tool_messages))
+        if self.tool_names and not data:
+            return self._message(prompt, "", tool_calls=self._tool_calls(prompt))
+
+        report = canned_report(data)
+        if "concise Out-of-Office (OOO) summaries" in prompt:
+            return self._message(prompt, _fenced({"summary": report["summary"]}))
+        if "extracts and categorizes action items" in prompt:
+            payload = {"action_items": report["action_items"]}
+            return self._message(prompt, _fenced(payload))
+        if "categorize items by priority" in prompt:
+            return self._message(prompt, _fenced({"updates": report["updates"]}))
+        return self._message(prompt, _fenced(report))
+
+    def _tool_calls(self, prompt: str) -> List[Dict[str, Any]]:
+        dates = _DATE.findall(prompt)
+        start_date, end_date = dates[:2] if len(dates) >= 2 else self.collection_window
+        calls = []
+        for _, tool_name in COLLECTION_TOOLS.values():
+            if tool_name in self.tool_names:
+                args = {
+                    "start_date": start_date,
+                    "end_date": end_date,
+                    "output_format": "compact",
+                }
+                if self.page_size is not None:
+                    args["page_size"] = self.page_size
+                calls.append(_tool_call(tool_name, args, f"call_{tool_name}"))
+        return calls
+
+    @staticmethod
+    def _follow_up_calls(messages, tool_messages) -> List[Dict[str, Any]]:
+        """Calls for the next page of every result with an unfollowed cursor"""
+        calls = {}
+        for message in messages:
+            for call in getattr(message, "tool_calls", None) or []:
+                calls[call["id"]] = call
+        followed = {call["args"].get("cursor") for call in calls.values()}
+
+        follow_ups = []
+        for message in tool_messages:
+            call = calls.get(message.tool_call_id)
+            try:
+                cursor = json.loads(message.content).get("next_cursor")
+            except (AttributeError, TypeError, json.JSONDecodeError):
+                continue
+            if call is None or not cursor or cursor in followed:
+                continue
+            followed.add(cursor)
+            call_id = f"call_{call['name']}_{len(calls) + len(follow_ups)}"
+            args = {**call["args"], "cursor": cursor}
+            follow_ups.append(_tool_call(call["name"], args, call_id))
+        return follow_ups
+
+    def _collected(self, messages, tool_messages) -> str:
+        called = {}
+        for message in messages:
+            for call in getattr(message, "tool_calls", None) or []:
+                called[call["id"]] = call["name"]
+        keys = {tool: key for key, (_, tool) in COLLECTION_TOOLS.items()}
+
+        collected: Dict[str, Optional[List[Any]]] = {key: [] for key in keys.values()}
+        for message in tool_messages:
+            key = keys.get(called.get(message.tool_call_id))
+            if key is None:
+                continue
+            try:
+                page = json.loads(message.content)
+            except (TypeError, json.JSONDecodeError):
+                continue
+            collected[key].extend(page.get("items", []))
+        return _fenced(collected)
+
+
+class FakeAgent:
+    """
+    Report agent stand-in that records session use, calls and concurrency.
+
+    Reports whose start date is in fail_on raise instead of returning a
+    canned report.
+    """
+
+    def __init__(self, fail_on=(), latency: float = 0.01):
+        self.fail_on = set(fail_on)
+        self.latency = latency
+        self.sessions_open = False
+        # "open", "report" and "close" in the order they happened
+        self.events: List[str] = []
+        self.calls: List[Dict[str, Any]] = []
+        self.running = 0
+        self.max_running = 0
+
+    async def open_sessions(self):
+        self.sessions_open = True
+        self.events.append("open")
+
+    async def close_sessions(self):
+        self.sessions_open = False
+        self.events.append("close")
+
+    async def generate_report(self, start, end, output_path, emit_stdout, user):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.running -= 1
+        self.events.append("report")
+        self.calls.append(
+            {
+                "start": start,
+                "end": end,
+                "user": user,
+                "output_path": output_path,
+                "emit_stdout": emit_stdout,
+            }
+        )
+        if start in self.fail_on:
+            raise RuntimeError(f"report for {start} failed")
+        return {"summary": f"{start}..{end}", "action_items": {}, "updates": {}}
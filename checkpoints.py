@@ -0,0 +1,284 @@
+"""
+Checkpoints for incremental report generation
+
+When an OOO period is extended or a report is regenerated mid-absence, most
+of the window has already been analyzed. A checkpoint records, per user and
+period start, how far each source has been processed and the report built
+so far. A rerun analyzes only the items it has not processed and merges the
+result into the previous report.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+DEFAULT_CHECKPOINT_PATH = os.getenv("OOO_CHECKPOINT_PATH", ".cache/checkpoints.db")
+
+# Collected-data key -> the date column its tool filters and orders by
+DATE_FIELDS = {
+    "emails": "received_date",
+    "calendar_events": "start_time",
+    "slack_messages": "timestamp",
+}
+
+
+# Sources whose date is when the item arrived. A later run can fetch them
+# from the checkpoint date onwards; calendar events can be added at any time
+# with a start_time already behind it, so they are always fetched in full.
+ARRIVAL_SOURCES = ("emails", "slack_messages")
+
+
+class Checkpoint(NamedTuple):
+    last_seen: Dict[str, str]
+    end_date: str
+    report: Dict[str, Any]
+    # Source -> keys of the processed items a rerun will still fetch
+    seen_ids: Dict[str, List[str]] = {}
+
+
+def item_key(item: Dict[str, Any]) -> str:
+    """Identify an item across runs, by its id when it has one"""
+    return item.get("id") or json.dumps(item, sort_keys=True)
+
+
+def collection_since(last_seen: Dict[str, str]) -> Dict[str, str]:
+    """Per-source start dates that are safe to push down to collection"""
+    return {
+        source: last_seen[source] for source in ARRIVAL_SOURCES if source in last_seen
+    }
+
+
+def new_items(
+    collected: Dict[str, Any],
+    last_seen: Dict[str, str],
+    seen_ids: Optional[Dict[str, List[str]]] = None,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Keep only items the checkpoint has not processed.
+
+    Items of an arrival-dated source dated before its checkpoint date were
+    all processed. From that date on, and for calendar events at any date,
+    an item is new unless its key is in seen_ids, so items sharing the
+    checkpoint timestamp or added behind it are not lost.
+    """
+    seen_ids = seen_ids or {}
+    fresh = {}
+    for source, field in DATE_FIELDS.items():
+        cutoff = last_seen.get(source) if source in ARRIVAL_SOURCES else None
+        seen = set(seen_ids.get(source) or ())
+        fresh[source] = [
+            item
+            for item in collected.get(source) or []
+            if (cutoff is None or str(item.get(field) or "") >= cutoff)
+            and item_key(item) not in seen
+        ]
+    return fresh
+
+
+def processed_items(
+    fresh: Dict[str, Any], pending_ids: Optional[Dict[str, List[str]]] = None
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    The items of fresh that a run has dealt with.
+
+    Noise dropped by the scoring prefilter counts as processed: the filter is
+    deterministic and would drop it again. Only the ids in pending_ids (items
+    cut to fit the token budget) are left for a rerun.
+    """
+    pending_ids = pending_ids or {}
+    processed = {}
+    for source in DATE_FIELDS:
+        pending = set(pending_ids.get(source) or ())
+        processed[source] = [
+            item for item in fresh.get(source) or [] if item.get("id") not in pending
+        ]
+    return processed
+
+
+def advance(
+    last_seen: Dict[str, str],
+    seen_ids: Dict[str, List[str]],
+    collected: Dict[str, Any],
+    processed: Dict[str, Any],
+) -> Tuple[Dict[str, str], Dict[str, List[str]]]:
+    """
+    Record the processed items in the checkpoint.
+
+    An arrival-dated source's date moves up to its oldest collected item
+    that is still unprocessed (or its newest item once all are processed),
+    and seen_ids keeps the keys of processed items from that date on.
+    Calendar events keep the keys of every processed event still collected.
+
+    Args:
+        last_seen: Per-source checkpoint dates
+        seen_ids: Per-source keys already processed
+        collected: Everything this run collected, before new_items
+        processed: The items this run processed
+
+    Returns:
+        Tuple of (last_seen, seen_ids) for the next run
+    """
+    advanced = dict(last_seen)
+    advanced_ids = {}
+    for source, field in DATE_FIELDS.items():
+        done = set(seen_ids.get(source) or ())
+        done.update(item_key(item) for item in processed.get(source) or [])
+        items = collected.get(source) or []
+
+        if source in ARRIVAL_SOURCES:
+            cutoff = last_seen.get(source, "")
+            dated = [
+                (str(item.get(field) or ""), item)
+                for item in items
+                if str(item.get(field) or "") >= cutoff
+            ]
+            pending = [date for date, item in dated if item_key(item) not in done]
+            dates = pending or [date for date, _ in dated]
+            if dates:
+                cutoff = min(pending) if pending else max(dates)
+                advanced[source] = cutoff
+            items = [item for date, item in dated if date >= cutoff]
+        else:
+            advanced.pop(source, None)
+
+        advanced_ids[source] = sorted({item_key(item) for item in items} & done)
+    return advanced, advanced_ids
+
+
+def count_items(collected: Dict[str, Any]) -> int:
+    return sum(len(collected.get(source) or []) for source in DATE_FIELDS)
+
+
+def _merge_buckets(
+    previous: Dict[str, List[Dict[str, Any]]], new: Dict[str, List[Dict[str, Any]]]
+) -> Dict[str, List[Dict[str, Any]]]:
+    # An item re-triaged in the new report moves to its new priority
+    new_ids = {
+        item.get("id") for items in new.values() for item in items if item.get("id")
+    }
+    merged = {
+        priority: [item for item in items if item.get("id") not in new_ids]
+        for priority, items in previous.items()
+    }
+    for priority, items in new.items():
+        merged.setdefault(priority, []).extend(items)
+    return merged
+
+
+def merge_reports(previous: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Merge a report over new items into the previous report.
+
+    Action items and updates are merged by id, with the new report winning.
+    The summary comes from the new report, which was written with the
+    previous summary in view.
+    """
+    merged = {
+        "summary": new.get("summary") or previous.get("summary", ""),
+        "action_items": _merge_buckets(
+            previous.get("action_items", {}), new.get("action_items", {})
+        ),
+        "updates": {},
+    }
+
+    previous_updates = previous.get("updates", {})
+    new_updates = new.get("updates", {})
+    for source in list(previous_updates) + [
+        source for source in new_updates if source not in previous_updates
+    ]:
+        merged["updates"][source] = _merge_buckets(
+            previous_updates.get(source, {}), new_updates.get(source, {})
+        )
+    return merged
+
+
+class CheckpointStore:
+    """SQLite-backed checkpoints keyed by user and period start date"""
+
+    def __init__(self, path: str = DEFAULT_CHECKPOINT_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS checkpoints (
+                user TEXT NOT NULL,
+                start_date TEXT NOT NULL,
+                end_date TEXT NOT NULL,
+                last_seen TEXT NOT NULL,
+                report TEXT NOT NULL,
+                updated_at REAL NOT NULL,
+                seen_ids TEXT NOT NULL DEFAULT '{}',
+                PRIMARY KEY (user, start_date)
+            )
+            """
+        )
+        columns = [
+            row[1] for row in self._conn.execute("PRAGMA table_info(checkpoints)")
+        ]
+        if "seen_ids" not in columns:
+            # Checkpoints written before processed ids were recorded
+            self._conn.execute(
+                "ALTER TABLE checkpoints ADD COLUMN seen_ids TEXT NOT NULL DEFAULT '{}'"
+            )
+        self._conn.commit()
+
+    def load(self, user: str, start_date: str) -> Optional[Checkpoint]:
+        """Return the checkpoint for this user and period, if any"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT last_seen, end_date, report, seen_ids FROM checkpoints "
+                "WHERE user = ? AND start_date = ?",
+                (user, start_date),
+            ).fetchone()
+        if row is None:
+            return None
+        return Checkpoint(
+            json.loads(row[0]), row[1], json.loads(row[2]), json.loads(row[3])
+        )
+
+    def save(
+        self,
+        user: str,
+        start_date: str,
+        end_date: str,
+        last_seen: Dict[str, str],
+        report: Dict[str, Any],
+        seen_ids: Optional[Dict[str, List[str]]] = None,
+    ) -> None:
+        """Record the processed items and report for this user and period"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO checkpoints "
+                "(user, start_date, end_date, last_seen, report, updated_at, seen_ids) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    user,
+                    start_date,
+                    end_date,
+                    json.dumps(last_seen),
+                    json.dumps(report),
+                    time.time(),
+                    json.dumps(seen_ids or {}),
+                ),
+            )
+            self._conn.commit()
+
+    def delete(self, user: str, start_date: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM checkpoints WHERE user = ? AND start_date = ?",
+                (user, start_date),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,125 @@
+"""
+Direct data collection from the MCP servers
+
+The agentic path asks the LLM to discover and call tools one at a time,
+which costs a model round-trip per tool call just to fetch rows. Direct
+collection calls the three listing tools concurrently over the client's
+sessions, follows their cursors, and assembles the same
+{emails, calendar_events, slack_messages} document without the LLM.
+"""
+
+import asyncio
+import json
+import time
+from typing import Any, Dict, List, Optional
+
+from progress import emit
+
+# Collected-data key -> (MCP server name, tool name)
+COLLECTION_TOOLS = {
+    "emails": ("email", "get_emails"),
+    "calendar_events": ("calendar", "get_events"),
+    "slack_messages": ("slack", "get_messages"),
+}
+
+# Largest page the servers accept; fewer pages means fewer round-trips
+COLLECTION_PAGE_SIZE = 500
+COLLECTION_FORMAT = "compact"
+
+
+def _result_text(result: Any) -> str:
+    return "".join(getattr(block, "text", "") for block in result.content)
+
+
+async def call_tool_pages(
+    client: Any,
+    server_name: str,
+    tool_name: str,
+    arguments: Dict[str, Any],
+    page_size: int = COLLECTION_PAGE_SIZE,
+) -> List[Dict[str, Any]]:
+    """
+    Call a paged tool until its cursor is exhausted.
+
+    Args:
+        client: MCPClient with an active session for ``server_name``
+        server_name: Server name from the MCP config
+        tool_name: Tool to call
+        arguments: Tool arguments other than paging and format
+
+    Returns:
+        All items across pages
+
+    Raises:
+        RuntimeError: If the tool reports an error
+    """
+    connector = client.get_session(server_name).connector
+    items: List[Dict[str, Any]] = []
+    cursor: Optional[str] = None
+
+    while True:
+        page_arguments = {
+            **arguments,
+            "page_size": page_size,
+            "output_format": COLLECTION_FORMAT,
+        }
+        if cursor:
+            page_arguments["cursor"] = cursor
+
+        emit("tool_call_started", tool=tool_name, server=server_name)
+        started = time.perf_counter()
+        result = await connector.call_tool(tool_name, page_arguments)
+        text = _result_text(result)
+        if result.isError:
+            emit("tool_call_finished", tool=tool_name, server=server_name, error=text)
+            raise RuntimeError(f"{server_name}.{tool_name} failed: {text}")
+
+        page = json.loads(text)
+        items.extend(page["items"])
+        emit(
+            "tool_call_finished",
+            tool=tool_name,
+            server=server_name,
+            seconds=round(time.perf_counter() - started, 3),
+            rows=len(page["items"]),
+        )
+        cursor = page.get("next_cursor")
+        if not cursor:
+            return items
+
+
+async def collect_data(
+    client: Any,
+    start_date: str,
+    end_date: str,
+    since: Optional[Dict[str, str]] = None,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Fetch emails, calendar events and Slack messages concurrently.
+
+    Args:
+        client: MCPClient whose sessions are already created
+        start_date: Start of the OOO period (YYYY-MM-DD)
+        end_date: End of the OOO period (YYYY-MM-DD)
+        since: Optional per-source start overriding start_date, used to
+            fetch only items at or after a checkpoint
+
+    Returns:
+        Collected data keyed like the data collection prompt's output
+    """
+    since = since or {}
+    results = await asyncio.gather(
+        *(
+            call_tool_pages(
+                client,
+                server_name,
+                tool_name,
+                {
+                    "start_date": max(start_date, since.get(source, start_date)),
+                    "end_date": end_date,
+                },
+            )
+            for source, (server_name, tool_name) in COLLECTION_TOOLS.items()
+        )
+    )
+    return dict(zip(COLLECTION_TOOLS, results))
@@ -0,0 +1,6 @@
+"""
+Seed data, the synthetic data generator and the bulk loader they share
+
+The scripts here are run directly (python data/seed_data_test1.py); the
+package import is for benchmarks and tests.
+"""
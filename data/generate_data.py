@@ -0,0 +1,592 @@
+#!/usr/bin/env python3
+"""
+Synthetic OOO data generator
+
+The seed scripts hold a few hundred hand-written rows. This script generates
+emails, calendar events and Slack messages in bulk for any date range, with
+the same table schemas, so the servers and benchmarks can be exercised at
+millions of rows. Output is deterministic for a given --seed.
+
+Each source mixes important items with noise at --noise-ratio. Replies
+stay in their thread's category, so the ground-truth file written alongside
+(same important_ids / noise_ids layout as tests/test_data/*.json) labels
+every row. The labels are defined by these signals only:
+
+- Emails: important ones address the OOO user by name and carry
+  "Priority: high"; noise is informational and carries "Priority: low"
+- Events: important ones list the OOO user as an attendee and carry
+  "Priority: high". Events otherwise never overlap, and every conflict is
+  an important event starting with the one before it
+- Slack: important messages @-mention the OOO user (is_mention), some in
+  a DM channel; noise is channel chatter
+
+Senders, event types and wording come from the same neutral pools for both
+labels and avoid scoring.py's keywords and key senders, so a benchmark
+against the ground truth does not just check the scorer against itself.
+Slack mentions and DMs are the only signals the scorer also weighs.
+
+Rows go through bulk_loader in one transaction per database. On a fresh
+file the servers' migrations build the indexes and full-text search once at
+startup; appending to a migrated database defers and rebuilds them instead.
+
+Databases are written to data/generated by default, away from the seeded
+data/databases, and the servers read them with OOO_DATA_DIR. --fresh
+refuses to delete the seeded databases, and appending rows whose --prefix
+is already in a database stops with an error rather than a UNIQUE failure
+halfway through.
+
+Usage:
+    python data/generate_data.py --start 2024-03-01 --days 14 \\
+        --emails-per-day 200 --events-per-day 20 --messages-per-day 800 \\
+        --truth data/generated/truth.json [--fresh]
+    OOO_DATA_DIR=data/generated python main.py --start 2024-03-01 ...
+"""
+
+import argparse
+import json
+import os
+import random
+from collections import deque
+from datetime import date, timedelta
+import sqlite3
+from typing import Dict, Iterator, NamedTuple, Optional
+
+try:
+    from .bulk_loader import (
+        EMAIL_COLUMNS,
+        EVENT_COLUMNS,
+        MESSAGE_COLUMNS,
+        LoadStats,
+        bulk_insert,
+    )
+except ImportError:  # Running as a script: python data/generate_data.py
+    from bulk_loader import (
+        EMAIL_COLUMNS,
+        EVENT_COLUMNS,
+        MESSAGE_COLUMNS,
+        LoadStats,
+        bulk_insert,
+    )
+
+OUTPUT_DIR = "data/generated"
+# Written by the seed scripts and used by the tests and app; never deleted here
+SEEDED_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "databases")
+RECENT_THREADS = 200
+# main.DEFAULT_USER, whose mentions and invitations mark important items
+OOO_USER = "john.doe"
+PRIORITY = {True: "Priority: high", False: "Priority: low"}
+# Events are laid out from 08:00 in 15 minute slots, one cell per event
+FIRST_SLOT = 8 * 4
+DAY_SLOTS = 15 * 4
+
+SCHEMAS = {
+    "emails": """
+        CREATE TABLE IF NOT EXISTS emails (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            custom_id TEXT UNIQUE,
+            sender TEXT NOT NULL,
+            subject TEXT NOT NULL,
+            body TEXT NOT NULL,
+            received_date TEXT NOT NULL,
+            is_read BOOLEAN DEFAULT 0,
+            thread_id TEXT,
+            meeting_date TEXT,
+            meeting_duration INTEGER,
+            attendees TEXT
+        )
+    """,
+    "events": """
+        CREATE TABLE IF NOT EXISTS events (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            custom_id TEXT UNIQUE,
+            title TEXT NOT NULL,
+            description TEXT,
+            start_time TEXT NOT NULL,
+            end_time TEXT NOT NULL,
+            location TEXT,
+            attendees TEXT,
+            event_type TEXT DEFAULT 'meeting',
+            is_all_day BOOLEAN DEFAULT 0,
+            reminder_set BOOLEAN DEFAULT 1,
+            project_name TEXT
+        )
+    """,
+    "messages": """
+        CREATE TABLE IF NOT EXISTS messages (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            custom_id TEXT UNIQUE,
+            channel TEXT NOT NULL,
+            user TEXT NOT NULL,
+            message TEXT NOT NULL,
+            timestamp TEXT NOT NULL,
+            is_mention BOOLEAN DEFAULT 0,
+            thread_id TEXT
+        )
+    """,
+}
+
+COLUMNS = {
+    "emails": EMAIL_COLUMNS,
+    "events": EVENT_COLUMNS,
+    "messages": MESSAGE_COLUMNS,
+}
+
+# Ground-truth key, database file, table, custom_id stem
+SOURCES = (
+    ("emails", "emails.db", "emails", "email"),
+    ("calendar_events", "calendar.db", "events", "event"),
+    ("slack_messages", "slack.db", "messages", "slack"),
+)
+
+SYSTEMS = ("payments API", "auth service", "search cluster", "billing DB", "CDN")
+PROJECTS = ("Atlas", "Beacon", "Comet", "Delta", "Ember", "Falcon", "Glacier")
+EVENT_TYPES = ("meeting", "review", "planning")
+
+IMPORTANT_EMAILS = (
+    (
+        "{project} rollout plan needs your approval",
+        "Hi {user}, please approve the {project} rollout plan by {day}.",
+    ),
+    (
+        "Decision needed on {system} capacity",
+        "Hi {user}, we need your call on {system} capacity before {day}.",
+    ),
+    (
+        "{project} budget sign-off",
+        "Hi {user}, finance is waiting on your sign-off for {project}.",
+    ),
+    (
+        "Review requested: {project} design",
+        "Hi {user}, you are the required reviewer for the {project} design.",
+    ),
+    (
+        "Owner for the {system} migration",
+        "Hi {user}, can you confirm you own the {system} migration?",
+    ),
+)
+NOISE_EMAILS = (
+    ("{project} weekly digest #{n}", "Notes and links from the {project} channel."),
+    ("FYI: {system} dashboard refreshed", "The {system} dashboard shows last week."),
+    ("Minutes from the {project} sync", "Minutes are in the shared folder."),
+    ("Office update for {day}", "The third floor printers are replaced on {day}."),
+    ("{project} retro notes", "Thanks all, retro notes are posted in the wiki."),
+)
+IMPORTANT_EVENTS = (
+    ("{project} go/no-go", "{user} decides whether {project} ships."),
+    ("{system} capacity plan", "{user} to approve the {system} capacity plan."),
+    ("{project} budget", "{user} presents the {project} budget."),
+)
+NOISE_EVENTS = (
+    ("{project} demo", "Optional demo of the latest {project} build."),
+    ("Open office hours", "Drop in with questions, optional."),
+    ("{system} brown bag", "Optional talk on how the {system} works."),
+    ("{project} retro", "Optional retro for the {project} team."),
+)
+IMPORTANT_MESSAGES = (
+    "@{user} can you approve the {project} rollout plan by {day}?",
+    "@{user} we need your call on {system} capacity before {day}",
+    "@{user} please review the {project} design, you are the required reviewer",
+)
+NOISE_MESSAGES = (
+    "Shipped the {project} dashboard update",
+    "Notes from the {project} sync are in the doc",
+    "{system} graphs look normal today",
+    "Thanks for the {project} demo!",
+    "Heading out at 4pm today",
+)
+
+
+class Config(NamedTuple):
+    start: date
+    days: int
+    users: int
+    emails_per_day: int
+    events_per_day: int
+    messages_per_day: int
+    noise_ratio: float
+    thread_depth: int
+    channels: int
+    conflict_density: float
+    seed: int
+    prefix: str
+
+
+def _below(rng: random.Random, n: int) -> int:
+    # Several times faster than randrange, which dominates at millions of rows
+    return int(rng.random() * n)
+
+
+def _pick(rng: random.Random, options):
+    return options[int(rng.random() * len(options))]
+
+
+def _timestamp(day: str, rng: random.Random) -> str:
+    seconds = _below(rng, 86400)
+    return f"{day} {seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+
+
+def _days(config: Config) -> Iterator[str]:
+    for offset in range(config.days):
+        yield (config.start + timedelta(days=offset)).isoformat()
+
+
+def _fill(template: str, rng: random.Random, day: str, n: int, user: str) -> str:
+    return template.format(
+        system=_pick(rng, SYSTEMS),
+        project=_pick(rng, PROJECTS),
+        day=day,
+        n=n,
+        user=user,
+    )
+
+
+def _reply_to(config: Config, rng: random.Random, recent: deque):
+    """
+    Pick a recent thread to continue, or None to start a new one.
+
+    Threads are lists of [thread_id, important, depth, payload]; replies
+    inherit the thread's importance and stop at --thread-depth.
+    """
+    if recent and rng.random() < 1 - 1 / config.thread_depth:
+        thread = _pick(rng, recent)
+        if thread[2] < config.thread_depth:
+            thread[2] += 1
+            return thread
+    return None
+
+
+def generate_emails(config: Config, rng: random.Random, flags: bytearray):
+    """Yield email rows, recording 1 (important) or 0 (noise) per row in flags"""
+    recent = deque(maxlen=RECENT_THREADS)
+    n = 0
+    for day in _days(config):
+        for _ in range(config.emails_per_day):
+            n += 1
+            thread = _reply_to(config, rng, recent)
+            if thread is None:
+                important = rng.random() >= config.noise_ratio
+                subject, body = _pick(
+                    rng, IMPORTANT_EMAILS if important else NOISE_EMAILS
+                )
+                payload = (
+                    _fill(subject, rng, day, n, OOO_USER),
+                    _fill(body, rng, day, n, OOO_USER),
+                )
+                thread = [f"{config.prefix}thread_{n}", important, 1, payload]
+                recent.append(thread)
+                is_reply = False
+            else:
+                is_reply = True
+            thread_id, important, _, (subject, body) = thread
+
+            sender = f"user{_below(rng, config.users)}@company.com"
+
+            meeting_date = meeting_duration = attendees = None
+            if important and rng.random() < 0.2:
+                meeting_date = _timestamp(day, rng)
+                meeting_duration = _pick(rng, (30, 60, 90))
+                attendees = f"{sender},{OOO_USER}@company.com"
+
+            flags.append(important)
+            yield (
+                f"{config.prefix}email_{n:09d}",
+                sender,
+                f"Re: {subject}" if is_reply else subject,
+                f"{body}\n\n{PRIORITY[important]}",
+                _timestamp(day, rng),
+                0,
+                thread_id,
+                meeting_date,
+                meeting_duration,
+                attendees,
+            )
+
+
+def generate_events(config: Config, rng: random.Random, flags: bytearray):
+    """
+    Yield event rows, each day's laid out in consecutive cells so that only
+    deliberate conflicts overlap. --conflict-density of all events (at most
+    the important share) are important events starting with the previous one.
+    """
+    per_day = max(1, config.events_per_day)
+    # Past DAY_SLOTS events a day the cells wrap and overlap by chance too
+    cell = max(1, DAY_SLOTS // per_day)
+    important_share = 1 - config.noise_ratio
+    conflict_rate = (
+        min(1.0, config.conflict_density / important_share)
+        if important_share > 0
+        else 0.0
+    )
+    n = 0
+    for day in _days(config):
+        previous_start = None
+        for index in range(config.events_per_day):
+            n += 1
+            important = rng.random() >= config.noise_ratio
+            title, description = _pick(
+                rng, IMPORTANT_EVENTS if important else NOISE_EVENTS
+            )
+
+            slot = FIRST_SLOT + index * cell % DAY_SLOTS
+            if (
+                important
+                and previous_start is not None
+                and rng.random() < conflict_rate
+            ):
+                slot = previous_start
+            previous_start = slot
+            end_slot = slot + 1 + _below(rng, cell)
+
+            attendees = f"user{_below(rng, config.users)}@company.com"
+            if important:
+                attendees = f"{OOO_USER}@company.com,{attendees}"
+
+            flags.append(important)
+            yield (
+                f"{config.prefix}event_{n:09d}",
+                _fill(title, rng, day, n, OOO_USER),
+                f"{_fill(description, rng, day, n, OOO_USER)}\n{PRIORITY[important]}",
+                f"{day} {slot // 4:02d}:{slot % 4 * 15:02d}:00",
+                f"{day} {end_slot // 4:02d}:{end_slot % 4 * 15:02d}:00",
+                f"Room {1 + _below(rng, 20)}",
+                attendees,
+                _pick(rng, EVENT_TYPES),
+                _pick(rng, PROJECTS),
+            )
+
+
+def generate_messages(config: Config, rng: random.Random, flags: bytearray):
+    """Yield Slack message rows spread over --channels channels plus DMs"""
+    recent = deque(maxlen=RECENT_THREADS)
+    channels = [f"#team-{i}" for i in range(config.channels)]
+    n = 0
+    for day in _days(config):
+        for _ in range(config.messages_per_day):
+            n += 1
+            thread = _reply_to(config, rng, recent)
+            if thread is None:
+                important = rng.random() >= config.noise_ratio
+                if important and rng.random() < 0.3:
+                    channel = f"D{_below(rng, config.users):06d}"
+                else:
+                    channel = _pick(rng, channels)
+                thread = [f"{config.prefix}ts_{n}", important, 1, channel]
+                recent.append(thread)
+            thread_id, important, _, channel = thread
+            template = _pick(rng, IMPORTANT_MESSAGES if important else NOISE_MESSAGES)
+
+            flags.append(important)
+            yield (
+                f"{config.prefix}slack_{n:09d}",
+                channel,
+                f"user{_below(rng, config.users)}",
+                _fill(template, rng, day, n, OOO_USER),
+                _timestamp(day, rng),
+                1 if important else 0,
+                thread_id,
+            )
+
+
+GENERATORS = {
+    "emails": generate_emails,
+    "events": generate_events,
+    "messages": generate_messages,
+}
+
+
+def write_ground_truth(path: str, config: Config, flags_by_source) -> None:
+    """
+    Write important_ids / noise_ids for every generated row.
+
+    Ids are streamed from the per-row flags rather than held as strings, so
+    the file can cover millions of rows.
+    """
+    end = config.start + timedelta(days=config.days - 1)
+    header = {
+        "test_case": "generated",
+        "description": (
+            f"Synthetic {config.days}-day OOO period generated with seed {config.seed}"
+        ),
+        "date_range": {"start": config.start.isoformat(), "end": end.isoformat()},
+        "parameters": {
+            key: value.isoformat() if isinstance(value, date) else value
+            for key, value in config._asdict().items()
+        },
+    }
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(json.dumps(header, indent=2)[:-2])
+        for label, wanted in (("important_ids", 1), ("noise_ids", 0)):
+            f.write(f',\n  "{label}": {{')
+            for index, (key, _, _, stem) in enumerate(SOURCES):
+                f.write(f'{"," if index else ""}\n    "{key}": [')
+                first = True
+                for n, flag in enumerate(flags_by_source[key], start=1):
+                    if flag == wanted:
+                        f.write(
+                            f'{"" if first else ", "}"{config.prefix}{stem}_{n:09d}"'
+                        )
+                        first = False
+                f.write("]")
+            f.write("\n  }")
+        f.write("\n}\n")
+
+
+def _is_seeded_dir(path: str) -> bool:
+    """Whether path is the seeded data/databases, from any working directory"""
+    return (
+        os.path.isdir(path)
+        and os.path.isdir(SEEDED_DIR)
+        and os.path.samefile(path, SEEDED_DIR)
+    )
+
+
+def _has_prefix(db_path: str, table: str, id_prefix: str) -> bool:
+    """Whether the table already holds a custom_id starting with id_prefix"""
+    if not os.path.exists(db_path):
+        return False
+    conn = sqlite3.connect(db_path)
+    try:
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+        ).fetchone()
+        if not exists:
+            return False
+        # A range on the UNIQUE custom_id index; LIKE would treat "_" as a wildcard
+        return (
+            conn.execute(
+                f"SELECT 1 FROM {table} WHERE custom_id >= ? AND custom_id < ? LIMIT 1",
+                (id_prefix, id_prefix + "\U0010ffff"),
+            ).fetchone()
+            is not None
+        )
+    finally:
+        conn.close()
+
+
+def generate(
+    config: Config,
+    output_dir: str = OUTPUT_DIR,
+    fresh: bool = False,
+    truth: Optional[str] = None,
+) -> Dict[str, LoadStats]:
+    """
+    Generate and load every source, and optionally write the ground truth.
+
+    Args:
+        config: Generation parameters
+        output_dir: Directory for emails.db, calendar.db and slack.db
+        fresh: Delete the database files in output_dir first
+        truth: Where to write the ground-truth JSON, if anywhere
+
+    Returns:
+        LoadStats per table
+
+    Raises:
+        ValueError: If fresh targets the seeded databases, or a database
+            already holds rows with this prefix
+    """
+    if fresh and _is_seeded_dir(output_dir):
+        raise ValueError(
+            f"--fresh would delete the seeded databases in {SEEDED_DIR}; "
+            "choose another --output-dir"
+        )
+
+    paths = {
+        table: os.path.join(output_dir, filename) for _, filename, table, _ in SOURCES
+    }
+    if not fresh:
+        for _, _, table, stem in SOURCES:
+            if _has_prefix(paths[table], table, f"{config.prefix}{stem}_"):
+                raise ValueError(
+                    f"{paths[table]} already has {table} with prefix "
+                    f"{config.prefix!r}; pass --fresh or a different --prefix"
+                )
+
+    os.makedirs(output_dir, exist_ok=True)
+    flags_by_source = {}
+    stats = {}
+    for key, _, table, _ in SOURCES:
+        if fresh and os.path.exists(paths[table]):
+            os.remove(paths[table])
+
+        # One generator per source, so each source is reproducible on its own
+        rng = random.Random(f"{config.seed}:{table}")
+        flags = flags_by_source[key] = bytearray()
+        stats[table] = bulk_insert(
+            paths[table],
+            table,
+            COLUMNS[table],
+            GENERATORS[table](config, rng, flags),
+            batch_size=None,
+            create_sql=SCHEMAS[table],
+            or_ignore=False,
+        )
+
+    if truth:
+        write_ground_truth(truth, config, flags_by_source)
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic OOO data")
+    parser.add_argument("--start", default="2024-03-01", help="First day (YYYY-MM-DD)")
+    parser.add_argument("--days", type=int, default=14)
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--emails-per-day", type=int, default=200)
+    parser.add_argument("--events-per-day", type=int, default=20)
+    parser.add_argument("--messages-per-day", type=int, default=800)
+    parser.add_argument(
+        "--noise-ratio", type=float, default=0.8, help="Share of noise items"
+    )
+    parser.add_argument(
+        "--thread-depth", type=int, default=4, help="Most items in one thread"
+    )
+    parser.add_argument("--channels", type=int, default=10)
+    parser.add_argument(
+        "--conflict-density",
+        type=float,
+        default=0.1,
+        help="Share of events overlapping the previous one, all important",
+    )
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument(
+        "--prefix", default="gen_", help="custom_id prefix, to keep runs apart"
+    )
+    parser.add_argument("--output-dir", default=OUTPUT_DIR)
+    parser.add_argument("--truth", help="Where to write the ground-truth JSON")
+    parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help=f"Delete existing database files first (never those in {SEEDED_DIR})",
+    )
+    args = parser.parse_args()
+
+    config = Config(
+        start=date.fromisoformat(args.start),
+        days=args.days,
+        users=max(1, args.users),
+        emails_per_day=args.emails_per_day,
+        events_per_day=args.events_per_day,
+        messages_per_day=args.messages_per_day,
+        noise_ratio=args.noise_ratio,
+        thread_depth=max(1, args.thread_depth),
+        channels=max(1, args.channels),
+        conflict_density=args.conflict_density,
+        seed=args.seed,
+        prefix=args.prefix,
+    )
+
+    try:
+        stats = generate(config, args.output_dir, args.fresh, args.truth)
+    except ValueError as e:
+        parser.error(str(e))
+    for table_stats in stats.values():
+        print(table_stats)
+    if args.truth:
+        print(f"📝 Ground truth written to {args.truth}")
+
+
+if __name__ == "__main__":
+    main()
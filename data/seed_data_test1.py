@@ -6,6 +6,8 @@ This script creates mock data for a 3-day OOO period with realistic scenarios.
 import sqlite3
 import os
 
+from bulk_loader import EMAIL_COLUMNS, EVENT_COLUMNS, MESSAGE_COLUMNS, bulk_insert
+
 
 def create_email_database():
     """Create and populate email database for test case 1"""
@@ -131,12 +133,14 @@ def create_email_database():
         },
     ]
 
-    for email in emails:
-        cursor.execute(
-            """
-            INSERT OR IGNORE INTO emails (custom_id, sender, subject, body, received_date, is_read, thread_id, meeting_date, meeting_duration, attendees)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
+    conn.commit()
+    conn.close()
+
+    return bulk_insert(
+        "data/databases/emails.db",
+        "emails",
+        EMAIL_COLUMNS,
+        (
             (
                 email["id"],
                 email["sender"],
@@ -148,11 +152,10 @@ def create_email_database():
                 email.get("meeting_date"),
                 email.get("meeting_duration"),
                 email.get("attendees"),
-            ),
-        )
-
-    conn.commit()
-    conn.close()
+            )
+            for email in emails
+        ),
+    )
 
 
 def create_calendar_database():
@@ -288,12 +291,14 @@ def create_calendar_database():
         },
     ]
 
-    for event in events:
-        cursor.execute(
-            """
-            INSERT OR IGNORE INTO events (custom_id, title, description, start_time, end_time, location, attendees, event_type, project_name)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
+    conn.commit()
+    conn.close()
+
+    return bulk_insert(
+        "data/databases/calendar.db",
+        "events",
+        EVENT_COLUMNS,
+        (
             (
                 event["id"],
                 event["title"],
@@ -304,11 +309,10 @@ def create_calendar_database():
                 event.get("attendees"),
                 event["event_type"],
                 event.get("project_name"),
-            ),
-        )
-
-    conn.commit()
-    conn.close()
+            )
+            for event in events
+        ),
+    )
 
 
 def create_slack_database():
@@ -432,12 +436,14 @@ def create_slack_database():
         },
     ]
 
-    for message in messages:
-        cursor.execute(
-            """
-            INSERT OR IGNORE INTO messages (custom_id, channel, user, message, timestamp, is_mention, thread_id)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """,
+    conn.commit()
+    conn.close()
+
+    return bulk_insert(
+        "data/databases/slack.db",
+        "messages",
+        MESSAGE_COLUMNS,
+        (
             (
                 message["id"],
                 message["channel"],
@@ -446,11 +452,10 @@ def create_slack_database():
                 message["timestamp"],
                 message["is_mention"],
                 message["thread_id"],
-            ),
-        )
-
-    conn.commit()
-    conn.close()
+            )
+            for message in messages
+        ),
+    )
 
 
 def main():
@@ -459,9 +464,12 @@ def main():
     # Create databases directory if it doesn't exist
     os.makedirs("data/databases", exist_ok=True)
 
-    create_email_database()
-    create_calendar_database()
-    create_slack_database()
+    for stats in (
+        create_email_database(),
+        create_calendar_database(),
+        create_slack_database(),
+    ):
+        print(stats)
 
 
 if __name__ == "__main__":
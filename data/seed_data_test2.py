@@ -1,6 +1,8 @@
 import sqlite3
 import os
 
+from bulk_loader import EMAIL_COLUMNS, MESSAGE_COLUMNS, bulk_insert
+
 os.makedirs("data/databases", exist_ok=True)
 
 
@@ -276,15 +278,17 @@ def create_email_database():
         ),
     ]
 
-    # Insert all emails (use OR IGNORE to avoid conflicts when appending)
-    cursor.executemany(
-        "INSERT OR IGNORE INTO emails (custom_id, sender, subject, body, received_date, is_read, thread_id, meeting_date, meeting_duration, attendees) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
-        important_emails + noise_emails,
-    )
-
     conn.commit()
     conn.close()
 
+    # OR IGNORE skips rows already present when appending
+    return bulk_insert(
+        "data/databases/emails.db",
+        "emails",
+        EMAIL_COLUMNS,
+        important_emails + noise_emails,
+    )
+
 
 def create_calendar_database():
     """Create and populate calendar database for Test Case 2"""
@@ -580,16 +584,29 @@ def create_calendar_database():
         ),
     ]
 
-    # Insert all events (use OR IGNORE to avoid conflicts when appending)
-    # Note: id is auto-increment, so we don't specify it
-    cursor.executemany(
-        "INSERT OR IGNORE INTO events (custom_id, title, description, start_time, end_time, location, attendees, event_type, is_all_day, reminder_set, project_name) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
-        important_events + noise_events,
-    )
-
     conn.commit()
     conn.close()
 
+    # OR IGNORE skips rows already present when appending
+    return bulk_insert(
+        "data/databases/calendar.db",
+        "events",
+        (
+            "custom_id",
+            "title",
+            "description",
+            "start_time",
+            "end_time",
+            "location",
+            "attendees",
+            "event_type",
+            "is_all_day",
+            "reminder_set",
+            "project_name",
+        ),
+        important_events + noise_events,
+    )
+
 
 def create_slack_database():
     """Create and populate Slack database for Test Case 2"""
@@ -833,23 +850,24 @@ def create_slack_database():
         ),
     ]
 
-    # Insert all messages (use OR IGNORE to avoid conflicts when appending)
-    # Note: id is auto-increment, so we don't specify it
-    cursor.executemany(
-        "INSERT OR IGNORE INTO messages (custom_id, channel, user, message, timestamp, is_mention, thread_id) VALUES (?, ?, ?, ?, ?, ?, ?)",
-        important_messages,
-    )
-
     conn.commit()
     conn.close()
 
+    # OR IGNORE skips rows already present when appending
+    return bulk_insert(
+        "data/databases/slack.db", "messages", MESSAGE_COLUMNS, important_messages
+    )
+
 
 def main():
     """Main function to create all databases for Test Case 2"""
 
-    create_email_database()
-    create_calendar_database()
-    create_slack_database()
+    for stats in (
+        create_email_database(),
+        create_calendar_database(),
+        create_slack_database(),
+    ):
+        print(stats)
 
 
 if __name__ == "__main__":
@@ -7,6 +7,8 @@ Q1 planning, security issues, and system maintenance scenarios.
 import sqlite3
 import os
 
+from bulk_loader import EMAIL_COLUMNS, EVENT_COLUMNS, MESSAGE_COLUMNS, bulk_insert
+
 os.makedirs("data/databases", exist_ok=True)
 
 
@@ -712,29 +714,16 @@ def create_email_database():
         ),
     ]
 
-    # Insert important emails
-    for email in important_emails:
-        cursor.execute(
-            """
-            INSERT OR IGNORE INTO emails (custom_id, sender, subject, body, received_date, is_read, thread_id, meeting_date, meeting_duration, attendees)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            email,
-        )
-
-    # Insert noise emails
-    for email in noise_emails:
-        cursor.execute(
-            """
-            INSERT OR IGNORE INTO emails (custom_id, sender, subject, body, received_date, is_read, thread_id, meeting_date, meeting_duration, attendees)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            email,
-        )
-
     conn.commit()
     conn.close()
 
+    return bulk_insert(
+        "data/databases/emails.db",
+        "emails",
+        EMAIL_COLUMNS,
+        important_emails + noise_emails,
+    )
+
 
 def create_calendar_database():
     """Create and populate calendar database for Test Case 3"""
@@ -1237,29 +1226,16 @@ def create_calendar_database():
         ),
     ]
 
-    # Insert important events
-    for event in important_events:
-        cursor.execute(
-            """
-            INSERT OR IGNORE INTO events (custom_id, title, description, start_time, end_time, location, attendees, event_type, project_name)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            event,
-        )
-
-    # Insert noise events
-    for event in noise_events:
-        cursor.execute(
-            """
-            INSERT OR IGNORE INTO events (custom_id, title, description, start_time, end_time, location, attendees, event_type, project_name)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            event,
-        )
-
     conn.commit()
     conn.close()
 
+    return bulk_insert(
+        "data/databases/calendar.db",
+        "events",
+        EVENT_COLUMNS,
+        important_events + noise_events,
+    )
+
 
 def create_slack_database():
     """Create and populate Slack database for Test Case 3"""
@@ -1967,36 +1943,26 @@ def create_slack_database():
         ),
     ]
 
-    # Insert important messages
-    for message in important_messages:
-        cursor.execute(
-            """
-            INSERT OR IGNORE INTO messages (custom_id, channel, user, message, timestamp, is_mention, thread_id)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """,
-            message,
-        )
-
-    # Insert noise messages
-    for message in noise_messages:
-        cursor.execute(
-            """
-            INSERT OR IGNORE INTO messages (custom_id, channel, user, message, timestamp, is_mention, thread_id)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """,
-            message,
-        )
-
     conn.commit()
     conn.close()
 
+    return bulk_insert(
+        "data/databases/slack.db",
+        "messages",
+        MESSAGE_COLUMNS,
+        important_messages + noise_messages,
+    )
+
 
 def main():
     """Create all databases for Test Case 3"""
 
-    create_email_database()
-    create_calendar_database()
-    create_slack_database()
+    for stats in (
+        create_email_database(),
+        create_calendar_database(),
+        create_slack_database(),
+    ):
+        print(stats)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,106 @@
+"""
+In-process MCP transport for the bundled FastMCP servers
+
+The stdio transport launches every server as `python mcp_servers/<name>.py`,
+so each session pays interpreter startup, the fastmcp import and JSON-RPC
+framing over pipes. This module mounts FastMCP server objects in the
+current process instead: the MCP client and server talk over anyio memory
+streams, and the server runs as a task on the same event loop.
+
+The connector plugs into mcp_use, so MCPAgent, direct collection and
+open/close_sessions work unchanged.
+"""
+
+from typing import Any, Dict
+
+from fastmcp.client.transports import FastMCPTransport
+from mcp import ClientSession
+from mcp_use import MCPClient
+from mcp_use.connectors.base import BaseConnector
+from mcp_use.session import MCPSession
+from mcp_use.task_managers.base import ConnectionManager
+
+
+class InProcessConnectionManager(ConnectionManager[ClientSession]):
+    """Runs a FastMCP server and its client session on memory streams"""
+
+    def __init__(self, server: Any):
+        super().__init__()
+        # fastmcp's own in-memory transport, rather than reaching into the
+        # server's private low-level instance
+        self.transport = FastMCPTransport(server)
+        self._session_ctx = None
+
+    async def _establish_connection(self) -> ClientSession:
+        # Entered here, in the manager's own task, and exited in
+        # _close_connection from the same task. anyio cancel scopes must be
+        # exited by the task that entered them, and sessions are closed in
+        # whatever order the client chooses.
+        self._session_ctx = self.transport.connect_session()
+        try:
+            return await self._session_ctx.__aenter__()
+        except BaseException:
+            self._session_ctx = None
+            raise
+
+    async def _close_connection(self) -> None:
+        if self._session_ctx is not None:
+            session_ctx, self._session_ctx = self._session_ctx, None
+            await session_ctx.__aexit__(None, None, None)
+
+
+class InProcessConnector(BaseConnector):
+    """mcp_use connector for a FastMCP server object in this process"""
+
+    def __init__(self, name: str, server: Any):
+        super().__init__()
+        self.name = name
+        self.server = server
+
+    async def connect(self) -> None:
+        if self._connected:
+            return
+        try:
+            self._connection_manager = InProcessConnectionManager(self.server)
+            self.client_session = await self._connection_manager.start()
+            self._connected = True
+        except Exception:
+            await self._cleanup_resources()
+            raise
+
+    async def _cleanup_resources(self) -> None:
+        # The connection manager's task owns the session and closes it
+        self.client_session = None
+        await super()._cleanup_resources()
+
+    @property
+    def public_identifier(self) -> Dict[str, str]:
+        return {"type": "inprocess", "server": self.name}
+
+
+class InProcessMCPClient(MCPClient):
+    """
+    MCPClient whose sessions connect to FastMCP servers in this process.
+
+    Args:
+        servers: Server name -> FastMCP instance; names play the role of the
+            "mcpServers" keys in a stdio config
+    """
+
+    def __init__(self, servers: Dict[str, Any]):
+        super().__init__(config={"mcpServers": {name: {} for name in servers}})
+        self.servers = servers
+
+    async def create_session(
+        self, server_name: str, auto_initialize: bool = True
+    ) -> MCPSession:
+        if server_name not in self.servers:
+            raise ValueError(f"Server '{server_name}' not found in config")
+
+        session = MCPSession(InProcessConnector(server_name, self.servers[server_name]))
+        if auto_initialize:
+            await session.initialize()
+        self.sessions[server_name] = session
+        if server_name not in self.active_sessions:
+            self.active_sessions.append(server_name)
+        return session
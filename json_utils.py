@@ -0,0 +1,124 @@
+"""
+JSON extraction from LLM output
+
+Model responses wrap their JSON in markdown fences, lead with prose, or
+trail off into explanations. extract_json() finds the JSON object in one
+forward scan: it tries json.JSONDecoder.raw_decode at each "{" that can
+start an object, stops at the end of the first complete one (ignoring
+whatever follows), and after a failed attempt resumes from where decoding
+failed instead of from the next character. Braces inside a malformed object
+are fragments of it, not separate answers, so skipping them keeps the scan
+linear in the length of the output.
+
+Each candidate is decoded from a slice that starts small and grows only
+while the decoder runs off its end. A JSONDecodeError counts the lines up
+to the failure from the start of the string it was given, so decoding the
+whole output at every candidate would make a long run of false starts
+quadratic.
+
+An object inside a ```json (or bare ```) fence wins over one in the
+surrounding prose, so an inline example before the real answer is not
+mistaken for it.
+"""
+
+import json
+import re
+from typing import Any, Optional, Tuple
+
+_DECODER = json.JSONDecoder()
+# "{" followed by a key or "}"; anything else cannot start an object
+_CANDIDATE = re.compile(r'\{\s*["}]')
+FENCE = "```"
+INITIAL_WINDOW = 256  # characters decoded before growing the slice
+# A literal cut by the slice (e.g. "-Infinity") fails this close to its end
+_CUT_MARGIN = 9
+
+
+def _decode_at(text: str, begin: int) -> Tuple[Optional[Any], int]:
+    """
+    Decode the object starting at begin.
+
+    Returns:
+        (object, 0) on success, otherwise (None, position to resume from)
+    """
+    window = INITIAL_WINDOW
+    while True:
+        chunk = text[begin : begin + window]
+        try:
+            return _DECODER.raw_decode(chunk)[0], 0
+        except json.JSONDecodeError as e:
+            cut = begin + window < len(text) and (
+                e.pos > len(chunk) - _CUT_MARGIN
+                # Reported at the string's opening quote, not where it was cut
+                or e.msg.startswith("Unterminated string")
+            )
+            if not cut:
+                return None, begin + max(e.pos, 1)
+        except RecursionError:
+            # Nesting deeper than the decoder allows. Every brace opened
+            # before the first closing one is an inner layer of that nest,
+            # not a separate answer, so skip past them all
+            close = text.find("}", begin)
+            return None, len(text) if close < 0 else close
+        window *= 4
+
+
+def _scan(text: str, start: int) -> Optional[Any]:
+    """First complete JSON object at or after start, or None"""
+    pos = start
+    while True:
+        match = _CANDIDATE.search(text, pos)
+        if match is None:
+            return None
+        value, pos = _decode_at(text, match.start())
+        if value is not None:
+            return value
+
+
+def _fenced_start(text: str) -> int:
+    """Where the first fenced block's body starts, or -1 without one"""
+    fence = text.find(FENCE)
+    if fence < 0:
+        return -1
+    # Skip the info string ("json") on the opening fence line
+    newline = text.find("\n", fence + len(FENCE))
+    return fence + len(FENCE) if newline < 0 else newline + 1
+
+
+def find_json(text: Optional[str], default: Any = None) -> Any:
+    """
+    Find the JSON object in a model response.
+
+    Args:
+        text: Model output, possibly fenced or surrounded by prose
+        default: Returned when the text holds no complete JSON object
+
+    Returns:
+        The parsed object, or default
+    """
+    if not text:
+        return default
+
+    start = _fenced_start(text)
+    if start >= 0:
+        value = _scan(text, start)
+        if value is not None:
+            return value
+    value = _scan(text, 0)
+    return default if value is None else value
+
+
+def extract_json(text: str) -> Any:
+    """
+    Parse the JSON object in a model response.
+
+    Raises:
+        TypeError: If text is not a string
+        json.JSONDecodeError: If the text holds no complete JSON object
+    """
+    if not isinstance(text, str):
+        raise TypeError(f"expected str, got {type(text).__name__}")
+    value = find_json(text)
+    if value is None:
+        raise json.JSONDecodeError("No JSON object found", text, 0)
+    return value
@@ -9,13 +9,38 @@ discover and use tools dynamically, rather than hardcoding tool calls.
 import asyncio
 import json
 import os
+import sys
+import time
 import warnings
 import logging
 from datetime import datetime
+from typing import Optional
 from dotenv import load_dotenv
-from langchain_openai import ChatOpenAI
 
-from mcp_utils import get_mcp_agent, get_mcp_client
+from checkpoints import (
+    CheckpointStore,
+    advance,
+    collection_since,
+    count_items,
+    merge_reports,
+    new_items,
+    processed_items,
+)
+from collection import collect_data
+from json_utils import extract_json
+from llm_cache import ResponseCache, make_key
+from mapreduce import (
+    DEFAULT_CHUNK_TOKENS,
+    DEFAULT_MAP_CONCURRENCY,
+    pack_chunks,
+    reduce_reports,
+)
+from mcp_utils import DEFAULT_MCP_TRANSPORT, get_mcp_agent, get_mcp_client
+from progress import emit, reporting
+from report_schema import REPORT_SCHEMA, validate_report
+from scoring import filter_collected_data
+from streaming import PartialReport, PriorityItemParser
+from token_budget import DEFAULT_PROMPT_TOKEN_BUDGET, pack_items, template_tokens
 
 load_dotenv()
 
@@ -25,170 +50,804 @@ warnings.filterwarnings("ignore", message=".*Event loop is closed.*")
 warnings.filterwarnings("ignore", message=".*Exception ignored.*")
 logging.getLogger("mcp_use").setLevel(logging.ERROR)
 
+COLLECTION_MODES = ("agentic", "direct")
+DEFAULT_COLLECTION_MODE = os.getenv("OOO_COLLECTION_MODE", "agentic")
+ANALYSIS_MODES = ("multi", "single", "mapreduce")
+DEFAULT_ANALYSIS_MODE = os.getenv("OOO_ANALYSIS_MODE", "multi")
+DEFAULT_MODEL = os.getenv("OOO_MODEL", "gpt-4o-mini")
+DEFAULT_TEMPERATURE = 0.1
+USE_LLM_CACHE = os.getenv("OOO_LLM_CACHE", "1") != "0"
+DEFAULT_USER = os.getenv("OOO_USER", "john.doe")
+
+# Prompt templates each analysis mode sends alongside the data
+ANALYSIS_PROMPTS = {
+    "multi": (
+        "prompts/summary_prompt.txt",
+        "prompts/action_items_prompt.txt",
+        "prompts/priority_analysis_prompt.txt",
+    ),
+    "single": ("prompts/report_prompt.txt",),
+    "mapreduce": (
+        "prompts/summary_prompt.txt",
+        "prompts/action_items_prompt.txt",
+        "prompts/priority_analysis_prompt.txt",
+    ),
+}
+
+
+def is_json_response(text):
+    """Whether a model response contains parseable JSON"""
+    try:
+        extract_json(text)
+    except (TypeError, json.JSONDecodeError):
+        return False
+    return True
+
+
+def parse_collected(data_result):
+    """Parse collected data into a dict, or return the text if it is not one"""
+    try:
+        data = extract_json(data_result)
+    except (TypeError, json.JSONDecodeError):
+        return data_result
+    return data if isinstance(data, dict) else data_result
+
+
+def emit_section(name, result):
+    """Emit a report section as a progress event once a response has it"""
+    try:
+        data = extract_json(result)
+    except (TypeError, json.JSONDecodeError):
+        return
+    if isinstance(data, dict) and name in data:
+        emit("section", name=name, data=data[name])
+
+
+def previous_summary_section(previous_summary):
+    """Prompt section asking the model to extend an earlier summary"""
+    if not previous_summary:
+        return ""
+    return (
+        "\n\n## Previous Summary\n"
+        "The data above only contains items that arrived after this summary was "
+        "written. Return a summary that covers both.\n"
+        f"{previous_summary}"
+    )
+
+
+def prefilter_data(data_result):
+    """
+    Score collected data and drop obvious noise before prompting.
+
+    Returns the filtered data as JSON, or the input unchanged if it is not
+    the expected JSON object.
+    """
+    data = parse_collected(data_result)
+    if not isinstance(data, dict):
+        return data_result
+
+    filtered, dropped = filter_collected_data(data)
+    print(f"🧹 Dropped {sum(dropped.values())} noise items before analysis")
+    emit("items_filtered", dropped=dropped)
+    return json.dumps(filtered, separators=(",", ":"), ensure_ascii=False)
+
 
 class OOOSummarizerAgent:
-    def __init__(self):
-        api_key = os.getenv("OPENAI_API_KEY")
-        base_url = os.getenv("OPENAI_API_BASE")
-        if not api_key:
+    def __init__(
+        self,
+        collection_mode: str = DEFAULT_COLLECTION_MODE,
+        analysis_mode: str = DEFAULT_ANALYSIS_MODE,
+        use_cache: bool = USE_LLM_CACHE,
+        incremental: bool = False,
+        user: str = DEFAULT_USER,
+        chunk_tokens: int = DEFAULT_CHUNK_TOKENS,
+        map_concurrency: int = DEFAULT_MAP_CONCURRENCY,
+        token_budget: int = DEFAULT_PROMPT_TOKEN_BUDGET,
+        mcp_transport: str = DEFAULT_MCP_TRANSPORT,
+        stream: bool = False,
+        llm=None,
+    ):
+        if collection_mode not in COLLECTION_MODES:
+            raise ValueError(
+                f"Unsupported collection_mode {collection_mode!r}; "
+                f"expected one of {COLLECTION_MODES}"
+            )
+        if analysis_mode not in ANALYSIS_MODES:
+            raise ValueError(
+                f"Unsupported analysis_mode {analysis_mode!r}; "
+                f"expected one of {ANALYSIS_MODES}"
+            )
+        self.collection_mode = collection_mode
+        self.analysis_mode = analysis_mode
+
+        self.api_key = os.getenv("OPENAI_API_KEY")
+        self.base_url = os.getenv("OPENAI_API_BASE")
+        if llm is None and not self.api_key:
             raise ValueError("OPENAI_API_KEY environment variable is not set")
+        # A caller-supplied chat model (e.g. a local stand-in) replaces ChatOpenAI
+        self.model = getattr(llm, "model_name", DEFAULT_MODEL)
+        self.temperature = getattr(llm, "temperature", DEFAULT_TEMPERATURE)
+        self._llm = llm
+        self._agent = None
+
+        self.mcp_client = get_mcp_client(mcp_transport)
+        self.cache = ResponseCache() if use_cache else None
+        self.checkpoints = CheckpointStore() if incremental else None
+        self.user = user
+        self.chunk_tokens = chunk_tokens
+        self.map_concurrency = map_concurrency
+        self.token_budget = token_budget
+        self.stream = stream
+
+    @property
+    def llm(self):
+        """Chat model, built on first use"""
+        # langchain_openai and the openai SDK are slow to import; loading them
+        # here lets direct collection reach its first tool call (and cached
+        # reports finish) without them
+        if self._llm is None:
+            from langchain_openai import ChatOpenAI
+
+            self._llm = ChatOpenAI(
+                api_key=self.api_key,
+                model=self.model,
+                temperature=self.temperature,
+                base_url=self.base_url,
+                # Token counts for streamed responses arrive in the last chunk
+                stream_usage=self.stream,
+            )
+        return self._llm
+
+    @property
+    def agent(self):
+        """MCP agent driving the LLM over the client's sessions, built on first use"""
+        if self._agent is None:
+            self._agent = get_mcp_agent(self.llm, self.mcp_client)
+        return self._agent
+
+    def cache_key(self, template: str, data_result: str) -> str:
+        return make_key(self.model, self.temperature, template, data_result)
+
+    async def stream_run(self, prompt: str, partial: PartialReport) -> str:
+        """
+        Stream a prompt's response from the chat model, recording each urgent
+        item in partial as soon as it is complete.
+
+        Analysis prompts carry their data, so no tools (and no agent) are needed.
+        """
+        parser = PriorityItemParser()
+        parts = []
+        async for chunk in self.llm.astream(prompt):
+            text = chunk.content if isinstance(chunk.content, str) else ""
+            parts.append(text)
+            partial.feed(parser, text)
+        return "".join(parts)
+
+    async def cached_run(
+        self,
+        template: str,
+        data_result: str,
+        prompt: str,
+        partial: Optional[PartialReport] = None,
+    ) -> str:
+        """
+        Run a prompt through the agent, reusing a cached response if present.
+
+        With partial, the response is streamed instead (see stream_run).
+        """
+
+        async def run():
+            if partial is None:
+                return await self.agent.run(prompt)
+            return await self.stream_run(prompt, partial)
+
+        if self.cache is None:
+            return await run()
+
+        key = self.cache_key(template, data_result)
+        cached = self.cache.get(key)
+        if cached is not None:
+            emit("llm_cache_hit")
+            if partial is not None:
+                partial.feed(PriorityItemParser(), cached)
+            return cached
+
+        result = await run()
+        # Only keep responses the report parser can use
+        if is_json_response(result):
+            self.cache.set(key, result)
+        return result
+
+    async def collect_data_agentic(self, start_date: str, end_date: str) -> str:
+        """Let the LLM discover and use tools to collect data"""
+        with open("prompts/data_collection_prompt.txt", "r") as f:
+            data_collection_prompt = f.read()
+
+        # Replace placeholders manually to avoid conflicts with JSON braces
+        data_collection_prompt = data_collection_prompt.replace(
+            "{{ start_date }}", start_date
+        )
+        data_collection_prompt = data_collection_prompt.replace(
+            "{{ end_date }}", end_date
+        )
+        return await self.agent.run(data_collection_prompt)
+
+    def budget_data(self, data_result: str):
+        """
+        Fit collected data into the prompt token budget.
+
+        Map-reduce chunks the data itself, so in that mode long fields are
+        truncated but no items are dropped.
+
+        Returns:
+            Tuple of (data JSON, budget metadata or None if the data is not
+            a JSON object)
+        """
+        collected = parse_collected(data_result)
+        if not isinstance(collected, dict):
+            return data_result, None
+
+        budget = None
+        if self.analysis_mode != "mapreduce":
+            prompts = ANALYSIS_PROMPTS[self.analysis_mode]
+            budget = max(0, self.token_budget - template_tokens(*prompts))
+        packed = pack_items(collected, budget)
+
+        dropped = sum(len(ids) for ids in packed.dropped.values())
+        if dropped:
+            print(f"✂️ Dropped {dropped} lowest-scoring items to fit the token budget")
+        metadata = {
+            "budget": budget,
+            "data_tokens": packed.tokens,
+            "truncated_fields": packed.truncated_fields,
+            "dropped": packed.dropped,
+        }
+        data_result = json.dumps(packed.data, separators=(",", ":"), ensure_ascii=False)
+        return data_result, metadata
+
+    async def run_prompt(
+        self,
+        prompt_path: str,
+        data_result: str,
+        context: str = "",
+        partial: Optional[PartialReport] = None,
+    ) -> str:
+        """Run an analysis prompt over the collected data, with caching"""
+        with open(prompt_path, "r") as f:
+            template = f.read()
+        prompt = (
+            f"{template}\n\n## Data Collected\n```json\n{data_result}\n```{context}"
+        )
+        return await self.cached_run(template, data_result + context, prompt, partial)
+
+    async def analyze_multi(
+        self,
+        data_result: str,
+        previous_summary=None,
+        partial: Optional[PartialReport] = None,
+    ) -> dict:
+        """
+        Run the summary, action item and priority prompts as three calls.
+
+        With partial, the action item and priority responses are streamed and
+        their urgent items recorded there as they arrive.
+        """
+
+        async def generate_summary():
+            result = await self.run_prompt(
+                "prompts/summary_prompt.txt",
+                data_result,
+                previous_summary_section(previous_summary),
+            )
+            emit_section("summary", result)
+            return result
+
+        async def extract_action_items():
+            result = await self.run_prompt(
+                "prompts/action_items_prompt.txt", data_result, partial=partial
+            )
+            emit_section("action_items", result)
+            return result
+
+        async def analyze_priorities():
+            result = await self.run_prompt(
+                "prompts/priority_analysis_prompt.txt", data_result, partial=partial
+            )
+            emit_section("updates", result)
+            return result
+
+        # Run all three LLM calls in parallel
+        print("🚀 Running summary, action items, and priority analysis in parallel...")
+        summary_result, action_items_result, priority_result = await asyncio.gather(
+            generate_summary(), extract_action_items(), analyze_priorities()
+        )
+        print("✅ All LLM calls completed in parallel")
+
+        # Parse results - extract JSON from markdown code blocks if present
+        try:
+            summary_data = extract_json(summary_result)
+            action_items_data = extract_json(action_items_result)
+            priority_data = extract_json(priority_result)
+
+            # Create final report
+            report = {
+                "summary": summary_data.get("summary", ""),
+                "action_items": action_items_data.get("action_items", {}),
+                "updates": priority_data.get("updates", {}),
+            }
+
+        except json.JSONDecodeError as e:
+            print(f"⚠️ JSON parsing error: {e}")
+            # Fallback report structure
+            report = {
+                "summary": summary_result,
+                "action_items": {"P0": [], "P1": [], "P2": []},
+                "updates": {
+                    "email": {"P0": [], "P1": []},
+                    "calendar": {"P0": [], "P1": []},
+                    "slack": {"P0": [], "P1": []},
+                },
+            }
+
+        return report
+
+    async def analyze_single(self, data_result: str, previous_summary=None):
+        """
+        Ask for the whole report in one structured-output call.
+
+        Returns:
+            The validated report, or None if the call or validation failed
+        """
+        with open("prompts/report_prompt.txt", "r") as f:
+            template = f.read()
+        context = previous_summary_section(previous_summary)
+        report_prompt = (
+            f"{template}\n\n## Data Collected\n```json\n{data_result}\n```{context}"
+        )
+
+        # The schema is part of the request, so it is part of the key
+        key = self.cache_key(
+            template + json.dumps(REPORT_SCHEMA), data_result + context
+        )
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                emit("llm_cache_hit")
+                return json.loads(cached)
+
+        structured_llm = self.llm.with_structured_output(
+            REPORT_SCHEMA, method="json_schema", strict=True, include_raw=True
+        )
+        print("🚀 Running single-call report analysis...")
+        try:
+            response = await structured_llm.ainvoke(report_prompt)
+        except Exception as e:
+            print(f"⚠️ Single-call analysis failed, falling back to three calls: {e}")
+            return None
+
+        if response.get("parsing_error") is not None:
+            errors = [str(response["parsing_error"])]
+        else:
+            errors = validate_report(response.get("parsed"))
+        if errors:
+            print(
+                f"⚠️ Single-call report is invalid ({errors[0]}), "
+                "falling back to three calls"
+            )
+            return None
+
+        print("✅ Single-call analysis completed")
+        parsed = response["parsed"]
+        report = {
+            "summary": parsed["summary"],
+            "action_items": parsed["action_items"],
+            "updates": parsed["updates"],
+        }
+        for name, data in report.items():
+            emit("section", name=name, data=data)
+        if self.cache is not None:
+            self.cache.set(key, json.dumps(report))
+        return report
+
+    async def analyze_chunk(
+        self,
+        chunk: dict,
+        semaphore: asyncio.Semaphore,
+        partial: Optional[PartialReport] = None,
+    ) -> dict:
+        """Extract action items and updates from one chunk of collected data"""
+        data_result = json.dumps(chunk, separators=(",", ":"), ensure_ascii=False)
+        async with semaphore:
+            action_items_result, priority_result = await asyncio.gather(
+                self.run_prompt(
+                    "prompts/action_items_prompt.txt", data_result, partial=partial
+                ),
+                self.run_prompt(
+                    "prompts/priority_analysis_prompt.txt", data_result, partial=partial
+                ),
+            )
 
-        self.llm = ChatOpenAI(
-            api_key=api_key,
-            model="gpt-4o-mini",
-            temperature=0.1,
-            base_url=base_url,
+        chunk_result = {}
+        for key, result in (
+            ("action_items", action_items_result),
+            ("updates", priority_result),
+        ):
+            try:
+                chunk_result[key] = extract_json(result).get(key)
+            except (AttributeError, json.JSONDecodeError) as e:
+                print(f"⚠️ Skipping unparseable {key} for a chunk: {e}")
+        return chunk_result
+
+    async def analyze_mapreduce(
+        self,
+        data_result: str,
+        previous_summary=None,
+        partial: Optional[PartialReport] = None,
+    ):
+        """
+        Analyze day-based chunks concurrently, then summarize the reduced report.
+
+        With partial, each chunk's responses are streamed as in analyze_multi.
+
+        Returns:
+            The report, or None if the collected data is not a JSON object
+        """
+        collected = parse_collected(data_result)
+        if not isinstance(collected, dict):
+            return None
+
+        chunks = pack_chunks(collected, self.chunk_tokens)
+        print(
+            f"🧩 Analyzing {len(chunks)} chunks "
+            f"(up to {self.map_concurrency} at a time)..."
         )
+        semaphore = asyncio.Semaphore(self.map_concurrency)
+        chunk_results = await asyncio.gather(
+            *(self.analyze_chunk(chunk, semaphore, partial) for chunk in chunks)
+        )
+        reduced = reduce_reports(chunk_results)
+        print("✅ Chunk analysis reduced")
+        for name, data in reduced.items():
+            emit("section", name=name, data=data)
+
+        # The summary only needs what survived prioritization, not the raw data
+        summary_result = await self.run_prompt(
+            "prompts/summary_prompt.txt",
+            json.dumps(reduced, separators=(",", ":"), ensure_ascii=False),
+            "\n\nThe data above is the prioritized report extracted from all items."
+            + previous_summary_section(previous_summary),
+        )
+        try:
+            summary = extract_json(summary_result)["summary"]
+        except (KeyError, TypeError, json.JSONDecodeError):
+            summary = summary_result
+        emit("section", name="summary", data=summary)
+
+        return {"summary": summary, **reduced}
 
-        self.mcp_client = get_mcp_client()
-        self.agent = get_mcp_agent(self.llm)
+    async def open_sessions(self):
+        """Start the MCP servers so several reports can share their sessions"""
+        if not self.mcp_client.get_all_active_sessions():
+            await self.mcp_client.create_all_sessions()
+
+    async def close_sessions(self):
+        """Close MCP sessions with proper error handling"""
+        try:
+            if hasattr(self, "mcp_client") and self.mcp_client:
+                # Each stdio session enters an anyio cancel scope in this task,
+                # so they nest and must be closed newest first. Closing in
+                # creation order (close_all_sessions) leaks the outer scopes,
+                # which later cancel the next report's create_all_sessions.
+                for name in reversed(list(self.mcp_client.sessions)):
+                    await self.mcp_client.close_session(name)
+            # The agent's tools are bound to the closed sessions; rebuild it
+            # (and its conversation memory) on the next report
+            self._agent = None
+        except Exception as e:
+            # Don't print warnings for expected cleanup errors
+            if "Event loop is closed" not in str(e) and "CancelledError" not in str(e):
+                print(f"⚠️ Warning during cleanup: {e}")
 
     async def generate_report(
-        self, start_date: str = "2024-01-01", end_date: str = "2024-01-03"
+        self,
+        start_date: str = "2024-01-01",
+        end_date: str = "2024-01-03",
+        output_path: Optional[str] = None,
+        emit_stdout: bool = True,
+        user: Optional[str] = None,
     ):
-        """Generate complete OOO summary report using dynamic tool discovery"""
+        """
+        Generate complete OOO summary report using dynamic tool discovery.
+
+        Args:
+            start_date: Start of the OOO period
+            end_date: End of the OOO period
+            output_path: Where to write the report; defaults to a timestamped
+                file under reports/
+            emit_stdout: Print the report JSON as the last stdout line
+            user: User whose checkpoints to use; defaults to self.user
+
+        Sessions opened with open_sessions() are reused and left open;
+        otherwise they are created for this report and closed afterwards.
+
+        When streaming, P0 items are printed and written to output_path as
+        they arrive, and the full report replaces them at the end.
+        """
+        if output_path is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            output_path = f"reports/ooo_report_{timestamp}.json"
+
         print("🚀 Starting OOO Summarizer Agent with dynamic tool discovery...")
         print(f"📅 OOO Period: {start_date} to {end_date}")
         print()
+        emit(
+            "run_started",
+            start_date=start_date,
+            end_date=end_date,
+            collection_mode=self.collection_mode,
+            analysis_mode=self.analysis_mode,
+        )
 
+        user = user or self.user
+        owns_sessions = not self.mcp_client.get_all_active_sessions()
         try:
             # Create MCP sessions
-            await self.mcp_client.create_all_sessions()
-
-            # Let the LLM discover and use tools to collect data
-            with open("prompts/data_collection_prompt.txt", "r") as f:
-                data_collection_prompt = f.read()
-
-            # Replace placeholders manually to avoid conflicts with JSON braces
-            data_collection_prompt = data_collection_prompt.replace(
-                "{{ start_date }}", start_date
-            )
-            data_collection_prompt = data_collection_prompt.replace(
-                "{{ end_date }}", end_date
-            )
-            data_result = await self.agent.run(data_collection_prompt)
-
-            async def generate_summary():
-                with open("prompts/summary_prompt.txt", "r") as f:
-                    summary_prompt = f.read()
-                summary_prompt = f"{summary_prompt}\n\n## Data Collected\n```json\n{data_result}\n```"
-                return await self.agent.run(summary_prompt)
-
-            async def extract_action_items():
-                with open("prompts/action_items_prompt.txt", "r") as f:
-                    action_items_prompt = f.read()
-                action_items_prompt = f"{action_items_prompt}\n\n## Data Collected\n```json\n{data_result}\n```"
-                return await self.agent.run(action_items_prompt)
-
-            async def analyze_priorities():
-                with open("prompts/priority_analysis_prompt.txt", "r") as f:
-                    priority_analysis_prompt = f.read()
-                priority_analysis_prompt = f"{priority_analysis_prompt}\n\n## Data Collected\n```json\n{data_result}\n```"
-                return await self.agent.run(priority_analysis_prompt)
-
-            # Run all three LLM calls in parallel
+            if owns_sessions:
+                await self.mcp_client.create_all_sessions()
+
+            checkpoint = None
+            if self.checkpoints is not None:
+                checkpoint = self.checkpoints.load(user, start_date)
+            last_seen = checkpoint.last_seen if checkpoint else {}
+            seen_ids = checkpoint.seen_ids if checkpoint else {}
+
+            collection_start = time.perf_counter()
+            if self.collection_mode == "direct":
+                # Call the listing tools ourselves; the LLM is only used for analysis
+                collected = await collect_data(
+                    self.mcp_client,
+                    start_date,
+                    end_date,
+                    since=collection_since(last_seen),
+                )
+            else:
+                collected = parse_collected(
+                    await self.collect_data_agentic(start_date, end_date)
+                )
+            collection_seconds = time.perf_counter() - collection_start
             print(
-                "🚀 Running summary, action items, and priority analysis in parallel..."
+                f"📥 Collected data ({self.collection_mode}) in "
+                f"{collection_seconds:.2f}s"
             )
-            summary_result, action_items_result, priority_result = await asyncio.gather(
-                generate_summary(), extract_action_items(), analyze_priorities()
+            emit(
+                "collection_finished",
+                seconds=round(collection_seconds, 3),
+                items=(
+                    {key: len(value) for key, value in collected.items()}
+                    if isinstance(collected, dict)
+                    else None
+                ),
             )
-            print("✅ All LLM calls completed in parallel")
 
-            # Parse results - extract JSON from markdown code blocks if present
-            try:
-
-                def extract_json_from_markdown(text):
-                    """Extract JSON from markdown code blocks"""
-                    import re
+            # Only items the checkpoint has not processed need analysis
+            incremental = checkpoint is not None and isinstance(collected, dict)
+            fresh = collected
+            if incremental:
+                fresh = new_items(collected, last_seen, seen_ids)
+                print(f"🔁 {count_items(fresh)} new items since last checkpoint")
+
+            if isinstance(fresh, dict):
+                data_result = json.dumps(fresh, separators=(",", ":"))
+            else:
+                data_result = fresh
+
+            # Score items and drop noise so the prompts below only carry signal
+            data_result = prefilter_data(data_result)
+            data_result, budget_metadata = self.budget_data(data_result)
+            analyzed = parse_collected(data_result)
+            # Noise is dealt with once the prefilter drops it; only items cut
+            # for the token budget stay unprocessed for a rerun to offer again
+            processed = (
+                processed_items(fresh, (budget_metadata or {}).get("dropped"))
+                if isinstance(fresh, dict)
+                else None
+            )
 
-                    # Look for JSON in code blocks
-                    json_match = re.search(
-                        r"```(?:json)?\s*(\{.*?\})\s*```", text, re.DOTALL
+            cache_before = self.cache.stats() if self.cache is not None else None
+            previous_summary = checkpoint.report.get("summary") if incremental else None
+
+            if incremental and count_items(analyzed) == 0:
+                # Nothing worth analyzing arrived since the last run, so the
+                # report stands
+                report = checkpoint.report
+            else:
+                report = None
+                # Single-call reports come back as one structured object, so
+                # only the other modes stream
+                partial = PartialReport(output_path) if self.stream else None
+                if self.analysis_mode == "single":
+                    report = await self.analyze_single(data_result, previous_summary)
+                elif self.analysis_mode == "mapreduce":
+                    report = await self.analyze_mapreduce(
+                        data_result, previous_summary, partial
                     )
-                    if json_match:
-                        return json_match.group(1)
-                    # If no code blocks, try parsing the whole text
-                    return text
-
-                summary_json = extract_json_from_markdown(summary_result)
-                action_items_json = extract_json_from_markdown(action_items_result)
-                priority_json = extract_json_from_markdown(priority_result)
-
-                summary_data = json.loads(summary_json)
-                action_items_data = json.loads(action_items_json)
-                priority_data = json.loads(priority_json)
-
-                # Create final report
-                report = {
-                    "summary": summary_data.get("summary", ""),
-                    "action_items": action_items_data.get("action_items", {}),
-                    "updates": priority_data.get("updates", {}),
-                }
-
-            except json.JSONDecodeError as e:
-                print(f"⚠️ JSON parsing error: {e}")
-                # Fallback report structure
-                report = {
-                    "summary": summary_result,
-                    "action_items": {"P0": [], "P1": [], "P2": []},
-                    "updates": {
-                        "email": {"P0": [], "P1": []},
-                        "calendar": {"P0": [], "P1": []},
-                        "slack": {"P0": [], "P1": []},
-                    },
+                if report is None:
+                    report = await self.analyze_multi(
+                        data_result, previous_summary, partial
+                    )
+                if partial is not None and partial.count:
+                    print(f"⚡ Streamed {partial.count} P0 items ahead of the report")
+                if incremental:
+                    report = merge_reports(checkpoint.report, report)
+
+            if self.checkpoints is not None and isinstance(collected, dict):
+                last_seen, seen_ids = advance(last_seen, seen_ids, collected, processed)
+                self.checkpoints.save(
+                    user, start_date, end_date, last_seen, report, seen_ids
+                )
+
+            metadata = {}
+            if cache_before is not None:
+                cache_after = self.cache.stats()
+                metadata["llm_cache"] = {
+                    name: cache_after[name] - cache_before[name]
+                    for name in ("hits", "misses")
                 }
+            if budget_metadata is not None:
+                metadata["token_budget"] = budget_metadata
+            if incremental:
+                metadata["incremental"] = {"new_items": count_items(fresh)}
+            if metadata:
+                report = {**report, "metadata": metadata}
 
             # Save report
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            report_filename = f"reports/ooo_report_{timestamp}.json"
-
-            # Ensure reports directory exists
-            os.makedirs("reports", exist_ok=True)
+            # Ensure the report directory exists
+            os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
 
-            with open(report_filename, "w") as f:
+            with open(output_path, "w") as f:
                 json.dump(report, f, indent=2)
 
             # Output JSON to stdout for test suite
-            print(json.dumps(report))
+            if emit_stdout:
+                print(json.dumps(report))
+            emit("report", path=output_path, report=report)
 
             return report
 
         except Exception as e:
             print(f"❌ Error during report generation: {e}")
+            emit("error", message=str(e))
             raise
         finally:
-            # Clean up MCP sessions with proper error handling
-            try:
-                if hasattr(self, "mcp_client") and self.mcp_client:
-                    await self.mcp_client.close_all_sessions()
-            except Exception as e:
-                # Don't print warnings for expected cleanup errors
-                if "Event loop is closed" not in str(e) and "CancelledError" not in str(
-                    e
-                ):
-                    print(f"⚠️ Warning during cleanup: {e}")
+            if owns_sessions:
+                await self.close_sessions()
+
+
+def add_agent_arguments(parser):
+    """Register the command line flags that configure OOOSummarizerAgent"""
+    parser.add_argument(
+        "--direct",
+        action="store_true",
+        help="Call the MCP tools directly instead of via the LLM agent",
+    )
+    parser.add_argument(
+        "--single-call",
+        action="store_true",
+        help="Produce the report with one structured-output LLM call",
+    )
+    parser.add_argument(
+        "--map-reduce",
+        action="store_true",
+        help="Analyze the data in day-based chunks and reduce the results",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only analyze items newer than the last run for this start date",
+    )
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Mount the MCP servers in this process instead of as subprocesses",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream the analysis responses and report P0 items as they arrive",
+    )
+
+
+def agent_kwargs(args):
+    """OOOSummarizerAgent keyword arguments for parsed add_agent_arguments flags"""
+    analysis_mode = DEFAULT_ANALYSIS_MODE
+    if args.single_call:
+        analysis_mode = "single"
+    elif args.map_reduce:
+        analysis_mode = "mapreduce"
+    return {
+        "collection_mode": "direct" if args.direct else DEFAULT_COLLECTION_MODE,
+        "analysis_mode": analysis_mode,
+        "incremental": args.incremental,
+        "mcp_transport": "inprocess" if args.in_process else DEFAULT_MCP_TRANSPORT,
+        "stream": args.stream,
+    }
+
+
+def log_to_stderr():
+    """Point logging handlers that write to stdout at stderr instead"""
+    loggers = [logging.getLogger()] + [
+        logger
+        for logger in logging.Logger.manager.loggerDict.values()
+        if isinstance(logger, logging.Logger)
+    ]
+    for logger in loggers:
+        for handler in logger.handlers:
+            if isinstance(handler, logging.StreamHandler) and handler.stream in (
+                sys.stdout,
+                sys.__stdout__,
+            ):
+                handler.setStream(sys.stderr)
 
 
 async def main():
     """Main function"""
-    import sys
+    import argparse
+    import contextlib
+
+    parser = argparse.ArgumentParser(description="OOO Summarizer Agent")
+    parser.add_argument("dates", nargs="*", metavar="DATE")
+    add_agent_arguments(parser)
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Report import times and time to the first MCP tool call, then exit",
+    )
+    parser.add_argument(
+        "--progress",
+        action="store_true",
+        help="Write NDJSON progress events to stdout, ending with the report; "
+        "narration goes to stderr",
+    )
+    parser.add_argument("--startup-probe", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.profile_startup:
+        from startup_profile import profile_startup
+
+        flags = [arg for arg in sys.argv[1:] if arg != "--profile-startup"]
+        print(json.dumps(profile_startup(flags), indent=2))
+        return
 
     # Parse command line arguments for date range
     start_date = "2024-01-01"
     end_date = "2024-01-03"
 
-    if len(sys.argv) >= 3:
-        start_date = sys.argv[1]
-        end_date = sys.argv[2]
-    elif len(sys.argv) == 2:
-        print("Usage: python main.py <start_date> <end_date>")
+    if len(args.dates) == 2:
+        start_date, end_date = args.dates
+    elif args.dates:
+        print(
+            "Usage: python main.py <start_date> <end_date> "
+            "[--direct] [--single-call | --map-reduce] [--incremental] [--in-process] "
+            "[--stream] [--progress] [--profile-startup]"
+        )
         print("Example: python main.py 2024-02-01 2024-02-14")
         sys.exit(1)
 
-    agent = OOOSummarizerAgent()
+    agent = OOOSummarizerAgent(**agent_kwargs(args))
+    if args.startup_probe:
+        from startup_profile import probe_first_tool_call
+
+        await probe_first_tool_call(agent)
+        return
+
     try:
-        await agent.generate_report(start_date, end_date)
+        if args.progress:
+            # stdout carries only events; the reporter keeps the real stdout
+            log_to_stderr()
+            with reporting(sys.stdout), contextlib.redirect_stdout(sys.stderr):
+                await agent.generate_report(start_date, end_date)
+        else:
+            await agent.generate_report(start_date, end_date)
     except asyncio.CancelledError:
         # Handle cancellation gracefully
         pass
@@ -0,0 +1,132 @@
+"""
+Map-reduce helpers for long OOO windows
+
+Sending a two-week mailbox to every prompt makes the calls slow and can
+overflow the context window. Collected data is split by day, days are packed
+into chunks under a token budget, and each chunk is analyzed separately
+(map). The partial action items and updates are then combined with
+de-duplication by id (reduce), and the summary is written over the reduced
+report instead of the raw data.
+"""
+
+import json
+import os
+from typing import Any, Dict, List
+
+from token_budget import count_tokens
+
+DEFAULT_CHUNK_TOKENS = int(os.getenv("OOO_CHUNK_TOKENS", "6000"))
+DEFAULT_MAP_CONCURRENCY = int(os.getenv("OOO_MAP_CONCURRENCY", "4"))
+
+# Collected-data key -> the date field used to bucket items by day
+DAY_FIELDS = {
+    "emails": "received_date",
+    "calendar_events": "start_time",
+    "slack_messages": "timestamp",
+}
+
+PRIORITIES = ("P0", "P1", "P2")
+UPDATE_SOURCES = ("email", "calendar", "slack")
+
+
+def _empty_chunk() -> Dict[str, List[Dict[str, Any]]]:
+    return {source: [] for source in DAY_FIELDS}
+
+
+def _chunk_tokens(chunk: Dict[str, Any]) -> int:
+    return count_tokens(json.dumps(chunk, separators=(",", ":")))
+
+
+def split_by_day(collected: Dict[str, Any]) -> List[Dict[str, List[Dict[str, Any]]]]:
+    """Group items of every source by the calendar day of their date field"""
+    days: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+    for source, field in DAY_FIELDS.items():
+        for item in collected.get(source) or []:
+            day = str(item.get(field) or "")[:10]
+            days.setdefault(day, _empty_chunk())[source].append(item)
+    return [days[day] for day in sorted(days)]
+
+
+def pack_chunks(
+    collected: Dict[str, Any], max_tokens: int = DEFAULT_CHUNK_TOKENS
+) -> List[Dict[str, List[Dict[str, Any]]]]:
+    """
+    Pack consecutive days into chunks of at most ``max_tokens``.
+
+    A single day larger than the budget is split item by item; an item
+    larger than the budget on its own gets a chunk to itself.
+    """
+    chunks: List[Dict[str, List[Dict[str, Any]]]] = []
+    current = _empty_chunk()
+    current_tokens = 0
+
+    def flush():
+        nonlocal current, current_tokens
+        if current_tokens:
+            chunks.append(current)
+        current = _empty_chunk()
+        current_tokens = 0
+
+    for day in split_by_day(collected):
+        day_tokens = _chunk_tokens(day)
+        if current_tokens + day_tokens <= max_tokens:
+            for source, items in day.items():
+                current[source].extend(items)
+            current_tokens += day_tokens
+            continue
+
+        flush()
+        if day_tokens <= max_tokens:
+            current, current_tokens = day, day_tokens
+            continue
+
+        for source, items in day.items():
+            for item in items:
+                item_tokens = count_tokens(json.dumps(item, separators=(",", ":")))
+                if current_tokens and current_tokens + item_tokens > max_tokens:
+                    flush()
+                current[source].append(item)
+                current_tokens += item_tokens
+    flush()
+    return chunks
+
+
+def _reduce_buckets(
+    partials: List[Dict[str, List[Dict[str, Any]]]], priorities
+) -> Dict[str, List[Dict[str, Any]]]:
+    # Walk priorities from most to least urgent so an id keeps its highest one
+    reduced: Dict[str, List[Dict[str, Any]]] = {priority: [] for priority in priorities}
+    seen = set()
+    for priority in priorities:
+        for partial in partials:
+            for item in partial.get(priority) or []:
+                item_id = item.get("id") if isinstance(item, dict) else None
+                if item_id is not None:
+                    if item_id in seen:
+                        continue
+                    seen.add(item_id)
+                reduced[priority].append(item)
+    return reduced
+
+
+def reduce_reports(partials: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Combine per-chunk action items and updates, de-duplicating by id.
+
+    Args:
+        partials: Dicts with optional "action_items" and "updates" sections
+
+    Returns:
+        Dict with merged "action_items" and "updates"
+    """
+    action_items = _reduce_buckets(
+        [partial.get("action_items") or {} for partial in partials], PRIORITIES
+    )
+    updates = {
+        source: _reduce_buckets(
+            [(partial.get("updates") or {}).get(source) or {} for partial in partials],
+            PRIORITIES[:2],
+        )
+        for source in UPDATE_SOURCES
+    }
+    return {"action_items": action_items, "updates": updates}
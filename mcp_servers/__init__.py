@@ -7,9 +7,23 @@ This package contains multiple FastMCP servers that simulate real-world data sou
 - Slack Server: Simulates Slack workspace
 """
 
-from .email_server import mcp as email_mcp
-from .calendar_server import mcp as calendar_mcp
-from .slack_server import mcp as slack_mcp
+import importlib
+
+# Server instances are loaded on first access, so that importing a helper
+# module (e.g. ``python -m mcp_servers.migrations``) does not load fastmcp
+# and every server
+_SERVER_MODULES = {
+    "email_mcp": "email_server",
+    "calendar_mcp": "calendar_server",
+    "slack_mcp": "slack_server",
+}
+
+
+def __getattr__(name):
+    if name in _SERVER_MODULES:
+        return importlib.import_module(f".{_SERVER_MODULES[name]}", __name__).mcp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "email_mcp",
@@ -5,23 +5,62 @@ Simulates Google Calendar/Outlook calendar data for the OOO summarizer.
 Provides access to meetings, appointments, deadlines, and schedule conflicts.
 """
 
-import sqlite3
-import json
+import os
+from itertools import islice
+from typing import Optional
 from fastmcp import FastMCP
 
+try:
+    from .conflicts import find_overlaps, group_conflicts
+    from .db import DATA_DIR, get_pool
+    from .encoding import DEFAULT_FORMAT, render_page
+    from .fts import keyword_query
+    from .migrations import migrate
+    from .pagination import (
+        DEFAULT_PAGE_SIZE,
+        clamp_page_size,
+        decode_offset,
+        keyset_page,
+        offset_page,
+    )
+except ImportError:  # Running as a script: python mcp_servers/calendar_server.py
+    from conflicts import find_overlaps, group_conflicts
+    from db import DATA_DIR, get_pool
+    from encoding import DEFAULT_FORMAT, render_page
+    from fts import keyword_query
+    from migrations import migrate
+    from pagination import (
+        DEFAULT_PAGE_SIZE,
+        clamp_page_size,
+        decode_offset,
+        keyset_page,
+        offset_page,
+    )
+
 # Create FastMCP server instance
 mcp = FastMCP("calendar-server")
 
+DB_PATH = os.path.join(DATA_DIR, "calendar.db")
+
+# Long-lived read-only connections shared by all tools
+pool = get_pool(DB_PATH)
 
-@mcp.tool()
-def get_events(start_date: str, end_date: str, event_type: str = "all") -> str:
-    """Get calendar events for a specific date range"""
-    conn = sqlite3.connect("data/databases/calendar.db")
-    cursor = conn.cursor()
 
+@mcp.tool()
+def get_events(
+    start_date: str,
+    end_date: str,
+    event_type: str = "all",
+    page_size: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    output_format: str = DEFAULT_FORMAT,
+    max_chars: int = 0,
+) -> str:
+    """Get calendar events for a specific date range (pass next_cursor back for more)"""
     query = """
-    SELECT custom_id, title, description, start_time, end_time, location, attendees, event_type, is_all_day, reminder_set
-    FROM events 
+    SELECT custom_id, title, description, start_time, end_time, location, attendees, event_type, is_all_day, reminder_set,
+           start_time, id
+    FROM events
     WHERE start_time BETWEEN ? AND ?
     """
     params = [start_date, end_date]
@@ -30,107 +69,177 @@ def get_events(start_date: str, end_date: str, event_type: str = "all") -> str:
         query += " AND event_type = ?"
         params.append(event_type)
 
-    query += " ORDER BY start_time ASC"
-
-    cursor.execute(query, params)
-    events = cursor.fetchall()
-    conn.close()
-
-    result = []
-    for event in events:
-        event_data = {
-            "id": event[0],
-            "title": event[1],
-            "description": event[2],
-            "start_time": event[3],
-            "end_time": event[4],
-            "location": event[5],
-            "attendees": event[6],
-            "event_type": event[7],
-            "is_all_day": bool(event[8]),
-            "reminder_set": bool(event[9]),
-        }
-        result.append(event_data)
-
-    return json.dumps(result, indent=2)
+    with pool.connection() as conn:
+        page = keyset_page(conn, query, params, "start_time", page_size, cursor)
+        result = []
+        for event in page:
+            event_data = {
+                "id": event[0],
+                "title": event[1],
+                "description": event[2],
+                "start_time": event[3],
+                "end_time": event[4],
+                "location": event[5],
+                "attendees": event[6],
+                "event_type": event[7],
+                "is_all_day": bool(event[8]),
+                "reminder_set": bool(event[9]),
+            }
+            result.append(event_data)
+
+    return render_page(result, page.next_cursor, output_format, max_chars)
 
 
 @mcp.tool()
-def get_conflicts(start_date: str, end_date: str) -> str:
-    """Get scheduling conflicts and overlapping events"""
-    conn = sqlite3.connect("data/databases/calendar.db")
-    cursor = conn.cursor()
-
-    # Find overlapping events
+def get_conflicts(
+    start_date: str,
+    end_date: str,
+    group: bool = False,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    output_format: str = DEFAULT_FORMAT,
+    max_chars: int = 0,
+) -> str:
+    """Get scheduling conflicts and overlapping events, optionally grouped into clusters"""
     query = """
-    SELECT e1.id, e1.title, e1.start_time, e1.end_time, e2.id, e2.title, e2.start_time, e2.end_time
-    FROM events e1
-    JOIN events e2 ON e1.id != e2.id
-    WHERE e1.start_time BETWEEN ? AND ?
-    AND e2.start_time BETWEEN ? AND ?
-    AND (
-        (e1.start_time < e2.end_time AND e1.end_time > e2.start_time)
-    )
-    ORDER BY e1.start_time
+    SELECT id, custom_id, title, start_time, end_time
+    FROM events
+    WHERE start_time BETWEEN ? AND ?
+    ORDER BY start_time ASC, id ASC
     """
 
-    cursor.execute(query, [start_date, end_date, start_date, end_date])
-    conflicts = cursor.fetchall()
-    conn.close()
-
-    result = []
-    for conflict in conflicts:
-        conflict_data = {
-            "event1": {
-                "id": conflict[0],
-                "title": conflict[1],
-                "start_time": conflict[2],
-                "end_time": conflict[3],
-            },
-            "event2": {
-                "id": conflict[4],
-                "title": conflict[5],
-                "start_time": conflict[6],
-                "end_time": conflict[7],
-            },
-        }
-        result.append(conflict_data)
-
-    return json.dumps(result, indent=2)
+    # Conflicts are computed rather than stored, so they page by offset
+    page_size = clamp_page_size(page_size)
+    offset = decode_offset(cursor)
+
+    with pool.connection() as conn:
+        events = (
+            {
+                "id": row[0],
+                "custom_id": row[1],
+                "title": row[2],
+                "start_time": row[3],
+                "end_time": row[4],
+            }
+            for row in conn.execute(query, [start_date, end_date])
+        )
+
+        # Sweep over events in start order instead of self-joining the table
+        if group:
+            conflicts = iter(group_conflicts(events))
+        else:
+            conflicts = (
+                {"event1": event1, "event2": event2}
+                for event1, event2 in find_overlaps(events)
+            )
+
+        page = offset_page(
+            islice(conflicts, offset, offset + page_size + 1), page_size, offset
+        )
+        result = list(page)
+
+    return render_page(result, page.next_cursor, output_format, max_chars)
 
 
 @mcp.tool()
-def get_deadlines(start_date: str, end_date: str) -> str:
+def get_deadlines(
+    start_date: str,
+    end_date: str,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    output_format: str = DEFAULT_FORMAT,
+    max_chars: int = 0,
+) -> str:
     """Get upcoming deadlines and important dates"""
-    conn = sqlite3.connect("data/databases/calendar.db")
-    cursor = conn.cursor()
-
     query = """
-    SELECT id, title, description, start_time, end_time, project_name
-    FROM events 
+    SELECT id, title, description, start_time, end_time, project_name,
+           start_time, id
+    FROM events
     WHERE start_time BETWEEN ? AND ?
-    AND (event_type = 'deadline' OR title LIKE '%deadline%' OR title LIKE '%due%')
-    ORDER BY start_time ASC
+    AND (
+        event_type = 'deadline'
+        OR id IN (
+            SELECT rowid FROM events_fts WHERE events_fts MATCH 'title : (deadline OR due)'
+        )
+    )
     """
 
-    cursor.execute(query, [start_date, end_date])
-    deadlines = cursor.fetchall()
-    conn.close()
+    with pool.connection() as conn:
+        page = keyset_page(
+            conn, query, [start_date, end_date], "start_time", page_size, cursor
+        )
+        result = []
+        for deadline in page:
+            deadline_data = {
+                "id": deadline[0],
+                "title": deadline[1],
+                "description": deadline[2],
+                "start_time": deadline[3],
+                "end_time": deadline[4],
+                "project_name": deadline[5],
+            }
+            result.append(deadline_data)
+
+    return render_page(result, page.next_cursor, output_format, max_chars)
 
-    result = []
-    for deadline in deadlines:
-        deadline_data = {
-            "id": deadline[0],
-            "title": deadline[1],
-            "description": deadline[2],
-            "start_time": deadline[3],
-            "end_time": deadline[4],
-            "project_name": deadline[5],
-        }
-        result.append(deadline_data)
 
-    return json.dumps(result, indent=2)
+@mcp.tool()
+def search_events(
+    query: str,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    page_size: int = 20,
+    cursor: Optional[str] = None,
+    output_format: str = DEFAULT_FORMAT,
+    max_chars: int = 0,
+) -> str:
+    """Search event titles and descriptions by keyword, best matches first"""
+    match = keyword_query(query)
+    if match is None:
+        return render_page([], None, output_format, max_chars)
+
+    sql = """
+    SELECT e.custom_id, e.title, e.description, e.start_time, e.end_time, e.event_type,
+           bm25(events_fts, 2.0, 1.0) AS rank
+    FROM events_fts
+    JOIN events e ON e.id = events_fts.rowid
+    WHERE events_fts MATCH ?
+    """
+    params = [match]
+
+    if start_date:
+        sql += " AND e.start_time >= ?"
+        params.append(start_date)
+    if end_date:
+        sql += " AND e.start_time <= ?"
+        params.append(end_date)
+
+    # Relevance order has no stable keyset, so search pages by offset
+    page_size = clamp_page_size(page_size)
+    offset = decode_offset(cursor)
+    sql += " ORDER BY rank, e.id LIMIT ? OFFSET ?"
+    params.extend([page_size + 1, offset])
+
+    with pool.connection() as conn:
+        page = offset_page(conn.execute(sql, params), page_size, offset)
+        result = []
+        for event in page:
+            event_data = {
+                "id": event[0],
+                "title": event[1],
+                "description": event[2],
+                "start_time": event[3],
+                "end_time": event[4],
+                "event_type": event[5],
+                # bm25() is lower-is-better; flip it so higher means more relevant
+                "score": round(-event[6], 4),
+            }
+            result.append(event_data)
+
+    return render_page(result, page.next_cursor, output_format, max_chars)
 
 
 if __name__ == "__main__":
+    # Bring the schema (indexes) up to date before serving any queries
+    migrate(DB_PATH, "calendar")
     mcp.run()
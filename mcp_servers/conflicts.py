@@ -0,0 +1,92 @@
+"""
+Sweep-line overlap detection for calendar events
+
+Events are processed in ``start_time`` order. The currently running events
+are kept in a dict in arrival order, with a min-heap keyed by ``end_time``
+deciding which of them to evict. Every event still running when a new one
+starts overlaps it, so scanning them costs O(1) per reported pair, and each
+overlapping pair is reported exactly once in O(n log n + k) for n events and
+k conflicts.
+"""
+
+import heapq
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+Event = Dict[str, Any]
+
+
+def _overlaps(a: Event, b: Event) -> bool:
+    return a["start_time"] < b["end_time"] and a["end_time"] > b["start_time"]
+
+
+def find_overlaps(events: Iterable[Event]) -> Iterator[Tuple[Event, Event]]:
+    """
+    Yield every pair of overlapping events once.
+
+    Args:
+        events: Events with "start_time" and "end_time", sorted by start_time
+
+    Yields:
+        (earlier, later) tuples where ``earlier`` started first
+    """
+    # Running events by sequence number; dicts iterate in insertion order
+    active: Dict[int, Event] = {}
+    ends: List[Tuple[str, int]] = []
+
+    for seq, event in enumerate(events):
+        # Drop events that ended before (or exactly when) this one starts
+        while ends and ends[0][0] <= event["start_time"]:
+            del active[heapq.heappop(ends)[1]]
+
+        for other in active.values():
+            if _overlaps(other, event):
+                yield other, event
+
+        active[seq] = event
+        heapq.heappush(ends, (event["end_time"], seq))
+
+
+def group_conflicts(events: Iterable[Event]) -> List[Dict[str, Any]]:
+    """
+    Group overlapping events into conflict clusters.
+
+    A cluster is a maximal run of events connected by overlaps; events that
+    overlap nothing are not returned.
+
+    Args:
+        events: Events with "start_time" and "end_time", sorted by start_time
+
+    Returns:
+        List of {"start_time", "end_time", "events"} clusters
+    """
+    clusters = []
+    current: List[Event] = []
+    current_end = None
+
+    for event in events:
+        if current and event["start_time"] < current_end:
+            current.append(event)
+            current_end = max(current_end, event["end_time"])
+            continue
+
+        if len(current) > 1:
+            clusters.append(
+                {
+                    "start_time": current[0]["start_time"],
+                    "end_time": current_end,
+                    "events": current,
+                }
+            )
+        current = [event]
+        current_end = event["end_time"]
+
+    if len(current) > 1:
+        clusters.append(
+            {
+                "start_time": current[0]["start_time"],
+                "end_time": current_end,
+                "events": current,
+            }
+        )
+
+    return clusters
@@ -0,0 +1,160 @@
+"""
+Shared SQLite access for the FastMCP servers
+
+Each server keeps one long-lived pool of read-only connections to its
+database instead of opening a fresh connection on every tool call, so the
+file open, schema parse and page-cache warmup are paid once per process.
+"""
+
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Dict, Optional
+from urllib.request import pathname2url
+
+# Pool tuning, overridable per deployment
+DEFAULT_POOL_SIZE = int(os.getenv("OOO_DB_POOL_SIZE", "4"))
+DEFAULT_STATEMENT_CACHE = int(os.getenv("OOO_DB_STATEMENT_CACHE", "128"))
+
+# Directory holding emails.db, calendar.db and slack.db
+DATA_DIR = os.getenv("OOO_DATA_DIR", "data/databases")
+
+
+class ConnectionPool:
+    """
+    Fixed-size pool of read-only SQLite connections for one database file.
+
+    Connections are opened lazily in read-only URI mode with a per-connection
+    prepared-statement cache. If the database file is replaced on disk (for
+    example by re-running a seed script), idle connections to the old file
+    are discarded and new ones are opened against the current file.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        size: int = DEFAULT_POOL_SIZE,
+        cached_statements: int = DEFAULT_STATEMENT_CACHE,
+    ):
+        if size < 1:
+            raise ValueError("Connection pool size must be at least 1")
+
+        self.db_path = os.path.abspath(db_path)
+        self.size = size
+        self.cached_statements = cached_statements
+        self.journal_mode: Optional[str] = None
+
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._file_id = None
+
+    def _current_file_id(self):
+        try:
+            stat = os.stat(self.db_path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_dev, stat.st_ino)
+
+    def _connect(self) -> sqlite3.Connection:
+        uri = f"file:{pathname2url(self.db_path)}?mode=ro"
+        conn = sqlite3.connect(
+            uri,
+            uri=True,
+            check_same_thread=False,
+            cached_statements=self.cached_statements,
+        )
+        if self.journal_mode is None:
+            self.journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        return conn
+
+    def _discard_idle(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def _acquire(self) -> sqlite3.Connection:
+        self._slots.acquire()
+        try:
+            with self._lock:
+                file_id = self._current_file_id()
+                if file_id != self._file_id:
+                    # Database was recreated; connections to the old inode are stale
+                    self._discard_idle()
+                    self._file_id = file_id
+                    self.journal_mode = None
+                try:
+                    return self._idle.get_nowait()
+                except queue.Empty:
+                    pass
+            return self._connect()
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def _release(self, conn: sqlite3.Connection):
+        try:
+            # Never hand back a connection holding an open read transaction:
+            # in WAL mode it would pin an old snapshot and block checkpoints.
+            if conn.in_transaction:
+                conn.rollback()
+            with self._lock:
+                if self._current_file_id() == self._file_id:
+                    self._idle.put_nowait(conn)
+                    conn = None
+            if conn is not None:
+                conn.close()
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection for the duration of the ``with`` block"""
+        conn = self._acquire()
+        try:
+            yield conn
+        finally:
+            self._release(conn)
+
+    def close(self):
+        """Close all idle connections"""
+        with self._lock:
+            self._discard_idle()
+
+    def stats(self) -> Dict[str, object]:
+        """Return pool configuration and current state"""
+        return {
+            "db_path": self.db_path,
+            "size": self.size,
+            "idle": self._idle.qsize(),
+            "cached_statements": self.cached_statements,
+            "journal_mode": self.journal_mode,
+        }
+
+
+_pools: Dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_path: str, **kwargs) -> ConnectionPool:
+    """
+    Get the process-wide connection pool for a database, creating it on first use.
+
+    Args:
+        db_path: Path to the SQLite database file
+        **kwargs: Extra ConnectionPool arguments used when the pool is created
+
+    Returns:
+        Shared ConnectionPool instance for the database
+    """
+    key = os.path.abspath(db_path)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = ConnectionPool(db_path, **kwargs)
+            _pools[key] = pool
+        return pool
@@ -5,118 +5,241 @@ Simulates Gmail/Outlook email data for the OOO summarizer.
 Provides access to emails, meeting requests, and important communications.
 """
 
-import sqlite3
-import json
+import os
+from typing import Optional
 from fastmcp import FastMCP
 
+try:
+    from .db import DATA_DIR, get_pool
+    from .encoding import DEFAULT_FORMAT, render_page
+    from .fts import keyword_query
+    from .migrations import migrate
+    from .pagination import (
+        DEFAULT_PAGE_SIZE,
+        clamp_page_size,
+        decode_offset,
+        keyset_page,
+        offset_page,
+    )
+except ImportError:  # Running as a script: python mcp_servers/email_server.py
+    from db import DATA_DIR, get_pool
+    from encoding import DEFAULT_FORMAT, render_page
+    from fts import keyword_query
+    from migrations import migrate
+    from pagination import (
+        DEFAULT_PAGE_SIZE,
+        clamp_page_size,
+        decode_offset,
+        keyset_page,
+        offset_page,
+    )
+
 # Create FastMCP server instance
 mcp = FastMCP("email-server")
 
+DB_PATH = os.path.join(DATA_DIR, "emails.db")
+
+# Long-lived read-only connections shared by all tools
+pool = get_pool(DB_PATH)
+
 
 @mcp.tool()
-def get_emails(start_date: str, end_date: str, limit: int = 50) -> str:
-    """Get emails for a specific date range"""
-    conn = sqlite3.connect("data/databases/emails.db")
-    cursor = conn.cursor()
+def get_emails(
+    start_date: str,
+    end_date: str,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    output_format: str = DEFAULT_FORMAT,
+    max_chars: int = 0,
+    limit: Optional[int] = None,
+) -> str:
+    """
+    Get emails for a specific date range, newest first (pass next_cursor back for more).
 
+    limit is a deprecated alias of page_size, kept for callers written before
+    paging. It now sizes the first page instead of capping the result.
+    """
+    if limit is not None:
+        page_size = limit
     query = """
-    SELECT custom_id, sender, subject, body, received_date, is_read, thread_id
-    FROM emails 
+    SELECT custom_id, sender, subject, body, received_date, is_read, thread_id,
+           received_date, id
+    FROM emails
     WHERE received_date BETWEEN ? AND ?
-    ORDER BY received_date DESC LIMIT ?
     """
-    params = [start_date, end_date, limit]
-
-    cursor.execute(query, params)
-    emails = cursor.fetchall()
-    conn.close()
-
-    result = []
-    for email in emails:
-        email_data = {
-            "id": email[0],
-            "sender": email[1],
-            "subject": email[2],
-            "body": email[3],
-            "received_date": email[4],
-            "is_read": bool(email[5]),
-            "thread_id": email[6],
-        }
-        result.append(email_data)
-
-    return json.dumps(result, indent=2)
+    params = [start_date, end_date]
+
+    with pool.connection() as conn:
+        page = keyset_page(
+            conn, query, params, "received_date", page_size, cursor, descending=True
+        )
+        result = []
+        for email in page:
+            email_data = {
+                "id": email[0],
+                "sender": email[1],
+                "subject": email[2],
+                "body": email[3],
+                "received_date": email[4],
+                "is_read": bool(email[5]),
+                "thread_id": email[6],
+            }
+            result.append(email_data)
+
+    return render_page(result, page.next_cursor, output_format, max_chars)
 
 
 @mcp.tool()
-def get_meeting_requests(start_date: str, end_date: str) -> str:
+def get_meeting_requests(
+    start_date: str,
+    end_date: str,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    output_format: str = DEFAULT_FORMAT,
+    max_chars: int = 0,
+) -> str:
     """Get meeting requests and calendar invites"""
-    conn = sqlite3.connect("data/databases/emails.db")
-    cursor = conn.cursor()
-
     query = """
-    SELECT id, sender, subject, body, received_date, meeting_date, meeting_duration, attendees
-    FROM emails 
-    WHERE received_date BETWEEN ? AND ? 
-    AND (subject LIKE '%meeting%' OR subject LIKE '%invite%' OR body LIKE '%calendar%')
-    ORDER BY received_date DESC
+    SELECT id, sender, subject, body, received_date, meeting_date, meeting_duration, attendees,
+           received_date, id
+    FROM emails
+    WHERE received_date BETWEEN ? AND ?
+    AND id IN (
+        SELECT rowid FROM emails_fts
+        WHERE emails_fts MATCH 'subject : (meeting OR invite) OR body : calendar'
+    )
     """
 
-    cursor.execute(query, [start_date, end_date])
-    meetings = cursor.fetchall()
-    conn.close()
-
-    result = []
-    for meeting in meetings:
-        meeting_data = {
-            "id": meeting[0],
-            "sender": meeting[1],
-            "subject": meeting[2],
-            "body": meeting[3],
-            "received_date": meeting[4],
-            "meeting_date": meeting[5],
-            "meeting_duration": meeting[6],
-            "attendees": meeting[7],
-        }
-        result.append(meeting_data)
-
-    return json.dumps(result, indent=2)
+    with pool.connection() as conn:
+        page = keyset_page(
+            conn,
+            query,
+            [start_date, end_date],
+            "received_date",
+            page_size,
+            cursor,
+            descending=True,
+        )
+        result = []
+        for meeting in page:
+            meeting_data = {
+                "id": meeting[0],
+                "sender": meeting[1],
+                "subject": meeting[2],
+                "body": meeting[3],
+                "received_date": meeting[4],
+                "meeting_date": meeting[5],
+                "meeting_duration": meeting[6],
+                "attendees": meeting[7],
+            }
+            result.append(meeting_data)
+
+    return render_page(result, page.next_cursor, output_format, max_chars)
 
 
 @mcp.tool()
-def get_important_emails(start_date: str, end_date: str) -> str:
+def get_important_emails(
+    start_date: str,
+    end_date: str,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    output_format: str = DEFAULT_FORMAT,
+    max_chars: int = 0,
+) -> str:
     """Get emails marked as important or from key contacts"""
-    conn = sqlite3.connect("data/databases/emails.db")
-    cursor = conn.cursor()
-
     query = """
-    SELECT id, sender, subject, body, received_date, is_read, thread_id
-    FROM emails 
-    WHERE received_date BETWEEN ? AND ? 
+    SELECT id, sender, subject, body, received_date, is_read, thread_id,
+           received_date, id
+    FROM emails
+    WHERE received_date BETWEEN ? AND ?
     AND sender IN (
         'ceo@company.com', 'cto@company.com', 'manager@company.com'
     )
-    ORDER BY received_date DESC
     """
 
-    cursor.execute(query, [start_date, end_date])
-    important_emails = cursor.fetchall()
-    conn.close()
+    with pool.connection() as conn:
+        page = keyset_page(
+            conn,
+            query,
+            [start_date, end_date],
+            "received_date",
+            page_size,
+            cursor,
+            descending=True,
+        )
+        result = []
+        for email in page:
+            email_data = {
+                "id": email[0],
+                "sender": email[1],
+                "subject": email[2],
+                "body": email[3],
+                "received_date": email[4],
+                "is_read": bool(email[5]),
+                "thread_id": email[6],
+            }
+            result.append(email_data)
+
+    return render_page(result, page.next_cursor, output_format, max_chars)
 
-    result = []
-    for email in important_emails:
-        email_data = {
-            "id": email[0],
-            "sender": email[1],
-            "subject": email[2],
-            "body": email[3],
-            "received_date": email[4],
-            "is_read": bool(email[5]),
-            "thread_id": email[6],
-        }
-        result.append(email_data)
 
-    return json.dumps(result, indent=2)
+@mcp.tool()
+def search_emails(
+    query: str,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    page_size: int = 20,
+    cursor: Optional[str] = None,
+    output_format: str = DEFAULT_FORMAT,
+    max_chars: int = 0,
+) -> str:
+    """Search email subjects and bodies by keyword, best matches first"""
+    match = keyword_query(query)
+    if match is None:
+        return render_page([], None, output_format, max_chars)
+
+    sql = """
+    SELECT e.custom_id, e.sender, e.subject, e.body, e.received_date, e.thread_id,
+           bm25(emails_fts, 2.0, 1.0) AS rank
+    FROM emails_fts
+    JOIN emails e ON e.id = emails_fts.rowid
+    WHERE emails_fts MATCH ?
+    """
+    params = [match]
+
+    if start_date:
+        sql += " AND e.received_date >= ?"
+        params.append(start_date)
+    if end_date:
+        sql += " AND e.received_date <= ?"
+        params.append(end_date)
+
+    # Relevance order has no stable keyset, so search pages by offset
+    page_size = clamp_page_size(page_size)
+    offset = decode_offset(cursor)
+    sql += " ORDER BY rank, e.id LIMIT ? OFFSET ?"
+    params.extend([page_size + 1, offset])
+
+    with pool.connection() as conn:
+        page = offset_page(conn.execute(sql, params), page_size, offset)
+        result = []
+        for email in page:
+            email_data = {
+                "id": email[0],
+                "sender": email[1],
+                "subject": email[2],
+                "body": email[3],
+                "received_date": email[4],
+                "thread_id": email[5],
+                # bm25() is lower-is-better; flip it so higher means more relevant
+                "score": round(-email[6], 4),
+            }
+            result.append(email_data)
+
+    return render_page(result, page.next_cursor, output_format, max_chars)
 
 
 if __name__ == "__main__":
+    # Bring the schema (indexes) up to date before serving any queries
+    migrate(DB_PATH, "emails")
     mcp.run()
@@ -0,0 +1,84 @@
+"""
+Output encodings for MCP tool results
+
+Tool results are read by the LLM, so every repeated key and indentation
+space costs tokens. Tools accept an ``output_format`` of:
+- "json": indented JSON objects (the original layout)
+- "compact": the same objects without whitespace
+- "columnar": one header of field names plus one value array per row
+and an optional ``max_chars`` that truncates long free-text fields.
+"""
+
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+FORMATS = ("json", "compact", "columnar")
+DEFAULT_FORMAT = os.getenv("OOO_TOOL_FORMAT", "json")
+
+# Free-text fields that dominate payload size and are safe to shorten
+TEXT_FIELDS = ("body", "message", "description")
+TRUNCATION_MARKER = "..."
+
+
+def truncate_text(item: Dict[str, Any], max_chars: int) -> Dict[str, Any]:
+    """Shorten the free-text fields of an item to at most ``max_chars`` characters"""
+    if max_chars <= 0:
+        return item
+    shortened = dict(item)
+    for field in TEXT_FIELDS:
+        value = shortened.get(field)
+        if isinstance(value, str) and len(value) > max_chars:
+            keep = max(0, max_chars - len(TRUNCATION_MARKER))
+            shortened[field] = value[:keep].rstrip() + TRUNCATION_MARKER
+    return shortened
+
+
+def _columnar(items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    columns: List[str] = []
+    for item in items:
+        for key in item:
+            if key not in columns:
+                columns.append(key)
+    rows = [[item.get(column) for column in columns] for item in items]
+    return {"columns": columns, "rows": rows}
+
+
+def render_page(
+    items: List[Dict[str, Any]],
+    next_cursor: Optional[str],
+    output_format: str = DEFAULT_FORMAT,
+    max_chars: int = 0,
+) -> str:
+    """
+    Serialize a page of tool results.
+
+    Args:
+        items: Result rows as dictionaries
+        next_cursor: Cursor for the following page, or None
+        output_format: One of FORMATS
+        max_chars: Truncate TEXT_FIELDS to this many characters (0 disables)
+
+    Returns:
+        Encoded page as a string
+
+    Raises:
+        ValueError: If output_format is not supported
+    """
+    if output_format not in FORMATS:
+        raise ValueError(
+            f"Unsupported output_format {output_format!r}; expected one of {FORMATS}"
+        )
+
+    if max_chars > 0:
+        items = [truncate_text(item, max_chars) for item in items]
+
+    if output_format == "columnar":
+        payload = _columnar(items)
+        payload["next_cursor"] = next_cursor
+    else:
+        payload = {"items": items, "next_cursor": next_cursor}
+
+    if output_format == "json":
+        return json.dumps(payload, indent=2)
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
@@ -0,0 +1,27 @@
+"""
+Helpers for querying the SQLite FTS5 indexes created by the migrations
+"""
+
+import re
+from typing import Optional
+
+_TERM = re.compile(r"\w+")
+
+
+def keyword_query(text: str) -> Optional[str]:
+    """
+    Build an FTS5 MATCH expression that matches any word of free-form text.
+
+    Every word is quoted, so FTS5 operators or punctuation in the input are
+    treated as plain search terms rather than query syntax.
+
+    Args:
+        text: Free-form search text
+
+    Returns:
+        MATCH expression, or None if the text contains no words
+    """
+    terms = dict.fromkeys(term.lower() for term in _TERM.findall(text))
+    if not terms:
+        return None
+    return " OR ".join(f'"{term}"' for term in terms)
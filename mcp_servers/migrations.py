@@ -0,0 +1,253 @@
+"""
+Versioned schema migrations for the MCP server databases
+
+The seed scripts only create the base tables. Each server applies the
+pending migrations for its database when it starts serving (run as a
+script, or mounted in process by mcp_utils.get_mcp_client), never on
+import, and records the schema version in SQLite's ``user_version`` pragma.
+To migrate ahead of time, e.g. after seeding:
+
+    python -m mcp_servers.migrations
+
+Every statement is idempotent (``IF NOT EXISTS``), and a migration whose
+objects have gone missing (e.g. a seed script dropped and recreated a
+table, taking its indexes with it) is treated as not applied and re-run.
+"""
+
+import logging
+import os
+import re
+import sqlite3
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+try:
+    from .db import DATA_DIR
+except ImportError:  # Imported by a server running as a script
+    from db import DATA_DIR
+
+logger = logging.getLogger(__name__)
+
+_CREATED_OBJECT = re.compile(
+    r"CREATE\s+(?:VIRTUAL\s+TABLE|TABLE|INDEX|TRIGGER)\s+IF\s+NOT\s+EXISTS\s+(\w+)",
+    re.IGNORECASE,
+)
+
+
+class Migration(NamedTuple):
+    version: int
+    description: str
+    statements: Tuple[str, ...]
+
+    @property
+    def objects(self) -> List[str]:
+        """Names of the schema objects this migration creates"""
+        names = []
+        for statement in self.statements:
+            match = _CREATED_OBJECT.search(statement)
+            if match:
+                names.append(match.group(1))
+        return names
+
+
+# Database key -> file name in DATA_DIR
+DATABASE_FILES = {
+    "emails": "emails.db",
+    "calendar": "calendar.db",
+    "slack": "slack.db",
+}
+
+MIGRATIONS: Dict[str, List[Migration]] = {
+    "emails": [
+        Migration(
+            1,
+            "Date-range indexes for emails",
+            (
+                "CREATE INDEX IF NOT EXISTS idx_emails_received_sender "
+                "ON emails (received_date, sender)",
+            ),
+        ),
+        Migration(
+            2,
+            "Full-text index on email subject and body",
+            (
+                "CREATE VIRTUAL TABLE IF NOT EXISTS emails_fts USING fts5("
+                "subject, body, content='emails', content_rowid='id', "
+                "tokenize='porter unicode61')",
+                "CREATE TRIGGER IF NOT EXISTS emails_fts_ai AFTER INSERT ON emails BEGIN "
+                "INSERT INTO emails_fts (rowid, subject, body)"
+                "VALUES (new.id, new.subject, new.body); END",
+                "CREATE TRIGGER IF NOT EXISTS emails_fts_ad AFTER DELETE ON emails BEGIN "
+                "INSERT INTO emails_fts (emails_fts, rowid, subject, body) "
+                "VALUES ('delete', old.id, old.subject, old.body); END",
+                "CREATE TRIGGER IF NOT EXISTS emails_fts_au AFTER UPDATE ON emails BEGIN "
+                "INSERT INTO emails_fts (emails_fts, rowid, subject, body) "
+                "VALUES ('delete', old.id, old.subject, old.body); "
+                "INSERT INTO emails_fts (rowid, subject, body)"
+                "VALUES (new.id, new.subject, new.body); END",
+                # Backfill rows inserted before the triggers existed
+                "INSERT INTO emails_fts (emails_fts) VALUES ('rebuild')",
+            ),
+        ),
+    ],
+    "calendar": [
+        Migration(
+            1,
+            "Date-range indexes for events",
+            (
+                "CREATE INDEX IF NOT EXISTS idx_events_start_type "
+                "ON events (start_time, event_type)",
+            ),
+        ),
+        Migration(
+            2,
+            "Full-text index on event title and description",
+            (
+                "CREATE VIRTUAL TABLE IF NOT EXISTS events_fts USING fts5("
+                "title, description, content='events', content_rowid='id', "
+                "tokenize='porter unicode61')",
+                "CREATE TRIGGER IF NOT EXISTS events_fts_ai AFTER INSERT ON events BEGIN "
+                "INSERT INTO events_fts (rowid, title, description)"
+                "VALUES (new.id, new.title, new.description); END",
+                "CREATE TRIGGER IF NOT EXISTS events_fts_ad AFTER DELETE ON events BEGIN "
+                "INSERT INTO events_fts (events_fts, rowid, title, description) "
+                "VALUES ('delete', old.id, old.title, old.description); END",
+                "CREATE TRIGGER IF NOT EXISTS events_fts_au AFTER UPDATE ON events BEGIN "
+                "INSERT INTO events_fts (events_fts, rowid, title, description) "
+                "VALUES ('delete', old.id, old.title, old.description); "
+                "INSERT INTO events_fts (rowid, title, description)"
+                "VALUES (new.id, new.title, new.description); END",
+                # Backfill rows inserted before the triggers existed
+                "INSERT INTO events_fts (events_fts) VALUES ('rebuild')",
+            ),
+        ),
+    ],
+    "slack": [
+        Migration(
+            1,
+            "Date-range indexes for messages",
+            (
+                "CREATE INDEX IF NOT EXISTS idx_messages_timestamp_channel "
+                "ON messages (timestamp, channel)",
+            ),
+        ),
+        Migration(
+            2,
+            "Full-text index on Slack message text",
+            (
+                "CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5("
+                "message, content='messages', content_rowid='id', "
+                "tokenize='porter unicode61')",
+                "CREATE TRIGGER IF NOT EXISTS messages_fts_ai AFTER INSERT ON messages BEGIN "
+                "INSERT INTO messages_fts (rowid, message)"
+                "VALUES (new.id, new.message); END",
+                "CREATE TRIGGER IF NOT EXISTS messages_fts_ad AFTER DELETE ON messages BEGIN "
+                "INSERT INTO messages_fts (messages_fts, rowid, message) "
+                "VALUES ('delete', old.id, old.message); END",
+                "CREATE TRIGGER IF NOT EXISTS messages_fts_au AFTER UPDATE ON messages BEGIN "
+                "INSERT INTO messages_fts (messages_fts, rowid, message) "
+                "VALUES ('delete', old.id, old.message); "
+                "INSERT INTO messages_fts (rowid, message)"
+                "VALUES (new.id, new.message); END",
+                # Backfill rows inserted before the triggers existed
+                "INSERT INTO messages_fts (messages_fts) VALUES ('rebuild')",
+            ),
+        ),
+    ],
+}
+
+
+def applied_version(conn: sqlite3.Connection, migrations: List[Migration]) -> int:
+    """
+    Get the highest migration version that is both recorded and fully present.
+
+    Args:
+        conn: Open connection to the database
+        migrations: Ordered migrations for the database
+
+    Returns:
+        Effective schema version (0 when nothing is applied)
+    """
+    recorded = conn.execute("PRAGMA user_version").fetchone()[0]
+    existing = {row[0] for row in conn.execute("SELECT name FROM sqlite_master")}
+
+    version = 0
+    for migration in migrations:
+        if migration.version > recorded:
+            break
+        if not all(name in existing for name in migration.objects):
+            break
+        version = migration.version
+    return version
+
+
+def migrate(db_path: str, database: str) -> int:
+    """
+    Apply pending migrations to a database.
+
+    Missing database files are left alone so that starting a server before
+    seeding does not create an empty database.
+
+    Args:
+        db_path: Path to the SQLite database file
+        database: Key into MIGRATIONS ("emails", "calendar" or "slack")
+
+    Returns:
+        Schema version after migrating
+    """
+    migrations = MIGRATIONS[database]
+    if not os.path.exists(db_path):
+        logger.warning("Database %s does not exist; skipping migrations", db_path)
+        return 0
+
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    try:
+        version = applied_version(conn, migrations)
+        pending = [m for m in migrations if m.version > version]
+
+        for migration in pending:
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                for statement in migration.statements:
+                    conn.execute(statement)
+                conn.execute(f"PRAGMA user_version = {int(migration.version)}")
+                conn.execute("COMMIT")
+            except sqlite3.Error as e:
+                conn.execute("ROLLBACK")
+                logger.warning(
+                    "Migration %s (%s) failed for %s: %s",
+                    migration.version,
+                    migration.description,
+                    db_path,
+                    e,
+                )
+                return version
+            version = migration.version
+
+        if pending:
+            conn.execute("PRAGMA optimize")
+        return version
+    finally:
+        conn.close()
+
+
+def migrate_all(data_dir: Optional[str] = None) -> Dict[str, int]:
+    """
+    Apply pending migrations to every server database.
+
+    Args:
+        data_dir: Directory holding the databases; defaults to DATA_DIR
+
+    Returns:
+        Database key -> schema version after migrating
+    """
+    data_dir = data_dir or DATA_DIR
+    return {
+        database: migrate(os.path.join(data_dir, filename), database)
+        for database, filename in DATABASE_FILES.items()
+    }
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    for database, version in migrate_all().items():
+        print(f"{database}: schema version {version}")
@@ -0,0 +1,149 @@
+"""
+Cursor-based pagination for the MCP server tools
+
+Row-level tools page with keyset pagination on (date column, id): the
+cursor records the sort key of the last row returned, and the next page
+starts strictly after it, so every page costs an index seek plus
+``page_size`` rows regardless of how deep the caller has paged. Ranked and
+aggregated tools, which have no stable keyset, use offset cursors.
+
+Cursors are opaque URL-safe strings; callers pass ``next_cursor`` back
+unchanged to get the following page.
+"""
+
+import base64
+import json
+import sqlite3
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+def encode_cursor(value: Any) -> str:
+    """Encode a JSON-serializable position as an opaque cursor string"""
+    raw = json.dumps(value, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Any:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        return json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
+
+def clamp_page_size(page_size: int) -> int:
+    """Keep page sizes within 1..MAX_PAGE_SIZE"""
+    return max(1, min(int(page_size), MAX_PAGE_SIZE))
+
+
+class Page:
+    """
+    One page of rows streamed from a SQLite cursor or other iterator.
+
+    Iterating yields rows as they are produced; ``next_cursor`` is set once
+    iteration finishes (None when this was the last page). The underlying
+    iterator should produce one row more than ``page_size`` when another
+    page exists.
+    """
+
+    def __init__(
+        self,
+        rows: Iterable[Any],
+        page_size: int,
+        make_cursor: Callable[[Any], str],
+    ):
+        self._rows = rows
+        self.page_size = page_size
+        self._make_cursor = make_cursor
+        self.next_cursor: Optional[str] = None
+
+    def __iter__(self) -> Iterator[Any]:
+        last = None
+        for count, row in enumerate(self._rows):
+            if count == self.page_size:
+                # The extra row proves there is another page after `last`
+                self.next_cursor = self._make_cursor(last)
+                return
+            last = row
+            yield row
+
+
+def keyset_page(
+    conn: sqlite3.Connection,
+    query: str,
+    params: List[Any],
+    order_column: str,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    descending: bool = False,
+) -> Page:
+    """
+    Run one page of a query ordered by (order_column, id).
+
+    ``query`` must select from a single table and end with its WHERE clause
+    (no ORDER BY or LIMIT), and its last two selected columns must be
+    ``order_column`` and ``id``; they are used to build the next cursor.
+
+    Args:
+        conn: Connection to run the query on
+        query: SELECT ... FROM ... WHERE ... statement
+        params: Parameters for the query
+        order_column: Column to order and page by
+        page_size: Maximum rows per page
+        cursor: Cursor returned with the previous page, if any
+        descending: Page from newest to oldest
+
+    Returns:
+        Page of result rows
+    """
+    page_size = clamp_page_size(page_size)
+    direction = "DESC" if descending else "ASC"
+    params = list(params)
+
+    if cursor:
+        position = decode_cursor(cursor)
+        if not isinstance(position, list) or len(position) != 2:
+            raise ValueError(f"Invalid cursor: {cursor!r}")
+        query += f" AND ({order_column}, id) {'<' if descending else '>'} (?, ?)"
+        params.extend(position)
+
+    query += f" ORDER BY {order_column} {direction}, id {direction} LIMIT ?"
+    params.append(page_size + 1)
+
+    return Page(
+        conn.execute(query, params),
+        page_size,
+        lambda last: encode_cursor([last[-2], last[-1]]),
+    )
+
+
+def decode_offset(cursor: Optional[str]) -> int:
+    """Get the row offset stored in an offset cursor (0 when there is none)"""
+    if not cursor:
+        return 0
+    position = decode_cursor(cursor)
+    if not isinstance(position, dict) or not isinstance(position.get("offset"), int):
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return max(0, position["offset"])
+
+
+def offset_page(rows: Iterable[Any], page_size: int, offset: int) -> Page:
+    """
+    Wrap rows that start at ``offset`` in a Page with offset cursors.
+
+    ``rows`` must already skip the first ``offset`` rows and should produce at
+    least ``page_size + 1`` rows when another page exists (for SQL, use
+    ``LIMIT page_size + 1 OFFSET offset``).
+    """
+    return Page(
+        rows, page_size, lambda _: encode_cursor({"offset": offset + page_size})
+    )
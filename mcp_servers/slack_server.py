@@ -5,24 +5,59 @@ Simulates Slack workspace data for the OOO summarizer.
 Provides access to messages, mentions, channel activity, and direct messages.
 """
 
-import sqlite3
-import json
-from typing import List, Dict, Any, Optional
+import os
+from typing import List, Optional
 from fastmcp import FastMCP
 
+try:
+    from .db import DATA_DIR, get_pool
+    from .encoding import DEFAULT_FORMAT, render_page
+    from .fts import keyword_query
+    from .migrations import migrate
+    from .pagination import (
+        DEFAULT_PAGE_SIZE,
+        clamp_page_size,
+        decode_offset,
+        keyset_page,
+        offset_page,
+    )
+except ImportError:  # Running as a script: python mcp_servers/slack_server.py
+    from db import DATA_DIR, get_pool
+    from encoding import DEFAULT_FORMAT, render_page
+    from fts import keyword_query
+    from migrations import migrate
+    from pagination import (
+        DEFAULT_PAGE_SIZE,
+        clamp_page_size,
+        decode_offset,
+        keyset_page,
+        offset_page,
+    )
+
 # Create FastMCP server instance
 mcp = FastMCP("slack-server")
 
+DB_PATH = os.path.join(DATA_DIR, "slack.db")
+
+# Long-lived read-only connections shared by all tools
+pool = get_pool(DB_PATH)
 
-@mcp.tool()
-def get_messages(start_date: str, end_date: str, channel: Optional[str] = None) -> str:
-    """Get Slack messages for a specific date range"""
-    conn = sqlite3.connect("data/databases/slack.db")
-    cursor = conn.cursor()
 
+@mcp.tool()
+def get_messages(
+    start_date: str,
+    end_date: str,
+    channel: Optional[str] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    output_format: str = DEFAULT_FORMAT,
+    max_chars: int = 0,
+) -> str:
+    """Get Slack messages for a specific date range, newest first (pass next_cursor back for more)"""
     query = """
-    SELECT custom_id, channel, user, message, timestamp, thread_id, is_mention
-    FROM messages 
+    SELECT custom_id, channel, user, message, timestamp, thread_id, is_mention,
+           timestamp, id
+    FROM messages
     WHERE timestamp BETWEEN ? AND ?
     """
     params = [start_date, end_date]
@@ -31,147 +66,229 @@ def get_messages(start_date: str, end_date: str, channel: Optional[str] = None)
         query += " AND channel = ?"
         params.append(channel)
 
-    query += " ORDER BY timestamp DESC"
-
-    cursor.execute(query, params)
-    messages = cursor.fetchall()
-    conn.close()
+    with pool.connection() as conn:
+        page = keyset_page(
+            conn, query, params, "timestamp", page_size, cursor, descending=True
+        )
+        result = []
+        for message in page:
+            message_data = {
+                "id": message[0],
+                "channel": message[1],
+                "user": message[2],
+                "message": message[3],
+                "timestamp": message[4],
+                "thread_id": message[5],
+                "is_mention": bool(message[6]),
+            }
+            result.append(message_data)
 
-    result = []
-    for message in messages:
-        message_data = {
-            "id": message[0],
-            "channel": message[1],
-            "user": message[2],
-            "message": message[3],
-            "timestamp": message[4],
-            "thread_id": message[5],
-            "is_mention": bool(message[6]),
-        }
-        result.append(message_data)
-
-    return json.dumps(result, indent=2)
+    return render_page(result, page.next_cursor, output_format, max_chars)
 
 
 @mcp.tool()
-def get_mentions(start_date: str, end_date: str) -> str:
+def get_mentions(
+    start_date: str,
+    end_date: str,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    output_format: str = DEFAULT_FORMAT,
+    max_chars: int = 0,
+) -> str:
     """Get messages where the user was mentioned"""
-    conn = sqlite3.connect("data/databases/slack.db")
-    cursor = conn.cursor()
-
     query = """
-    SELECT id, channel, user, message, timestamp, thread_id
-    FROM messages 
+    SELECT id, channel, user, message, timestamp, thread_id,
+           timestamp, id
+    FROM messages
     WHERE timestamp BETWEEN ? AND ?
+    AND id IN (SELECT rowid FROM messages_fts WHERE messages_fts MATCH '"john doe"')
     AND message LIKE '%@john.doe%'
-    ORDER BY timestamp DESC
     """
 
-    cursor.execute(query, [start_date, end_date])
-    mentions = cursor.fetchall()
-    conn.close()
+    with pool.connection() as conn:
+        page = keyset_page(
+            conn,
+            query,
+            [start_date, end_date],
+            "timestamp",
+            page_size,
+            cursor,
+            descending=True,
+        )
+        result = []
+        for mention in page:
+            mention_data = {
+                "id": mention[0],
+                "channel": mention[1],
+                "user": mention[2],
+                "message": mention[3],
+                "timestamp": mention[4],
+                "thread_id": mention[5],
+            }
+            result.append(mention_data)
 
-    result = []
-    for mention in mentions:
-        mention_data = {
-            "id": mention[0],
-            "channel": mention[1],
-            "user": mention[2],
-            "message": mention[3],
-            "timestamp": mention[4],
-            "thread_id": mention[5],
-        }
-        result.append(mention_data)
-
-    return json.dumps(result, indent=2)
+    return render_page(result, page.next_cursor, output_format, max_chars)
 
 
 @mcp.tool()
-def get_direct_messages(start_date: str, end_date: str) -> str:
+def get_direct_messages(
+    start_date: str,
+    end_date: str,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    output_format: str = DEFAULT_FORMAT,
+    max_chars: int = 0,
+) -> str:
     """Get direct messages and private conversations"""
-    conn = sqlite3.connect("data/databases/slack.db")
-    cursor = conn.cursor()
-
     query = """
-    SELECT id, channel, user, message, timestamp, thread_id, is_mention
-    FROM messages 
+    SELECT id, channel, user, message, timestamp, thread_id, is_mention,
+           timestamp, id
+    FROM messages
     WHERE timestamp BETWEEN ? AND ?
     AND channel LIKE 'D%'
-    ORDER BY timestamp DESC
     """
 
-    cursor.execute(query, [start_date, end_date])
-    dms = cursor.fetchall()
-    conn.close()
+    with pool.connection() as conn:
+        page = keyset_page(
+            conn,
+            query,
+            [start_date, end_date],
+            "timestamp",
+            page_size,
+            cursor,
+            descending=True,
+        )
+        result = []
+        for dm in page:
+            dm_data = {
+                "id": dm[0],
+                "channel": dm[1],
+                "user": dm[2],
+                "message": dm[3],
+                "timestamp": dm[4],
+                "thread_id": dm[5],
+                "is_mention": bool(dm[6]),
+            }
+            result.append(dm_data)
 
-    result = []
-    for dm in dms:
-        dm_data = {
-            "id": dm[0],
-            "channel": dm[1],
-            "user": dm[2],
-            "message": dm[3],
-            "timestamp": dm[4],
-            "thread_id": dm[5],
-            "is_mention": bool(dm[6]),
-        }
-        result.append(dm_data)
-
-    return json.dumps(result, indent=2)
+    return render_page(result, page.next_cursor, output_format, max_chars)
 
 
 @mcp.tool()
 def get_channel_activity(
-    start_date: str, end_date: str, channels: Optional[List[str]] = None
+    start_date: str,
+    end_date: str,
+    channels: Optional[List[str]] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    output_format: str = DEFAULT_FORMAT,
+    max_chars: int = 0,
 ) -> str:
     """Get activity summary for specific channels"""
-    conn = sqlite3.connect("data/databases/slack.db")
-    cursor = conn.cursor()
-
     if channels:
         placeholders = ",".join(["?" for _ in channels])
         query = f"""
-        SELECT channel, COUNT(*) as message_count, 
+        SELECT channel, COUNT(*) as message_count,
                COUNT(DISTINCT user) as unique_users,
                MIN(timestamp) as first_message,
                MAX(timestamp) as last_message
-        FROM messages 
+        FROM messages
         WHERE timestamp BETWEEN ? AND ?
         AND channel IN ({placeholders})
         GROUP BY channel
-        ORDER BY message_count DESC
         """
         params = [start_date, end_date] + channels
     else:
         query = """
-        SELECT channel, COUNT(*) as message_count, 
+        SELECT channel, COUNT(*) as message_count,
                COUNT(DISTINCT user) as unique_users,
                MIN(timestamp) as first_message,
                MAX(timestamp) as last_message
-        FROM messages 
+        FROM messages
         WHERE timestamp BETWEEN ? AND ?
         GROUP BY channel
-        ORDER BY message_count DESC
         """
         params = [start_date, end_date]
 
-    cursor.execute(query, params)
-    activity = cursor.fetchall()
-    conn.close()
+    # Aggregated rows have no keyset, so activity pages by offset
+    page_size = clamp_page_size(page_size)
+    offset = decode_offset(cursor)
+    query += " ORDER BY message_count DESC, channel ASC LIMIT ? OFFSET ?"
+    params = params + [page_size + 1, offset]
+
+    with pool.connection() as conn:
+        page = offset_page(conn.execute(query, params), page_size, offset)
+        result = []
+        for channel_activity in page:
+            activity_data = {
+                "channel": channel_activity[0],
+                "message_count": channel_activity[1],
+                "unique_users": channel_activity[2],
+                "first_message": channel_activity[3],
+                "last_message": channel_activity[4],
+            }
+            result.append(activity_data)
+
+    return render_page(result, page.next_cursor, output_format, max_chars)
+
+
+@mcp.tool()
+def search_messages(
+    query: str,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    page_size: int = 20,
+    cursor: Optional[str] = None,
+    output_format: str = DEFAULT_FORMAT,
+    max_chars: int = 0,
+) -> str:
+    """Search Slack message text by keyword, best matches first"""
+    match = keyword_query(query)
+    if match is None:
+        return render_page([], None, output_format, max_chars)
+
+    sql = """
+    SELECT m.custom_id, m.channel, m.user, m.message, m.timestamp, m.thread_id,
+           bm25(messages_fts) AS rank
+    FROM messages_fts
+    JOIN messages m ON m.id = messages_fts.rowid
+    WHERE messages_fts MATCH ?
+    """
+    params = [match]
+
+    if start_date:
+        sql += " AND m.timestamp >= ?"
+        params.append(start_date)
+    if end_date:
+        sql += " AND m.timestamp <= ?"
+        params.append(end_date)
+
+    # Relevance order has no stable keyset, so search pages by offset
+    page_size = clamp_page_size(page_size)
+    offset = decode_offset(cursor)
+    sql += " ORDER BY rank, m.id LIMIT ? OFFSET ?"
+    params.extend([page_size + 1, offset])
 
-    result = []
-    for channel_activity in activity:
-        activity_data = {
-            "channel": channel_activity[0],
-            "message_count": channel_activity[1],
-            "unique_users": channel_activity[2],
-            "first_message": channel_activity[3],
-            "last_message": channel_activity[4],
-        }
-        result.append(activity_data)
+    with pool.connection() as conn:
+        page = offset_page(conn.execute(sql, params), page_size, offset)
+        result = []
+        for message in page:
+            message_data = {
+                "id": message[0],
+                "channel": message[1],
+                "user": message[2],
+                "message": message[3],
+                "timestamp": message[4],
+                "thread_id": message[5],
+                # bm25() is lower-is-better; flip it so higher means more relevant
+                "score": round(-message[6], 4),
+            }
+            result.append(message_data)
 
-    return json.dumps(result, indent=2)
+    return render_page(result, page.next_cursor, output_format, max_chars)
 
 
 if __name__ == "__main__":
+    # Bring the schema (indexes) up to date before serving any queries
+    migrate(DB_PATH, "slack")
     mcp.run()
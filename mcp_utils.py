@@ -6,9 +6,22 @@ This module provides utilities for configuring and managing MCP (Model Context P
 and clients for the OOO Summarizer Agent.
 """
 
-from typing import Dict, Any
-from langchain_openai import ChatOpenAI
-from mcp_use import MCPAgent, MCPClient
+import os
+from typing import TYPE_CHECKING, Dict, Any, Optional
+
+# mcp_use (which pulls in langchain) is imported where it is used so that
+# importing this module for its constants stays cheap
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+    from mcp_use import MCPAgent, MCPClient
+
+MAX_AGENT_STEPS = 15
+# "stdio" launches each server as a subprocess; "inprocess" mounts the
+# bundled FastMCP servers on in-memory streams in this process
+MCP_TRANSPORTS = ("stdio", "inprocess")
+DEFAULT_MCP_TRANSPORT = os.getenv("OOO_MCP_TRANSPORT", "stdio")
+# Database location and import timing for --profile-startup
+SERVER_ENV_PASSTHROUGH = ("OOO_DATA_DIR", "PYTHONPROFILEIMPORTTIME")
 
 
 def get_mcp_config() -> Dict[str, Any]:
@@ -18,29 +31,79 @@ def get_mcp_config() -> Dict[str, Any]:
     Returns:
         Dict containing MCP server configuration
     """
-    return {
+    config = {
         "mcpServers": {
             "email": {"command": "python", "args": ["mcp_servers/email_server.py"]},
-            # Add the remaining MCP servers here
+            "calendar": {
+                "command": "python",
+                "args": ["mcp_servers/calendar_server.py"],
+            },
+            "slack": {"command": "python", "args": ["mcp_servers/slack_server.py"]},
         }
     }
 
+    # The stdio transport only hands servers a minimal default environment,
+    # so forward the variables they need to see explicitly
+    env = {
+        name: os.environ[name] for name in SERVER_ENV_PASSTHROUGH if name in os.environ
+    }
+    if env:
+        for server in config["mcpServers"].values():
+            server["env"] = env
+    return config
 
-def get_mcp_client() -> MCPClient:
+
+def get_mcp_client(transport: str = DEFAULT_MCP_TRANSPORT) -> "MCPClient":
     """
     Create MCP client from configuration.
 
+    Args:
+        transport: One of MCP_TRANSPORTS
+
     Returns:
         Configured MCPClient instance
     """
-    raise NotImplementedError("Get the MCP config and create the MCP client")
+    if transport not in MCP_TRANSPORTS:
+        raise ValueError(
+            f"Unsupported MCP transport {transport!r}; expected one of {MCP_TRANSPORTS}"
+        )
+    if transport == "inprocess":
+        # Imported lazily: this loads fastmcp and opens the server databases
+        from inprocess_mcp import InProcessMCPClient
+        from mcp_servers import calendar_mcp, email_mcp, slack_mcp
+        from mcp_servers.migrations import migrate_all
 
+        # The servers start here rather than as scripts, so migrate as they would
+        migrate_all()
+        return InProcessMCPClient(
+            {"email": email_mcp, "calendar": calendar_mcp, "slack": slack_mcp}
+        )
 
-def get_mcp_agent(llm: ChatOpenAI) -> MCPAgent:
+    from mcp_use import MCPClient
+
+    return MCPClient.from_dict(get_mcp_config())
+
+
+def get_mcp_agent(
+    llm: "ChatOpenAI", client: Optional["MCPClient"] = None
+) -> "MCPAgent":
     """
     Create MCP agent with LLM and client.
 
+    Args:
+        llm: Chat model driving the agent
+        client: Client whose sessions the agent should share; a new one is
+            created when omitted
+
     Returns:
         Configured MCPAgent instance
     """
-    raise NotImplementedError("Get the MCP client and create the MCP agent")
+    from mcp_use import MCPAgent
+
+    # Each prompt is independent, so the agent keeps no conversation memory
+    return MCPAgent(
+        llm=llm,
+        client=client or get_mcp_client(),
+        max_steps=MAX_AGENT_STEPS,
+        memory_enabled=False,
+    )
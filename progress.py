@@ -0,0 +1,193 @@
+"""
+Structured progress events for a report run
+
+With --progress, main.py writes one JSON object per line to stdout as the
+run goes (its usual narration moves to stderr), and the last line is a
+"report" event carrying the final report. app.py reads the pipe line by line
+to draw a live timeline and show report sections as soon as they exist.
+
+Every event has "event" (one of EVENT_TYPES) and "t" (seconds since the run
+started), plus fields of its own.
+
+Pipeline code calls emit(), which writes to the reporter active in the
+current context and does nothing otherwise, so no reporter has to be passed
+around. While a reporter is active, a LangChain configure hook also attaches
+ProgressCallback to every model and tool run, which covers the calls MCPAgent
+makes internally.
+"""
+
+import json
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import IO, Any, Dict, Optional
+
+EVENT_TYPES = (
+    "run_started",
+    "tool_call_started",
+    "tool_call_finished",
+    "collection_finished",
+    "items_filtered",
+    "llm_call_started",
+    "llm_call_finished",
+    "llm_cache_hit",
+    "section",
+    "priority_item",
+    "report",
+    "error",
+)
+
+_reporter: ContextVar[Optional["ProgressReporter"]] = ContextVar(
+    "ooo_progress_reporter", default=None
+)
+_callback: ContextVar[Optional[Any]] = ContextVar("ooo_progress_callback", default=None)
+
+
+class ProgressReporter:
+    """Writes progress events to a stream as JSON lines"""
+
+    def __init__(self, stream: IO[str]):
+        self.stream = stream
+        self.started = time.perf_counter()
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def emit(self, event: str, **fields: Any) -> None:
+        record = {"event": event, "t": round(self.elapsed(), 3), **fields}
+        self.stream.write(json.dumps(record, default=str, ensure_ascii=False) + "\n")
+        # Readers act on each line as it arrives
+        self.stream.flush()
+
+
+def emit(event: str, **fields: Any) -> None:
+    """Emit an event to the active reporter, if any"""
+    reporter = _reporter.get()
+    if reporter is not None:
+        reporter.emit(event, **fields)
+
+
+def is_active() -> bool:
+    """Whether emit() currently goes anywhere"""
+    return _reporter.get() is not None
+
+
+def _usage(response: Any) -> Dict[str, int]:
+    """Token counts from an LLMResult, as reported by the model"""
+    for generations in getattr(response, "generations", None) or []:
+        for generation in generations:
+            usage = getattr(
+                getattr(generation, "message", None), "usage_metadata", None
+            )
+            if usage:
+                return {
+                    "input_tokens": usage.get("input_tokens", 0),
+                    "output_tokens": usage.get("output_tokens", 0),
+                }
+    return {}
+
+
+def _rows(output: Any) -> Optional[int]:
+    """Item count of a listing tool's JSON output, or None for other output"""
+    text = getattr(output, "content", output)
+    try:
+        page = json.loads(text)
+    except (TypeError, ValueError):
+        return None
+    items = page.get("items") if isinstance(page, dict) else None
+    return len(items) if isinstance(items, list) else None
+
+
+@lru_cache(maxsize=1)
+def _callback_class():
+    # LangChain is only imported (and the hook only registered) once a
+    # reporter is actually used, keeping it off the CLI's startup path
+    from langchain_core.callbacks import BaseCallbackHandler
+    from langchain_core.tracers.context import register_configure_hook
+
+    class ProgressCallback(BaseCallbackHandler):
+        """Turns LangChain model and tool runs into progress events"""
+
+        # Emit from the event loop thread, in order, rather than in an executor
+        run_inline = True
+
+        def __init__(self, reporter: ProgressReporter):
+            self.reporter = reporter
+            self.started: Dict[Any, float] = {}
+            self.tools: Dict[Any, str] = {}
+
+        def _start(self, run_id) -> str:
+            self.started[run_id] = time.perf_counter()
+            return str(run_id)
+
+        def _seconds(self, run_id) -> float:
+            started = self.started.pop(run_id, time.perf_counter())
+            return round(time.perf_counter() - started, 3)
+
+        def on_chat_model_start(self, serialized, messages, *, run_id, **kwargs):
+            self.reporter.emit("llm_call_started", id=self._start(run_id))
+
+        def on_llm_start(self, serialized, prompts, *, run_id, **kwargs):
+            self.reporter.emit("llm_call_started", id=self._start(run_id))
+
+        def on_llm_end(self, response, *, run_id, **kwargs):
+            self.reporter.emit(
+                "llm_call_finished",
+                id=str(run_id),
+                seconds=self._seconds(run_id),
+                **_usage(response),
+            )
+
+        def on_llm_error(self, error, *, run_id, **kwargs):
+            self.reporter.emit(
+                "llm_call_finished",
+                id=str(run_id),
+                seconds=self._seconds(run_id),
+                error=str(error),
+            )
+
+        def on_tool_start(self, serialized, input_str, *, run_id, **kwargs):
+            tool = (serialized or {}).get("name") or kwargs.get("name") or "tool"
+            self.tools[run_id] = tool
+            self.reporter.emit("tool_call_started", id=self._start(run_id), tool=tool)
+
+        def on_tool_end(self, output, *, run_id, **kwargs):
+            rows = _rows(output)
+            self.reporter.emit(
+                "tool_call_finished",
+                id=str(run_id),
+                tool=self.tools.pop(run_id, "tool"),
+                seconds=self._seconds(run_id),
+                **({} if rows is None else {"rows": rows}),
+            )
+
+        def on_tool_error(self, error, *, run_id, **kwargs):
+            self.reporter.emit(
+                "tool_call_finished",
+                id=str(run_id),
+                tool=self.tools.pop(run_id, "tool"),
+                seconds=self._seconds(run_id),
+                error=str(error),
+            )
+
+    register_configure_hook(_callback, inheritable=True)
+    return ProgressCallback
+
+
+@contextmanager
+def reporting(stream: IO[str]):
+    """
+    Send progress events in this context to ``stream``.
+
+    Covers emit() calls and every LangChain model and tool run started in
+    the context, including tasks created from it.
+    """
+    reporter = ProgressReporter(stream)
+    reporter_token = _reporter.set(reporter)
+    callback_token = _callback.set(_callback_class()(reporter))
+    try:
+        yield reporter
+    finally:
+        _callback.reset(callback_token)
+        _reporter.reset(reporter_token)
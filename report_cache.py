@@ -0,0 +1,147 @@
+"""
+Cache of finished reports for the Streamlit app
+
+A report only changes when its inputs do: the date range, the seeded
+databases, the prompt files and the settings the agent runs with (model,
+analysis mode and so on). report_key() hashes all of them, so a repeat
+view of a test case is served from ReportCache in milliseconds, while
+re-seeding a database or editing a prompt produces a new key and a fresh
+run.
+
+Databases are fingerprinted from file metadata rather than their contents:
+size, mtime and SQLite's file change counter for each .db file and its WAL.
+That costs a few stat() calls however large the databases get.
+"""
+
+import glob
+import hashlib
+import json
+import os
+from typing import Any, Dict, Mapping, Optional
+
+from llm_cache import ResponseCache
+
+DEFAULT_REPORT_CACHE_PATH = os.getenv("OOO_REPORT_CACHE_PATH", ".cache/report_cache.db")
+DEFAULT_REPORT_CACHE_TTL = float(os.getenv("OOO_REPORT_CACHE_TTL", str(24 * 3600)))
+DEFAULT_REPORT_CACHE_MAX_ENTRIES = int(os.getenv("OOO_REPORT_CACHE_MAX_ENTRIES", "50"))
+DATA_DIR = os.getenv("OOO_DATA_DIR", "data/databases")
+PROMPT_DIR = "prompts"
+
+# Environment settings that change what the agent produces for a date range
+REPORT_SETTINGS = (
+    "OOO_MODEL",
+    "OPENAI_API_BASE",
+    "OOO_COLLECTION_MODE",
+    "OOO_ANALYSIS_MODE",
+    "OOO_USER",
+    "OOO_DATA_DIR",
+    "OOO_MIN_SCORE",
+    "OOO_PROMPT_TOKEN_BUDGET",
+    "OOO_CHUNK_TOKENS",
+    "OOO_MAX_FIELD_CHARS",
+    "OOO_TOOL_FORMAT",
+)
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _change_counter(path: str) -> Optional[int]:
+    """SQLite's file change counter, bumped by every committed write"""
+    try:
+        with open(path, "rb") as f:
+            header = f.read(28)
+    except OSError:
+        return None
+    if len(header) < 28 or not header.startswith(b"SQLite format 3\x00"):
+        return None
+    return int.from_bytes(header[24:28], "big")
+
+
+def database_fingerprint(data_dir: str = DATA_DIR) -> str:
+    """
+    Fingerprint the SQLite databases in a directory.
+
+    Args:
+        data_dir: Directory holding the *.db files the MCP servers read
+
+    Returns:
+        Hex digest that changes whenever a database is written to
+    """
+    files = []
+    for path in sorted(glob.glob(os.path.join(data_dir, "*.db"))):
+        for name in (path, path + "-wal"):
+            try:
+                stat = os.stat(name)
+            except FileNotFoundError:
+                continue
+            files.append(
+                [
+                    os.path.basename(name),
+                    stat.st_size,
+                    stat.st_mtime_ns,
+                    _change_counter(name) if name == path else None,
+                ]
+            )
+    return _sha256(json.dumps(files))
+
+
+def prompts_fingerprint(prompt_dir: str = PROMPT_DIR) -> str:
+    """Hex digest of every prompt template's name and contents"""
+    digest = hashlib.sha256()
+    for path in sorted(glob.glob(os.path.join(prompt_dir, "*.txt"))):
+        digest.update(os.path.basename(path).encode("utf-8"))
+        with open(path, "rb") as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+    return digest.hexdigest()
+
+
+def report_key(
+    start_date: str,
+    end_date: str,
+    data_dir: str = DATA_DIR,
+    prompt_dir: str = PROMPT_DIR,
+    environ: Mapping[str, str] = os.environ,
+) -> str:
+    """
+    Build the cache key for a report.
+
+    Args:
+        start_date: First day of the report
+        end_date: Last day of the report
+        data_dir: Directory of the databases the report is built from
+        prompt_dir: Directory of the prompt templates
+        environ: Environment the agent runs with
+
+    Returns:
+        Hex digest identifying the report's inputs
+    """
+    parts = {
+        "dates": [start_date, end_date],
+        "data": database_fingerprint(data_dir),
+        "prompts": prompts_fingerprint(prompt_dir),
+        "settings": {name: environ.get(name) for name in REPORT_SETTINGS},
+    }
+    return _sha256(json.dumps(parts, sort_keys=True))
+
+
+class ReportCache(ResponseCache):
+    """Finished reports, stored as JSON with TTL expiry and LRU eviction"""
+
+    def __init__(
+        self,
+        path: str = DEFAULT_REPORT_CACHE_PATH,
+        ttl_seconds: float = DEFAULT_REPORT_CACHE_TTL,
+        max_entries: int = DEFAULT_REPORT_CACHE_MAX_ENTRIES,
+    ):
+        super().__init__(path, ttl_seconds, max_entries)
+
+    def get_report(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached report, or None if missing or expired"""
+        value = self.get(key)
+        return None if value is None else json.loads(value)
+
+    def set_report(self, key: str, report: Dict[str, Any]) -> None:
+        """Store a finished report"""
+        self.set(key, json.dumps(report, ensure_ascii=False))
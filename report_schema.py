@@ -0,0 +1,119 @@
+"""
+JSON schema and validation for the OOO report
+
+The single-call analysis mode asks the model for the whole report at once
+using structured output. The same schema is passed to the model and checked
+locally, so a malformed response falls back to the three-call path instead
+of producing a broken report.
+"""
+
+from typing import Any, Dict, List
+
+ACTION_PRIORITIES = ("P0", "P1", "P2")
+UPDATE_PRIORITIES = ("P0", "P1")
+UPDATE_SOURCES = ("email", "calendar", "slack")
+
+ITEM_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "string"},
+        "title": {"type": "string"},
+        "due_date": {"type": ["string", "null"]},
+        "source": {"type": "string", "enum": list(UPDATE_SOURCES)},
+        "context": {"type": "string"},
+    },
+    "required": ["id", "title", "due_date", "source", "context"],
+    "additionalProperties": False,
+}
+
+
+def _buckets(priorities) -> Dict[str, Any]:
+    return {
+        "type": "object",
+        "properties": {
+            priority: {"type": "array", "items": ITEM_SCHEMA} for priority in priorities
+        },
+        "required": list(priorities),
+        "additionalProperties": False,
+    }
+
+
+REPORT_SCHEMA = {
+    "title": "ooo_report",
+    "description": "Out-of-office summary, prioritized action items and updates",
+    "type": "object",
+    "properties": {
+        "summary": {"type": "string"},
+        "action_items": _buckets(ACTION_PRIORITIES),
+        "updates": {
+            "type": "object",
+            "properties": {
+                source: _buckets(UPDATE_PRIORITIES) for source in UPDATE_SOURCES
+            },
+            "required": list(UPDATE_SOURCES),
+            "additionalProperties": False,
+        },
+    },
+    "required": ["summary", "action_items", "updates"],
+    "additionalProperties": False,
+}
+
+
+def _validate_items(items: Any, path: str, errors: List[str]) -> None:
+    if not isinstance(items, list):
+        errors.append(f"{path}: expected a list")
+        return
+    for index, item in enumerate(items):
+        item_path = f"{path}[{index}]"
+        if not isinstance(item, dict):
+            errors.append(f"{item_path}: expected an object")
+            continue
+        for field in ("id", "title", "source", "context"):
+            if not isinstance(item.get(field), str):
+                errors.append(f"{item_path}.{field}: expected a string")
+        due_date = item.get("due_date")
+        if due_date is not None and not isinstance(due_date, str):
+            errors.append(f"{item_path}.due_date: expected a string or null")
+        if item.get("source") not in UPDATE_SOURCES:
+            errors.append(f"{item_path}.source: expected one of {UPDATE_SOURCES}")
+
+
+def _validate_buckets(buckets: Any, priorities, path: str, errors: List[str]) -> None:
+    if not isinstance(buckets, dict):
+        errors.append(f"{path}: expected an object")
+        return
+    for priority in priorities:
+        _validate_items(buckets.get(priority), f"{path}.{priority}", errors)
+
+
+def validate_report(report: Any) -> List[str]:
+    """
+    Check a report against REPORT_SCHEMA.
+
+    Args:
+        report: Parsed model output
+
+    Returns:
+        List of validation errors; empty when the report is valid
+    """
+    if not isinstance(report, dict):
+        return ["report: expected an object"]
+
+    errors: List[str] = []
+    summary = report.get("summary")
+    if not isinstance(summary, str) or not summary.strip():
+        errors.append("summary: expected a non-empty string")
+
+    _validate_buckets(
+        report.get("action_items"), ACTION_PRIORITIES, "action_items", errors
+    )
+
+    updates = report.get("updates")
+    if not isinstance(updates, dict):
+        errors.append("updates: expected an object")
+    else:
+        for source in UPDATE_SOURCES:
+            _validate_buckets(
+                updates.get(source), UPDATE_PRIORITIES, f"updates.{source}", errors
+            )
+    return errors
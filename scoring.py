@@ -0,0 +1,175 @@
+"""
+Rule-based relevance scoring for collected OOO data
+
+Most of what piles up while someone is out is noise: greetings, reminders,
+promotions and social events. Every item is scored from cheap features
+(sender, urgency and noise keywords, mentions, direct messages, event type)
+before any LLM call, so obvious noise is dropped and the rest is ordered
+most relevant first. Scores are additive; an item with no signal scores 0.
+"""
+
+import os
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Same key contacts as get_important_emails in the email server
+IMPORTANT_SENDERS = ("ceo@company.com", "cto@company.com", "manager@company.com")
+COMPANY_DOMAIN = "company.com"
+
+# Urgent language from prompts/priority_analysis_prompt.txt plus incident terms
+URGENT_KEYWORDS = (
+    "asap",
+    "urgent",
+    "critical",
+    "deadline",
+    "blocked",
+    "immediate",
+    "immediately",
+    "emergency",
+    "outage",
+    "down",
+    "breach",
+    "vulnerability",
+    "security",
+    "incident",
+)
+
+# "Ignore" categories from the priority prompt: reminders, promotions, social
+NOISE_KEYWORDS = (
+    "reminder",
+    "happy new year",
+    "new year",
+    "newsletter",
+    "survey",
+    "party",
+    "promotion",
+    "special",
+    "discount",
+    "half price",
+    "congratulations",
+    "good morning",
+    "coffee",
+    "lunch",
+    "team building",
+    "welcome",
+    "valentine's day",
+)
+
+IMPORTANT_EVENT_TYPES = ("deadline", "critical")
+NOISE_EVENT_TYPES = ("social", "training", "maintenance")
+
+IMPORTANT_SENDER_WEIGHT = 2
+EXTERNAL_SENDER_WEIGHT = 3
+URGENT_KEYWORD_WEIGHT = 2
+NOISE_KEYWORD_WEIGHT = -3
+MENTION_WEIGHT = 1
+DIRECT_MESSAGE_WEIGHT = 2
+IMPORTANT_EVENT_WEIGHT = 3
+NOISE_EVENT_WEIGHT = -3
+
+# Items scoring below this are dropped before prompting
+DEFAULT_MIN_SCORE = int(os.getenv("OOO_MIN_SCORE", "0"))
+
+# Collected-data keys and the free-text fields scored for each
+SOURCE_FIELDS = {
+    "emails": ("subject", "body"),
+    "calendar_events": ("title", "description"),
+    "slack_messages": ("message",),
+}
+
+
+def _keyword_pattern(keywords: Iterable[str]) -> "re.Pattern[str]":
+    alternatives = "|".join(re.escape(keyword) for keyword in keywords)
+    return re.compile(rf"(?<!\w)(?:{alternatives})(?!\w)", re.IGNORECASE)
+
+
+URGENT_PATTERN = _keyword_pattern(URGENT_KEYWORDS)
+NOISE_PATTERN = _keyword_pattern(NOISE_KEYWORDS)
+
+
+def _sender_score(sender: Optional[str]) -> int:
+    if not sender:
+        return 0
+    sender = sender.lower()
+    if sender in IMPORTANT_SENDERS:
+        return IMPORTANT_SENDER_WEIGHT
+    if "@" in sender and not sender.endswith("@" + COMPANY_DOMAIN):
+        return EXTERNAL_SENDER_WEIGHT
+    return 0
+
+
+def score_item(item: Dict[str, Any], source: str) -> int:
+    """
+    Score a single collected item.
+
+    Args:
+        item: Item as returned by the MCP tools
+        source: One of the SOURCE_FIELDS keys
+
+    Returns:
+        Relevance score; negative means likely noise
+    """
+    text = " ".join(
+        str(item.get(field) or "") for field in SOURCE_FIELDS.get(source, ())
+    )
+    # Distinct keywords only, so repeating "urgent" does not inflate a score
+    urgent = {match.lower() for match in URGENT_PATTERN.findall(text)}
+    noise = {match.lower() for match in NOISE_PATTERN.findall(text)}
+
+    score = URGENT_KEYWORD_WEIGHT * len(urgent) + NOISE_KEYWORD_WEIGHT * len(noise)
+    score += _sender_score(item.get("sender") or item.get("user"))
+
+    if item.get("is_mention"):
+        score += MENTION_WEIGHT
+    if str(item.get("channel") or "").startswith("D"):
+        score += DIRECT_MESSAGE_WEIGHT
+
+    event_type = str(item.get("event_type") or "").lower()
+    if event_type in IMPORTANT_EVENT_TYPES:
+        score += IMPORTANT_EVENT_WEIGHT
+    elif event_type in NOISE_EVENT_TYPES:
+        score += NOISE_EVENT_WEIGHT
+
+    return score
+
+
+def filter_items(
+    items: List[Dict[str, Any]], source: str, min_score: int = DEFAULT_MIN_SCORE
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Score items, drop those below ``min_score`` and sort the rest by score.
+
+    Returns:
+        Tuple of (kept items with a "score" field, number of dropped items)
+    """
+    scored = []
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        scored.append({**item, "score": score_item(item, source)})
+
+    kept = [item for item in scored if item["score"] >= min_score]
+    # Stable sort keeps the tools' date order among equal scores
+    kept.sort(key=lambda item: item["score"], reverse=True)
+    return kept, len(scored) - len(kept)
+
+
+def filter_collected_data(
+    data: Dict[str, Any], min_score: int = DEFAULT_MIN_SCORE
+) -> Tuple[Dict[str, Any], Dict[str, int]]:
+    """
+    Apply filter_items to every source in the collected data.
+
+    Keys other than SOURCE_FIELDS (or sources that are not lists) are passed
+    through unchanged.
+
+    Returns:
+        Tuple of (filtered data, dropped item count per source)
+    """
+    filtered = dict(data)
+    dropped = {}
+    for source in SOURCE_FIELDS:
+        items = data.get(source)
+        if isinstance(items, list):
+            filtered[source], dropped[source] = filter_items(items, source, min_score)
+    return filtered, dropped
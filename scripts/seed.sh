@@ -3,3 +3,4 @@
 python3 data/seed_data_test1.py
 python3 data/seed_data_test2.py
 python3 data/seed_data_test3.py
+python3 -m mcp_servers.migrations
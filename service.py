@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Long-running OOO report service
+
+Every summarizer.py run cold-starts Python, the LLM client and one MCP
+server subprocess per source. This daemon starts them once and serves
+reports over a small asyncio HTTP API:
+
+    POST /reports         {"start": "2024-01-01", "end": "2024-01-03", "user": "..."}
+                          -> 202 {"id": ..., "status": "queued"}
+    GET  /reports/{id}    -> {"id", "status", "report" | "error", timings}
+    GET  /health          -> {"status": "ok", "queued": n, "workers": n}
+
+Jobs are queued and processed by a fixed pool of workers sharing one agent
+and its MCP sessions.
+
+Usage:
+    python service.py [--host 127.0.0.1] [--port 8080] [--workers 4] [--direct] ...
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from main import DEFAULT_USER, OOOSummarizerAgent, add_agent_arguments, agent_kwargs
+
+DEFAULT_HOST = os.getenv("OOO_SERVICE_HOST", "127.0.0.1")
+DEFAULT_PORT = int(os.getenv("OOO_SERVICE_PORT", "8080"))
+DEFAULT_WORKERS = int(os.getenv("OOO_SERVICE_WORKERS", "4"))
+MAX_RETAINED_JOBS = 1000
+MAX_BODY_BYTES = 64 * 1024
+
+REASONS = {
+    200: "OK",
+    202: "Accepted",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+
+
+class ReportService:
+    """Queue of report jobs processed by workers sharing one warm agent"""
+
+    def __init__(self, agent, workers: int = DEFAULT_WORKERS):
+        self.agent = agent
+        self.worker_count = max(1, workers)
+        self.queue: "asyncio.Queue[str]" = asyncio.Queue()
+        self.jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._workers = []
+
+    async def start(self):
+        await self.agent.open_sessions()
+        self._workers = [
+            asyncio.create_task(self._worker()) for _ in range(self.worker_count)
+        ]
+
+    async def stop(self):
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        await self.agent.close_sessions()
+
+    def submit(self, payload: Any) -> Dict[str, Any]:
+        """
+        Queue a report job.
+
+        Raises:
+            ValueError: If the payload is not an object with "start" and "end"
+        """
+        if not isinstance(payload, dict):
+            raise ValueError("request body must be a JSON object")
+        start_date, end_date = payload.get("start"), payload.get("end")
+        if not isinstance(start_date, str) or not isinstance(end_date, str):
+            raise ValueError("'start' and 'end' dates are required")
+
+        job_id = uuid.uuid4().hex
+        self.jobs[job_id] = {
+            "id": job_id,
+            "user": payload.get("user") or DEFAULT_USER,
+            "start": start_date,
+            "end": end_date,
+            "status": "queued",
+            "submitted_at": time.time(),
+        }
+        self._evict_finished()
+        self.queue.put_nowait(job_id)
+        return self.jobs[job_id]
+
+    def _evict_finished(self):
+        # Oldest finished jobs go first; queued and running jobs are kept
+        excess = len(self.jobs) - MAX_RETAINED_JOBS
+        for job_id in list(self.jobs):
+            if excess <= 0:
+                break
+            if self.jobs[job_id]["status"] in ("done", "error"):
+                del self.jobs[job_id]
+                excess -= 1
+
+    async def _worker(self):
+        while True:
+            job_id = await self.queue.get()
+            job = self.jobs.get(job_id)
+            try:
+                if job is not None:
+                    await self._run(job)
+            finally:
+                self.queue.task_done()
+
+    async def _run(self, job: Dict[str, Any]):
+        job["status"] = "running"
+        job["started_at"] = time.time()
+        try:
+            job["report"] = await self.agent.generate_report(
+                job["start"],
+                job["end"],
+                output_path=os.path.join("reports", "service", f"{job['id']}.json"),
+                emit_stdout=False,
+                user=job["user"],
+            )
+            job["status"] = "done"
+        except Exception as e:
+            job["status"] = "error"
+            job["error"] = str(e)
+        job["finished_at"] = time.time()
+
+    async def handle(
+        self, method: str, path: str, body: bytes
+    ) -> Tuple[int, Dict[str, Any]]:
+        """Route a request to (status code, JSON payload)"""
+        path = path.split("?", 1)[0].rstrip("/") or "/"
+
+        if path == "/health":
+            if method != "GET":
+                return 405, {"error": "use GET"}
+            return 200, {
+                "status": "ok",
+                "queued": self.queue.qsize(),
+                "workers": self.worker_count,
+                "jobs": len(self.jobs),
+            }
+
+        if path == "/reports":
+            if method != "POST":
+                return 405, {"error": "use POST"}
+            try:
+                job = self.submit(json.loads(body or b"null"))
+            except (ValueError, UnicodeDecodeError) as e:
+                return 400, {"error": str(e)}
+            return 202, {"id": job["id"], "status": job["status"]}
+
+        if path.startswith("/reports/"):
+            if method != "GET":
+                return 405, {"error": "use GET"}
+            job = self.jobs.get(path[len("/reports/") :])
+            if job is None:
+                return 404, {"error": "unknown report id"}
+            return 200, job
+
+        return 404, {"error": f"no route for {path}"}
+
+    async def handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ):
+        """Serve one HTTP/1.1 request and close the connection"""
+        try:
+            status, payload = await self._read_and_handle(reader)
+        except Exception as e:
+            status, payload = 500, {"error": str(e)}
+
+        body = json.dumps(payload).encode()
+        writer.write(
+            (
+                f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                "Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "Connection: close\r\n\r\n"
+            ).encode()
+            + body
+        )
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def _read_and_handle(self, reader) -> Tuple[int, Dict[str, Any]]:
+        request_line = (await reader.readline()).decode("latin-1").split()
+        if len(request_line) != 3:
+            return 400, {"error": "malformed request line"}
+        method, path, _ = request_line
+
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode("latin-1").strip()
+            if not line:
+                break
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        # Digits only: int() would also take signs, spaces and underscores
+        raw_length = headers.get("content-length") or "0"
+        if not (raw_length.isascii() and raw_length.isdigit()):
+            return 400, {"error": f"invalid Content-Length: {raw_length!r}"}
+        length = int(raw_length)
+        if length > MAX_BODY_BYTES:
+            return 413, {"error": "request body too large"}
+        try:
+            body = await reader.readexactly(length) if length else b""
+        except asyncio.IncompleteReadError:
+            return 400, {"error": "request body shorter than Content-Length"}
+        return await self.handle(method.upper(), path, body)
+
+
+async def serve(
+    agent,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    workers: int = DEFAULT_WORKERS,
+    ready: Optional[asyncio.Event] = None,
+):
+    """Run the service until cancelled"""
+    service = ReportService(agent, workers)
+    await service.start()
+    server = await asyncio.start_server(service.handle_connection, host, port)
+    print(f"🛰️ OOO report service listening on http://{host}:{port}")
+    if ready is not None:
+        ready.set()
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.stop()
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="OOO Summarizer report service")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    add_agent_arguments(parser)
+    args = parser.parse_args()
+
+    agent = OOOSummarizerAgent(**agent_kwargs(args))
+    await serve(agent, args.host, args.port, args.workers)
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print("\n⚠️ Shutting down")
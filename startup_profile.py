@@ -0,0 +1,135 @@
+"""
+Startup profiling for the CLI path
+
+`python main.py --profile-startup [flags]` re-runs main.py with the same
+agent flags under PYTHONPROFILEIMPORTTIME (the environment form of
+`-X importtime`), which the MCP server subprocesses inherit through the
+server config. The probe run builds the agent, opens its sessions and makes
+one small direct tool call, so the report covers everything up to the first
+tool call without an LLM round-trip. Import timings from the parent and
+every server are aggregated into one breakdown.
+"""
+
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, NamedTuple, Sequence
+
+PROBE_FLAG = "--startup-probe"
+TOP_N = 15
+
+# "import time:       412 |       1840 |   langchain_core.messages"
+_IMPORTTIME_LINE = re.compile(r"^import time:\s*(\d+) \|\s*(\d+) \|( *)(\S+)\s*$")
+
+
+class ImportTiming(NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(text: str) -> List[ImportTiming]:
+    """Parse `-X importtime` output, ignoring any other lines"""
+    timings = []
+    for line in text.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            # Nested imports are indented two spaces per level below the first
+            timings.append(
+                ImportTiming(
+                    module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2
+                )
+            )
+    return timings
+
+
+def aggregate(timings: Sequence[ImportTiming], top: int = TOP_N) -> Dict[str, Any]:
+    """
+    Summarize import timings across processes.
+
+    Returns:
+        Total import time, the top packages by self time (a package's
+        submodules included) and the slowest top-level imports by cumulative
+        time, all in milliseconds
+    """
+    by_package: Dict[str, int] = defaultdict(int)
+    top_level: Dict[str, int] = defaultdict(int)
+    for timing in timings:
+        by_package[timing.module.split(".")[0]] += timing.self_us
+        if timing.depth == 0:
+            top_level[timing.module] += timing.cumulative_us
+
+    def ranked(totals, key):
+        return [
+            {key: name, "ms": round(us / 1000, 1)}
+            for name, us in sorted(totals.items(), key=lambda kv: -kv[1])[:top]
+        ]
+
+    return {
+        "import_total_ms": round(sum(t.self_us for t in timings) / 1000, 1),
+        "modules_imported": len(timings),
+        "by_package": ranked(by_package, "package"),
+        "top_level_imports": ranked(top_level, "module"),
+    }
+
+
+async def probe_first_tool_call(agent) -> None:
+    """Open the agent's sessions, make one tool call and report when it returned"""
+    await agent.open_sessions()
+    try:
+        await agent.mcp_client.get_session("email").connector.call_tool(
+            "get_emails",
+            {"start_date": "2024-01-01", "end_date": "2024-01-01", "page_size": 1},
+        )
+        print(json.dumps({"first_tool_call_at": time.time()}), flush=True)
+    finally:
+        await agent.close_sessions()
+
+
+def profile_startup(flags: Sequence[str], script: str = "main.py") -> Dict[str, Any]:
+    """
+    Run the probe with import timing enabled and aggregate the results.
+
+    Args:
+        flags: Agent flags to run the probe with (e.g. ["--in-process"])
+        script: Entry point to profile
+
+    Raises:
+        RuntimeError: If the probe exits unsuccessfully
+    """
+    env = {**os.environ, "PYTHONPROFILEIMPORTTIME": "1"}
+    # The probe never calls the LLM, but the agent refuses to start without a key
+    env.setdefault("OPENAI_API_KEY", "startup-profile")
+
+    started = time.time()
+    result = subprocess.run(
+        [sys.executable, script, PROBE_FLAG, *flags],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    finished = time.time()
+
+    reached = None
+    for line in result.stdout.splitlines():
+        if line.startswith('{"first_tool_call_at"'):
+            reached = json.loads(line)["first_tool_call_at"]
+    if result.returncode != 0 or reached is None:
+        raise RuntimeError(
+            f"startup probe failed with exit code {result.returncode}: "
+            f"{result.stderr[-2000:]}"
+        )
+
+    timings = parse_importtime(result.stderr)
+    return {
+        "flags": list(flags),
+        "time_to_first_tool_call_s": round(reached - started, 3),
+        "wall_s": round(finished - started, 3),
+        **aggregate(timings),
+    }
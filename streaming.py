@@ -0,0 +1,163 @@
+"""
+Urgent report items from a streaming LLM response
+
+With --stream, the action item and priority prompts are answered token by
+token instead of all at once. PriorityItemParser follows the JSON as it
+arrives and hands back each item of a "P0" list as soon as its closing
+brace does, long before the response is complete. PartialReport announces
+those items (stdout, or a progress event under --progress) and keeps the
+report file up to date with them until the full report replaces it.
+"""
+
+import json
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+from progress import emit
+
+URGENT_PRIORITY = "P0"
+
+Path = Tuple[str, ...]
+
+
+class PriorityItemParser:
+    """
+    Incremental scanner for the items of one priority in a JSON response.
+
+    feed() takes the response a chunk at a time and returns the items
+    completed by that chunk, each with the keys leading to its list (e.g.
+    ("action_items", "P0") or ("updates", "slack", "P0")). Text before the
+    first "{" (prose, a ```json fence) and after the top-level object closes
+    is ignored. Every character is looked at once, so feeding a response
+    costs time linear in its length however it is chunked.
+    """
+
+    def __init__(self, priority: str = URGENT_PRIORITY):
+        self.priority = priority
+        # One [bracket, current key, expecting a key] per open object or array
+        self._stack: List[list] = []
+        self._in_string = False
+        self._escaped = False
+        # Characters of the object key being read, if the string is one
+        self._key: Optional[List[str]] = None
+        # Chunks of the item being captured, once its "{" has been seen
+        self._item: Optional[List[str]] = None
+        self._item_depth = 0
+        self._done = False
+
+    def _path(self) -> Path:
+        return tuple(frame[1] for frame in self._stack if frame[0] == "{")
+
+    def _in_priority_list(self) -> bool:
+        return (
+            len(self._stack) >= 2
+            and self._stack[-1][0] == "["
+            and self._stack[-2][1] == self.priority
+        )
+
+    def feed(self, text: str) -> List[Tuple[Path, Dict[str, Any]]]:
+        """Consume the next chunk of the response and return completed items"""
+        completed = []
+        item_start = 0
+        for index, char in enumerate(text):
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._key is not None:
+                        self._stack[-1][1] = self._decode_key("".join(self._key))
+                        self._key = None
+                    continue
+                if self._key is not None:
+                    self._key.append(char)
+                continue
+
+            if self._done or (not self._stack and char != "{"):
+                continue
+            if char == '"':
+                self._in_string = True
+                frame = self._stack[-1]
+                if frame[0] == "{" and frame[2]:
+                    self._key = []
+                    frame[2] = False
+            elif char in "{[":
+                if char == "{" and self._item is None and self._in_priority_list():
+                    self._item = []
+                    item_start = index
+                    self._item_depth = len(self._stack)
+                self._stack.append([char, None, char == "{"])
+            elif char in "}]":
+                self._stack.pop()
+                if self._item is not None and len(self._stack) == self._item_depth:
+                    self._item.append(text[item_start : index + 1])
+                    item = self._parse_item("".join(self._item))
+                    if item is not None:
+                        completed.append((self._path(), item))
+                    self._item = None
+                self._done = not self._stack
+            elif char == "," and self._stack[-1][0] == "{":
+                self._stack[-1][2] = True
+
+        if self._item is not None:
+            # The item continues in the next chunk
+            self._item.append(text[item_start:])
+        return completed
+
+    @staticmethod
+    def _decode_key(raw: str) -> str:
+        try:
+            return json.loads(f'"{raw}"')
+        except json.JSONDecodeError:
+            return raw
+
+    @staticmethod
+    def _parse_item(text: str) -> Optional[Dict[str, Any]]:
+        try:
+            item = json.loads(text)
+        except json.JSONDecodeError:
+            return None
+        return item if isinstance(item, dict) else None
+
+
+class PartialReport:
+    """The urgent items seen so far, announced and written as they arrive"""
+
+    def __init__(self, output_path: str):
+        self.output_path = output_path
+        self.report: Dict[str, Any] = {"partial": True}
+        self.count = 0
+        self._seen = set()
+
+    def feed(self, parser: PriorityItemParser, text: str) -> None:
+        """Pass the next chunk of a response through its parser"""
+        for path, item in parser.feed(text):
+            self.add(path, item)
+
+    def add(self, path: Path, item: Dict[str, Any]) -> None:
+        """Record one streamed item, print or emit it and rewrite the file"""
+        key = (path, item.get("id") or json.dumps(item, sort_keys=True))
+        if key in self._seen:
+            return
+        self._seen.add(key)
+
+        bucket = self.report
+        for name in path[:-1]:
+            bucket = bucket.setdefault(name, {})
+        bucket.setdefault(path[-1], []).append(item)
+        self.count += 1
+
+        print(f"🚨 {path[-1]} {'/'.join(path[:-1])}: {item.get('title', item)}")
+        emit("priority_item", path=list(path), item=item)
+        self.write()
+
+    def write(self) -> None:
+        """Replace the report file with the items so far"""
+        os.makedirs(os.path.dirname(self.output_path) or ".", exist_ok=True)
+        partial_path = f"{self.output_path}.partial"
+        with open(partial_path, "w") as f:
+            json.dump(self.report, f, indent=2)
+        # Readers never see a half-written file
+        os.replace(partial_path, self.output_path)
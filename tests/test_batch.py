@@ -0,0 +1,71 @@
+"""
+Tests for the batch report runner
+"""
+
+import asyncio
+
+import pytest
+
+from batch import load_jobs, run_batch
+from benchmarks.fake_llm import FakeAgent
+
+
+class TestBatch:
+    """Test class for job loading and concurrent execution"""
+
+    def test_load_jobs_fills_defaults(self, tmp_path):
+        """Verify ids, users and output paths are defaulted and blank lines skipped"""
+        path = tmp_path / "jobs.jsonl"
+        path.write_text(
+            '{"user": "jane", "start": "2024-01-01", "end": "2024-01-03"}\n'
+            "\n"
+            '{"id": "q1", "start": "2024-02-01", "end": "2024-02-14", '
+            '"output": "out/q1.json"}\n'
+        )
+
+        jobs = load_jobs(str(path))
+
+        assert [job["id"] for job in jobs] == ["1", "q1"]
+        assert jobs[0]["user"] == "jane"
+        assert jobs[0]["output"].endswith("1_jane_2024-01-01_2024-01-03.json")
+        assert jobs[1]["output"] == "out/q1.json"
+
+    def test_load_jobs_rejects_incomplete_lines(self, tmp_path):
+        """Verify a job without dates is reported with its line number"""
+        path = tmp_path / "jobs.jsonl"
+        path.write_text('{"start": "2024-01-01", "end": "2024-01-03"}\n{"user": "x"}\n')
+
+        with pytest.raises(ValueError, match=":2:"):
+            load_jobs(str(path))
+
+    def test_run_batch_shares_sessions_and_limits_concurrency(self):
+        """Verify sessions open once, jobs respect the limit and failures are recorded"""
+        jobs = [
+            {
+                "id": str(i),
+                "user": "u",
+                "start": f"2024-01-0{i}",
+                "end": "e",
+                "output": f"o{i}",
+            }
+            for i in range(1, 7)
+        ]
+        agent = FakeAgent(fail_on={"2024-01-03"})
+
+        summary = asyncio.run(run_batch(agent, jobs, concurrency=2))
+
+        assert agent.events == ["open"] + ["report"] * 6 + ["close"]
+        assert agent.max_running == 2
+        assert all(call["emit_stdout"] is False for call in agent.calls)
+        assert summary["jobs"] == 6
+        assert summary["failed"] == 1
+        assert [result["id"] for result in summary["results"]] == [
+            "1",
+            "2",
+            "3",
+            "4",
+            "5",
+            "6",
+        ]
+        assert summary["results"][2]["status"] == "error"
+        assert summary["results"][2]["error"] == "report for 2024-01-03 failed"
@@ -0,0 +1,98 @@
+"""
+Tests for the seed bulk loader
+"""
+
+import sqlite3
+
+from data.bulk_loader import MESSAGE_COLUMNS, bulk_insert
+from mcp_servers.migrations import MIGRATIONS, applied_version, migrate
+
+CREATE_MESSAGES = """
+    CREATE TABLE IF NOT EXISTS messages (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        custom_id TEXT UNIQUE,
+        channel TEXT NOT NULL,
+        user TEXT NOT NULL,
+        message TEXT NOT NULL,
+        timestamp TEXT NOT NULL,
+        is_mention BOOLEAN DEFAULT 0,
+        thread_id TEXT
+    )
+"""
+
+
+def _messages(start, stop, text="standup notes"):
+    return [
+        (f"slack_{n:03d}", "#general", "alice", f"{text} {n}", "2024-01-02 09:00:00")
+        + (0, None)
+        for n in range(start, stop)
+    ]
+
+
+def _schema(path):
+    conn = sqlite3.connect(path)
+    rows = conn.execute("SELECT type, name, sql FROM sqlite_master ORDER BY name")
+    schema = rows.fetchall()
+    conn.close()
+    return schema
+
+
+class TestBulkInsert:
+    """Test class for bulk_insert"""
+
+    def test_inserts_in_batches_and_reports_rows(self, tmp_path):
+        """Verify every row lands when the load spans several batches"""
+        db_path = str(tmp_path / "slack.db")
+
+        stats = bulk_insert(
+            db_path,
+            "messages",
+            MESSAGE_COLUMNS,
+            iter(_messages(0, 25)),
+            batch_size=10,
+            create_sql=CREATE_MESSAGES,
+        )
+
+        assert stats.table == "messages"
+        assert stats.rows == 25
+        assert stats.rows_per_second > 0
+        conn = sqlite3.connect(db_path)
+        assert conn.execute("SELECT COUNT(*) FROM messages").fetchone()[0] == 25
+        conn.close()
+
+    def test_skips_existing_custom_ids(self, tmp_path):
+        """Verify re-seeding only counts and inserts new rows"""
+        db_path = str(tmp_path / "slack.db")
+        bulk_insert(
+            db_path,
+            "messages",
+            MESSAGE_COLUMNS,
+            _messages(0, 10),
+            create_sql=CREATE_MESSAGES,
+        )
+
+        stats = bulk_insert(db_path, "messages", MESSAGE_COLUMNS, _messages(5, 15))
+
+        assert stats.rows == 5
+
+    def test_restores_migrated_schema_and_rebuilds_fts(self, tmp_path):
+        """Verify indexes and triggers survive the load and FTS sees new rows"""
+        db_path = str(tmp_path / "slack.db")
+        bulk_insert(
+            db_path, "messages", MESSAGE_COLUMNS, _messages(0, 5), None, CREATE_MESSAGES
+        )
+        migrate(db_path, "slack")
+        before = _schema(db_path)
+
+        bulk_insert(
+            db_path, "messages", MESSAGE_COLUMNS, _messages(5, 50, "outage update")
+        )
+
+        assert _schema(db_path) == before
+        conn = sqlite3.connect(db_path)
+        assert applied_version(conn, MIGRATIONS["slack"]) == 2
+        matches = conn.execute(
+            "SELECT COUNT(*) FROM messages_fts WHERE messages_fts MATCH 'outage'"
+        ).fetchone()[0]
+        conn.close()
+        assert matches == 45
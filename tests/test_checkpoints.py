@@ -0,0 +1,223 @@
+"""
+Tests for incremental report checkpoints
+"""
+
+import sqlite3
+
+from checkpoints import (
+    CheckpointStore,
+    advance,
+    collection_since,
+    merge_reports,
+    new_items,
+    processed_items,
+)
+from scoring import filter_collected_data
+
+
+def _item(item_id, source="email"):
+    return {"id": item_id, "title": item_id, "source": source, "context": ""}
+
+
+class TestCheckpoints:
+    """Test class for delta selection, checkpoint storage and report merging"""
+
+    def test_new_items_and_advance(self):
+        """Verify only unprocessed items are kept and the checkpoint moves forward"""
+        collected = {
+            "emails": [
+                {"id": "email_001", "received_date": "2024-01-01 09:00:00"},
+                {"id": "email_002", "received_date": "2024-01-02 09:00:00"},
+            ],
+            "calendar_events": [
+                {"id": "event_001", "start_time": "2024-01-02 10:00:00"}
+            ],
+            "slack_messages": [],
+        }
+        last_seen = {"emails": "2024-01-01 09:00:00"}
+        seen_ids = {"emails": ["email_001"]}
+
+        fresh = new_items(collected, last_seen, seen_ids)
+
+        assert [e["id"] for e in fresh["emails"]] == ["email_002"]
+        assert [e["id"] for e in fresh["calendar_events"]] == ["event_001"]
+        assert advance(last_seen, seen_ids, collected, fresh) == (
+            {"emails": "2024-01-02 09:00:00"},
+            {
+                "emails": ["email_002"],
+                "calendar_events": ["event_001"],
+                "slack_messages": [],
+            },
+        )
+
+    def test_items_at_or_behind_the_checkpoint_are_not_lost(self):
+        """Verify ties at the checkpoint date and late calendar events stay new"""
+        first = {
+            "emails": [{"id": "email_001", "received_date": "2024-01-02 09:00:00"}],
+            "calendar_events": [
+                {"id": "event_002", "start_time": "2024-01-03 10:00:00"}
+            ],
+            "slack_messages": [],
+        }
+        last_seen, seen_ids = advance({}, {}, first, first)
+
+        # Arrived after the first run: same timestamp, and an earlier event
+        second = {
+            "emails": first["emails"]
+            + [{"id": "email_009", "received_date": "2024-01-02 09:00:00"}],
+            "calendar_events": first["calendar_events"]
+            + [{"id": "event_009", "start_time": "2024-01-01 08:00:00"}],
+            "slack_messages": [],
+        }
+        fresh = new_items(second, last_seen, seen_ids)
+
+        assert [e["id"] for e in fresh["emails"]] == ["email_009"]
+        assert [e["id"] for e in fresh["calendar_events"]] == ["event_009"]
+        assert collection_since(last_seen) == {"emails": "2024-01-02 09:00:00"}
+
+        last_seen, seen_ids = advance(last_seen, seen_ids, second, fresh)
+        assert not any(new_items(second, last_seen, seen_ids).values())
+
+    def test_advance_stops_at_unanalyzed_items(self):
+        """Verify items dropped before analysis are offered again"""
+        collected = {
+            "emails": [
+                {"id": "email_001", "received_date": "2024-01-01 09:00:00"},
+                {"id": "email_002", "received_date": "2024-01-02 09:00:00"},
+                {"id": "email_003", "received_date": "2024-01-03 09:00:00"},
+            ],
+            "calendar_events": [
+                {"id": "event_001", "start_time": "2024-01-02 10:00:00"},
+                {"id": "event_002", "start_time": "2024-01-01 10:00:00"},
+            ],
+            "slack_messages": [],
+        }
+        # email_002 and event_002 were cut to fit the token budget
+        analyzed = {
+            "emails": [collected["emails"][0], collected["emails"][2]],
+            "calendar_events": [collected["calendar_events"][0]],
+        }
+
+        last_seen, seen_ids = advance({}, {}, collected, analyzed)
+        fresh = new_items(collected, last_seen, seen_ids)
+
+        assert last_seen == {"emails": "2024-01-02 09:00:00"}
+        assert [e["id"] for e in fresh["emails"]] == ["email_002"]
+        assert [e["id"] for e in fresh["calendar_events"]] == ["event_002"]
+
+    def test_early_noise_does_not_hold_the_checkpoint_back(self):
+        """Verify prefiltered noise counts as processed and only budget cuts wait"""
+        collected = {
+            "emails": [
+                {
+                    "id": "email_001",
+                    "subject": "Happy New Year party and team lunch",
+                    "body": "Reminder: coffee and cake",
+                    "received_date": "2024-02-01 08:00:00",
+                },
+                {
+                    "id": "email_002",
+                    "subject": "URGENT: production outage",
+                    "body": "Critical incident, need a decision asap",
+                    "received_date": "2024-02-01 10:00:00",
+                },
+                {
+                    "id": "email_003",
+                    "subject": "Security deadline",
+                    "body": "Blocked until you sign off",
+                    "received_date": "2024-02-02 09:00:00",
+                },
+            ],
+            "calendar_events": [],
+            "slack_messages": [],
+        }
+        filtered, dropped = filter_collected_data(collected)
+        assert dropped["emails"] == 1
+        assert "email_001" not in [e["id"] for e in filtered["emails"]]
+
+        # One run, nothing cut for the token budget
+        last_seen, seen_ids = advance({}, {}, collected, processed_items(collected))
+        assert collection_since(last_seen) == {"emails": "2024-02-02 09:00:00"}
+        assert not any(new_items(collected, last_seen, seen_ids).values())
+
+        # email_002 cut for the budget: the checkpoint waits for it, not the noise
+        processed = processed_items(collected, {"emails": ["email_002"]})
+        last_seen, seen_ids = advance({}, {}, collected, processed)
+        assert collection_since(last_seen) == {"emails": "2024-02-01 10:00:00"}
+        fresh = new_items(collected, last_seen, seen_ids)
+        assert [e["id"] for e in fresh["emails"]] == ["email_002"]
+
+    def test_store_round_trip(self, tmp_path):
+        """Verify checkpoints persist per user and start date"""
+        path = str(tmp_path / "checkpoints.db")
+        store = CheckpointStore(path)
+        report = {"summary": "s", "action_items": {}, "updates": {}}
+        store.save("john.doe", "2024-01-01", "2024-01-03", {"emails": "x"}, report)
+        store.close()
+
+        reopened = CheckpointStore(path)
+        checkpoint = reopened.load("john.doe", "2024-01-01")
+
+        assert checkpoint.last_seen == {"emails": "x"}
+        assert checkpoint.seen_ids == {}
+        assert checkpoint.end_date == "2024-01-03"
+        assert checkpoint.report == report
+        assert reopened.load("john.doe", "2024-01-07") is None
+        assert reopened.load("jane.doe", "2024-01-01") is None
+
+    def test_store_upgrades_checkpoints_without_seen_ids(self, tmp_path):
+        """Verify a checkpoint database from before seen_ids gains the column"""
+        path = str(tmp_path / "checkpoints.db")
+        conn = sqlite3.connect(path)
+        conn.execute(
+            "CREATE TABLE checkpoints (user TEXT NOT NULL, start_date TEXT NOT NULL, "
+            "end_date TEXT NOT NULL, last_seen TEXT NOT NULL, report TEXT NOT NULL, "
+            "updated_at REAL NOT NULL, PRIMARY KEY (user, start_date))"
+        )
+        conn.execute(
+            "INSERT INTO checkpoints VALUES "
+            "('u', '2024-01-01', '2024-01-03', '{\"emails\": \"x\"}', '{}', 0)"
+        )
+        conn.commit()
+        conn.close()
+
+        store = CheckpointStore(path)
+        assert store.load("u", "2024-01-01").seen_ids == {}
+
+        store.save("u", "2024-01-01", "2024-01-03", {}, {}, {"emails": ["email_001"]})
+        assert store.load("u", "2024-01-01").seen_ids == {"emails": ["email_001"]}
+
+    def test_merge_reports_by_id(self):
+        """Verify new items are added and re-triaged items move priority"""
+        previous = {
+            "summary": "old",
+            "action_items": {
+                "P0": [_item("email_001")],
+                "P1": [_item("email_002")],
+                "P2": [],
+            },
+            "updates": {
+                "email": {"P0": [_item("email_001")], "P1": []},
+                "slack": {"P0": [], "P1": []},
+            },
+        }
+        new = {
+            "summary": "new",
+            "action_items": {"P0": [_item("email_002")], "P1": [], "P2": []},
+            "updates": {
+                "email": {"P0": [], "P1": []},
+                "calendar": {"P0": [_item("event_009", "calendar")], "P1": []},
+            },
+        }
+
+        merged = merge_reports(previous, new)
+
+        assert merged["summary"] == "new"
+        assert [i["id"] for i in merged["action_items"]["P0"]] == [
+            "email_001",
+            "email_002",
+        ]
+        assert merged["action_items"]["P1"] == []
+        assert [i["id"] for i in merged["updates"]["email"]["P0"]] == ["email_001"]
+        assert list(merged["updates"]) == ["email", "slack", "calendar"]
+        assert [i["id"] for i in merged["updates"]["calendar"]["P0"]] == ["event_009"]
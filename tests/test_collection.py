@@ -0,0 +1,81 @@
+"""
+Tests for direct (non-agentic) data collection over MCP sessions
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from collection import COLLECTION_TOOLS, collect_data
+
+
+class FakeConnector:
+    """Connector serving canned pages, recording every call"""
+
+    def __init__(self, pages, is_error=False):
+        self.pages = pages
+        self.is_error = is_error
+        self.calls = []
+
+    async def call_tool(self, name, arguments):
+        self.calls.append((name, arguments))
+        page = self.pages[len(self.calls) - 1]
+        text = page if isinstance(page, str) else json.dumps(page)
+        return SimpleNamespace(
+            content=[SimpleNamespace(text=text)], isError=self.is_error
+        )
+
+
+class FakeClient:
+    def __init__(self, connectors):
+        self.connectors = connectors
+
+    def get_session(self, server_name):
+        return SimpleNamespace(connector=self.connectors[server_name])
+
+
+class TestCollection:
+    """Test class for direct collection"""
+
+    def test_collects_every_source_and_follows_cursors(self):
+        """Verify all three tools are called and later pages are fetched"""
+        connectors = {
+            "email": FakeConnector(
+                [
+                    {"items": [{"id": "email_002"}], "next_cursor": "abc"},
+                    {"items": [{"id": "email_001"}], "next_cursor": None},
+                ]
+            ),
+            "calendar": FakeConnector([{"items": [{"id": "event_001"}]}]),
+            "slack": FakeConnector([{"items": [], "next_cursor": None}]),
+        }
+
+        data = asyncio.run(
+            collect_data(FakeClient(connectors), "2024-01-01", "2024-01-03")
+        )
+
+        assert list(data) == list(COLLECTION_TOOLS)
+        assert [e["id"] for e in data["emails"]] == ["email_002", "email_001"]
+        assert [e["id"] for e in data["calendar_events"]] == ["event_001"]
+        assert data["slack_messages"] == []
+
+        first, second = connectors["email"].calls
+        assert first[0] == "get_emails"
+        assert first[1]["start_date"] == "2024-01-01"
+        assert "cursor" not in first[1]
+        assert second[1]["cursor"] == "abc"
+
+    def test_tool_error_raises(self):
+        """Verify an error result is surfaced instead of parsed"""
+        connectors = {
+            "email": FakeConnector(["database is locked"], is_error=True),
+            "calendar": FakeConnector([{"items": []}]),
+            "slack": FakeConnector([{"items": []}]),
+        }
+
+        with pytest.raises(RuntimeError, match="email.get_emails"):
+            asyncio.run(
+                collect_data(FakeClient(connectors), "2024-01-01", "2024-01-03")
+            )
@@ -0,0 +1,121 @@
+"""
+Tests for the sweep-line calendar conflict detector
+"""
+
+import json
+import os
+import random
+import sqlite3
+from itertools import combinations
+
+import pytest
+
+from mcp_servers.conflicts import find_overlaps, group_conflicts
+from mcp_servers.db import DATA_DIR
+
+
+def _event(event_id, start, end):
+    return {
+        "id": event_id,
+        "start_time": f"2024-02-01 {start}",
+        "end_time": f"2024-02-01 {end}",
+    }
+
+
+def _brute_force_pairs(events):
+    return {
+        tuple(sorted((a["id"], b["id"])))
+        for a, b in combinations(events, 2)
+        if a["start_time"] < b["end_time"] and a["end_time"] > b["start_time"]
+    }
+
+
+class TestConflicts:
+    """Test class for overlap detection and clustering"""
+
+    def test_each_overlap_reported_once(self):
+        """Verify overlapping pairs are returned once, earlier event first"""
+        events = [
+            _event("event_001", "09:00", "10:00"),
+            _event("event_002", "09:30", "11:00"),
+            _event("event_003", "10:00", "10:30"),
+            _event("event_004", "11:00", "12:00"),
+        ]
+
+        pairs = [(a["id"], b["id"]) for a, b in find_overlaps(events)]
+
+        assert pairs == [("event_001", "event_002"), ("event_002", "event_003")]
+
+    def test_matches_brute_force(self):
+        """Verify the sweep finds exactly the pairs a quadratic scan finds"""
+        rng = random.Random(7)
+        events = []
+        for i in range(200):
+            start = rng.randint(0, 600)
+            end = start + rng.randint(0, 90)
+            events.append(
+                _event(
+                    f"event_{i:03d}",
+                    f"{start // 60:02d}:{start % 60:02d}",
+                    f"{end // 60:02d}:{end % 60:02d}",
+                )
+            )
+        events.sort(key=lambda e: e["start_time"])
+
+        found = [tuple(sorted((a["id"], b["id"]))) for a, b in find_overlaps(events)]
+
+        assert len(found) == len(set(found))
+        assert set(found) == _brute_force_pairs(events)
+
+    def test_group_conflicts_into_clusters(self):
+        """Verify transitively overlapping events form one cluster"""
+        events = [
+            _event("event_001", "09:00", "10:00"),
+            _event("event_002", "09:30", "11:00"),
+            _event("event_003", "10:30", "11:30"),
+            _event("event_004", "12:00", "13:00"),
+            _event("event_005", "14:00", "15:00"),
+            _event("event_006", "14:30", "14:45"),
+        ]
+
+        clusters = group_conflicts(events)
+
+        assert [[e["id"] for e in c["events"]] for c in clusters] == [
+            ["event_001", "event_002", "event_003"],
+            ["event_005", "event_006"],
+        ]
+        assert clusters[0]["end_time"] == "2024-02-01 11:30"
+
+
+class TestGetConflictsTool:
+    """Test class for the calendar server's get_conflicts entries"""
+
+    @pytest.mark.skipif(
+        not os.path.exists(os.path.join(DATA_DIR, "calendar.db")),
+        reason="seeded databases not found",
+    )
+    @pytest.mark.parametrize("group", [False, True])
+    def test_events_keep_the_integer_id_next_to_custom_id(self, group):
+        """Verify conflict entries identify events by row id and custom_id"""
+        from mcp_servers.calendar_server import get_conflicts
+
+        page = json.loads(
+            get_conflicts("2024-01-01", "2024-12-31", group=group, output_format="json")
+        )
+        if group:
+            events = [event for cluster in page["items"] for event in cluster["events"]]
+        else:
+            events = [
+                conflict[key]
+                for conflict in page["items"]
+                for key in ("event1", "event2")
+            ]
+
+        assert events
+        conn = sqlite3.connect(os.path.join(DATA_DIR, "calendar.db"))
+        rows = dict(conn.execute("SELECT id, custom_id FROM events").fetchall())
+        conn.close()
+        for event in events:
+            assert list(event) == ["id", "custom_id", "title", "start_time", "end_time"]
+            assert isinstance(event["id"], int)
+            assert rows[event["id"]] == event["custom_id"]
@@ -0,0 +1,51 @@
+"""
+Tests for MCP tool output encodings
+"""
+
+import json
+
+import pytest
+
+from mcp_servers.encoding import render_page
+
+ITEMS = [
+    {
+        "id": "email_001",
+        "subject": "URGENT: API down",
+        "body": "Production API is down",
+    },
+    {"id": "email_002", "subject": "Lunch", "body": "Pizza on Friday"},
+]
+
+
+class TestEncoding:
+    """Test class for tool output formats"""
+
+    def test_compact_matches_json_content(self):
+        """Verify compact output carries the same data without whitespace"""
+        pretty = render_page(ITEMS, "abc", "json")
+        compact = render_page(ITEMS, "abc", "compact")
+
+        assert json.loads(compact) == json.loads(pretty)
+        assert len(compact) < len(pretty)
+        assert "\n" not in compact
+
+    def test_columnar_layout(self):
+        """Verify columnar output lists field names once and one row per item"""
+        payload = json.loads(render_page(ITEMS, None, "columnar"))
+
+        assert payload["columns"] == ["id", "subject", "body"]
+        assert payload["rows"][1] == ["email_002", "Lunch", "Pizza on Friday"]
+        assert payload["next_cursor"] is None
+
+    def test_max_chars_truncates_text_fields_only(self):
+        """Verify long free-text fields are shortened and other fields are kept"""
+        payload = json.loads(render_page(ITEMS, None, "compact", max_chars=10))
+
+        assert payload["items"][0]["body"] == "Product..."
+        assert payload["items"][0]["subject"] == "URGENT: API down"
+
+    def test_unknown_format_rejected(self):
+        """Verify unsupported formats raise ValueError"""
+        with pytest.raises(ValueError):
+            render_page(ITEMS, None, "xml")
@@ -0,0 +1,206 @@
+"""
+Tests for the synthetic data generator
+"""
+
+import asyncio
+import json
+import os
+import sqlite3
+from datetime import date
+
+import pytest
+
+from benchmarks.fake_llm import FakeChatModel
+from collection import call_tool_pages, collect_data
+from data import generate_data
+from data.generate_data import SOURCES, Config, generate
+from scoring import IMPORTANT_SENDERS, NOISE_PATTERN, SOURCE_FIELDS, URGENT_PATTERN
+
+
+def _config(**overrides):
+    values = dict(
+        start=date(2024, 3, 1),
+        days=2,
+        users=20,
+        emails_per_day=100,
+        events_per_day=20,
+        messages_per_day=150,
+        noise_ratio=0.8,
+        thread_depth=4,
+        channels=5,
+        conflict_density=0.1,
+        seed=7,
+        prefix="gen_",
+    )
+    values.update(overrides)
+    return Config(**values)
+
+
+def _generate(directory, config, **kwargs):
+    """Generate into directory and return the ground truth"""
+    truth = os.path.join(directory, "truth.json")
+    generate(config, str(directory), truth=truth, **kwargs)
+    with open(truth) as f:
+        return json.load(f)
+
+
+def _rows(directory, filename, table):
+    """Rows of a generated table as dicts, in insertion order"""
+    conn = sqlite3.connect(os.path.join(directory, filename))
+    conn.row_factory = sqlite3.Row
+    try:
+        rows = conn.execute(f"SELECT * FROM {table} ORDER BY id").fetchall()
+    finally:
+        conn.close()
+    return [dict(row) for row in rows]
+
+
+def _overlaps_previous(events):
+    """Events starting before the previous event on the same day ends"""
+    return [
+        event
+        for previous, event in zip(events, events[1:])
+        if event["start_time"][:10] == previous["start_time"][:10]
+        and event["start_time"] < previous["end_time"]
+    ]
+
+
+def _overlapping_pairs(events):
+    """custom_id pairs of every two events that overlap"""
+    return {
+        (first["custom_id"], second["custom_id"])
+        for index, first in enumerate(events)
+        for second in events[index + 1 :]
+        if first["start_time"] < second["end_time"]
+        and second["start_time"] < first["end_time"]
+    }
+
+
+class TestGenerateData:
+    """Test class for generated rows and their ground truth"""
+
+    def test_same_seed_generates_the_same_rows(self, tmp_path):
+        """Verify a seed reproduces every table and another seed does not"""
+        for name, seed in (("first", 7), ("again", 7), ("other", 8)):
+            _generate(tmp_path / name, _config(seed=seed))
+
+        for _, filename, table, _ in SOURCES:
+            first = _rows(tmp_path / "first", filename, table)
+            assert first
+            assert _rows(tmp_path / "again", filename, table) == first
+            assert _rows(tmp_path / "other", filename, table) != first
+
+    def test_every_row_is_labelled_exactly_once(self, tmp_path):
+        """Verify important_ids and noise_ids partition the generated rows"""
+        truth = _generate(tmp_path, _config())
+
+        for key, filename, table, _ in SOURCES:
+            ids = [row["custom_id"] for row in _rows(tmp_path, filename, table)]
+            important = truth["important_ids"][key]
+            noise = truth["noise_ids"][key]
+            assert not set(important) & set(noise)
+            assert sorted(important + noise) == sorted(ids)
+
+    def test_noise_ratio_and_conflict_density_are_honored(self, tmp_path):
+        """Verify label shares and deliberate conflicts track the parameters"""
+        config = _config(
+            days=7,
+            emails_per_day=300,
+            events_per_day=40,
+            messages_per_day=300,
+            noise_ratio=0.7,
+            conflict_density=0.15,
+        )
+        truth = _generate(tmp_path, config)
+
+        for key, _, _, _ in SOURCES:
+            noise = len(truth["noise_ids"][key])
+            total = noise + len(truth["important_ids"][key])
+            assert noise / total == pytest.approx(config.noise_ratio, abs=0.06)
+
+        events = _rows(tmp_path, "calendar.db", "events")
+        conflicts = _overlaps_previous(events)
+        assert len(conflicts) / len(events) == pytest.approx(
+            config.conflict_density, abs=0.05
+        )
+        important = set(truth["important_ids"]["calendar_events"])
+        assert all(event["custom_id"] in important for event in conflicts)
+        # Overlaps come only from the deliberate conflicts
+        assert all(important & set(pair) for pair in _overlapping_pairs(events))
+
+    def test_labels_do_not_use_the_scorer_keywords_or_senders(self, tmp_path):
+        """Verify the ground truth is not derived from scoring.py's lists"""
+        _generate(tmp_path, _config())
+
+        for key, filename, table, _ in SOURCES:
+            for row in _rows(tmp_path, filename, table):
+                text = " ".join(str(row[field]) for field in SOURCE_FIELDS[key])
+                assert not URGENT_PATTERN.search(text), text
+                assert not NOISE_PATTERN.search(text), text
+                assert row.get("sender") not in IMPORTANT_SENDERS
+
+    def test_appending_the_same_prefix_is_rejected(self, tmp_path):
+        """Verify a rerun without --fresh fails clearly instead of half-loading"""
+        _generate(tmp_path, _config())
+
+        with pytest.raises(ValueError, match="already has emails with prefix"):
+            generate(_config(), str(tmp_path))
+
+        generate(_config(prefix="more_"), str(tmp_path))
+        emails = _rows(tmp_path, "emails.db", "emails")
+        assert len(emails) == 2 * 2 * 100
+
+    def test_fresh_refuses_the_seeded_databases(self, tmp_path, monkeypatch):
+        """Verify --fresh never deletes the seeded databases"""
+        seeded = tmp_path / "databases"
+        seeded.mkdir()
+        (seeded / "emails.db").write_bytes(b"seeded")
+        monkeypatch.setattr(generate_data, "SEEDED_DIR", str(seeded))
+
+        with pytest.raises(ValueError, match="seeded databases"):
+            generate(_config(), str(seeded), fresh=True)
+
+        assert (seeded / "emails.db").read_bytes() == b"seeded"
+
+    def test_output_loads_through_the_server_tools(self, tmp_path, monkeypatch):
+        """Verify the servers serve every generated row and its conflicts"""
+        from main import OOOSummarizerAgent
+
+        config = _config()
+        truth = _generate(tmp_path, config)
+        monkeypatch.setenv("OOO_DATA_DIR", str(tmp_path))
+        agent = OOOSummarizerAgent(
+            collection_mode="direct", use_cache=False, llm=FakeChatModel()
+        )
+        start_date, end_date = "2024-03-01", "2024-03-03"
+
+        async def collect():
+            await agent.open_sessions()
+            try:
+                collected = await collect_data(agent.mcp_client, start_date, end_date)
+                conflicts = await call_tool_pages(
+                    agent.mcp_client,
+                    "calendar",
+                    "get_conflicts",
+                    {"start_date": start_date, "end_date": end_date},
+                )
+                return collected, conflicts
+            finally:
+                await agent.close_sessions()
+
+        collected, conflicts = asyncio.run(collect())
+
+        for key, _, _, _ in SOURCES:
+            labelled = truth["important_ids"][key] + truth["noise_ids"][key]
+            assert sorted(item["id"] for item in collected[key]) == sorted(labelled)
+
+        events = _rows(tmp_path, "calendar.db", "events")
+        assert conflicts
+        assert {
+            tuple(
+                sorted(
+                    (conflict["event1"]["custom_id"], conflict["event2"]["custom_id"])
+                )
+            )
+            for conflict in conflicts
+        } == _overlapping_pairs(events)
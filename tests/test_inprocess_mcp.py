@@ -0,0 +1,82 @@
+"""
+Tests for the in-process MCP transport
+"""
+
+import asyncio
+import os
+
+import pytest
+
+from mcp_servers.db import DATA_DIR
+from mcp_utils import get_mcp_client
+
+DATABASES = ("emails.db", "calendar.db", "slack.db")
+
+
+class TestInProcessTransport:
+    """Test class for mounting FastMCP servers in process"""
+
+    def test_unknown_transport_is_rejected(self):
+        """Verify get_mcp_client only accepts known transports"""
+        with pytest.raises(ValueError, match="Unsupported MCP transport"):
+            get_mcp_client("carrier-pigeon")
+
+    def test_tool_call_round_trip(self):
+        """Verify a FastMCP tool is reachable without a subprocess"""
+        pytest.importorskip("mcp.shared.memory")
+        from fastmcp import FastMCP
+
+        from inprocess_mcp import InProcessMCPClient
+
+        server = FastMCP("echo-server")
+
+        @server.tool()
+        def echo(text: str) -> str:
+            """Return the text unchanged"""
+            return text
+
+        async def scenario():
+            client = InProcessMCPClient({"echo": server})
+            await client.create_all_sessions()
+            try:
+                connector = client.get_session("echo").connector
+                tools = [tool.name for tool in connector.tools]
+                result = await connector.call_tool("echo", {"text": "hello"})
+                return tools, result
+            finally:
+                await client.close_all_sessions()
+
+        tools, result = asyncio.run(scenario())
+
+        assert tools == ["echo"]
+        assert not result.isError
+        assert result.content[0].text == "hello"
+
+    @pytest.mark.skipif(
+        not all(os.path.exists(os.path.join(DATA_DIR, db)) for db in DATABASES),
+        reason="seeded databases not found",
+    )
+    def test_bundled_servers_reopen_after_closing_in_creation_order(self):
+        """Verify sessions close in any order and the servers serve tools again"""
+        pytest.importorskip("mcp.shared.memory")
+
+        async def scenario():
+            client = get_mcp_client("inprocess")
+            tools = []
+            for _ in range(2):
+                await client.create_all_sessions()
+                tools.append(
+                    {
+                        name: sorted(tool.name for tool in session.connector.tools)
+                        for name, session in client.sessions.items()
+                    }
+                )
+                await client.close_all_sessions()
+            return client, tools
+
+        client, (first, second) = asyncio.run(asyncio.wait_for(scenario(), 60))
+
+        assert second == first
+        assert "get_emails" in first["email"]
+        assert "get_conflicts" in first["calendar"]
+        assert not client.get_all_active_sessions()
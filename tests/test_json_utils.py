@@ -0,0 +1,71 @@
+"""
+Tests for JSON extraction from LLM output
+"""
+
+import json
+
+import pytest
+
+import json_utils
+from json_utils import extract_json, find_json
+
+REPORT = {
+    "summary": "Quiet week",
+    "action_items": {"P0": [{"id": "email_001", "details": {"owner": "ana"}}]},
+}
+
+
+class TestExtractJson:
+    """Test class for extract_json and find_json"""
+
+    def test_fenced_block_keeps_nested_objects(self):
+        """Verify a fenced report parses whole rather than at the first brace"""
+        text = "Here you go:\n```json\n" + json.dumps(REPORT, indent=2) + "\n```\n"
+
+        assert extract_json(text) == REPORT
+
+    def test_prose_around_an_unfenced_object(self):
+        """Verify leading and trailing prose, including braces, is ignored"""
+        text = (
+            "Using the {date} range I found: "
+            + json.dumps(REPORT)
+            + "\nLet me know if you need more. {end}"
+        )
+
+        assert extract_json(text) == REPORT
+
+    def test_fenced_object_wins_over_an_inline_example(self):
+        """Verify an example object in the prose is not taken for the answer"""
+        text = 'Items look like {"id": "x"}.\n```json\n' + json.dumps(REPORT) + "\n```"
+
+        assert extract_json(text) == REPORT
+
+    def test_malformed_object_is_skipped_for_a_later_one(self):
+        """Verify a broken object does not stop the scan"""
+        text = '{"summary": "draft", oops}\n\nCorrected:\n' + json.dumps(REPORT)
+
+        assert extract_json(text) == REPORT
+
+    def test_objects_longer_than_the_first_slice(self, monkeypatch):
+        """Verify strings, numbers and literals cut by a slice still decode whole"""
+        monkeypatch.setattr(json_utils, "INITIAL_WINDOW", 3)
+        report = {"summary": "x" * 50, "count": 123456789, "done": False, "n": None}
+        text = "Report: " + json.dumps(report) + " trailing {prose}"
+
+        assert find_json(text) == report
+
+    def test_missing_json(self):
+        """Verify find_json falls back to its default and extract_json raises"""
+        assert find_json("no json here") is None
+        assert find_json(None, default={}) == {}
+        assert find_json('{"unterminated": ', default="none") == "none"
+        with pytest.raises(json.JSONDecodeError):
+            extract_json("no json here")
+        with pytest.raises(TypeError):
+            extract_json(None)
+
+    def test_pathological_nesting_does_not_raise(self):
+        """Verify nesting deeper than the decoder allows is skipped, not fatal"""
+        text = '{"a":' * 100_000 + "1" + "}" * 100_000 + ' then {"ok": true}'
+
+        assert find_json(text) == {"ok": True}
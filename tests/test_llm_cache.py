@@ -0,0 +1,74 @@
+"""
+Tests for the persistent LLM response cache
+"""
+
+import llm_cache
+from llm_cache import ResponseCache, make_key
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestLLMCache:
+    """Test class for response caching, expiry and eviction"""
+
+    def test_key_covers_every_input(self):
+        """Verify model, temperature, template and data all change the key"""
+        base = make_key("gpt-4o-mini", 0.1, "template", "data")
+
+        assert base == make_key("gpt-4o-mini", 0.1, "template", "data")
+        assert base != make_key("gpt-4o", 0.1, "template", "data")
+        assert base != make_key("gpt-4o-mini", 0.2, "template", "data")
+        assert base != make_key("gpt-4o-mini", 0.1, "template v2", "data")
+        assert base != make_key("gpt-4o-mini", 0.1, "template", "other data")
+
+    def test_hits_and_misses_persist_across_instances(self, tmp_path):
+        """Verify stored responses survive reopening and are counted"""
+        path = str(tmp_path / "cache" / "llm.db")
+        cache = ResponseCache(path)
+        assert cache.get("k") is None
+        cache.set("k", '{"summary": "ok"}')
+        cache.close()
+
+        reopened = ResponseCache(path)
+
+        assert reopened.get("k") == '{"summary": "ok"}'
+        assert reopened.stats() == {"hits": 1, "misses": 0}
+        assert cache.stats() == {"hits": 0, "misses": 1}
+
+    def test_entries_expire_after_ttl(self, tmp_path, monkeypatch):
+        """Verify entries older than the TTL are treated as misses"""
+        clock = FakeClock()
+        monkeypatch.setattr(llm_cache.time, "time", clock)
+        cache = ResponseCache(str(tmp_path / "llm.db"), ttl_seconds=60)
+        cache.set("k", "v")
+
+        clock.now += 30
+        assert cache.get("k") == "v"
+        clock.now += 31
+        assert cache.get("k") is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_entry_is_evicted(self, tmp_path, monkeypatch):
+        """Verify the cache keeps at most max_entries, dropping the LRU entry"""
+        clock = FakeClock()
+        monkeypatch.setattr(llm_cache.time, "time", clock)
+        cache = ResponseCache(str(tmp_path / "llm.db"), max_entries=2)
+
+        cache.set("a", "1")
+        clock.now += 1
+        cache.set("b", "2")
+        clock.now += 1
+        cache.get("a")
+        clock.now += 1
+        cache.set("c", "3")
+
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert cache.get("c") == "3"
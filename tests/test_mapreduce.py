@@ -0,0 +1,87 @@
+"""
+Tests for day-based chunking and reduction of partial reports
+"""
+
+import json
+
+from mapreduce import pack_chunks, reduce_reports, split_by_day
+from token_budget import count_tokens
+
+
+def _email(item_id, day, body="x"):
+    return {"id": item_id, "received_date": f"2024-02-{day:02d} 09:00:00", "body": body}
+
+
+def _message(item_id, day):
+    return {"id": item_id, "timestamp": f"2024-02-{day:02d} 10:00:00"}
+
+
+def _ids(chunk):
+    return [item["id"] for items in chunk.values() for item in items]
+
+
+class TestMapReduce:
+    """Test class for chunk packing and report reduction"""
+
+    def test_split_by_day_groups_every_source(self):
+        """Verify items from different sources on one day share a bucket"""
+        collected = {
+            "emails": [_email("email_002", 2), _email("email_001", 1)],
+            "slack_messages": [_message("slack_001", 2)],
+        }
+
+        days = split_by_day(collected)
+
+        assert [_ids(day) for day in days] == [
+            ["email_001"],
+            ["email_002", "slack_001"],
+        ]
+
+    def test_pack_chunks_respects_budget_and_keeps_every_item(self):
+        """Verify days are packed together until the budget, and oversized days split"""
+        collected = {
+            "emails": [
+                _email(f"email_{i:03d}", 1 + i // 4, "y" * 200) for i in range(20)
+            ]
+        }
+
+        chunks = pack_chunks(collected, max_tokens=300)
+
+        assert len(chunks) > 1
+        assert sorted(i for chunk in chunks for i in _ids(chunk)) == sorted(
+            e["id"] for e in collected["emails"]
+        )
+        for chunk in chunks:
+            if len(_ids(chunk)) > 1:
+                # Allow for the per-source keys around item-level splits
+                assert count_tokens(json.dumps(chunk)) <= 300 * 1.2
+
+    def test_small_data_is_one_chunk(self):
+        """Verify data under the budget is not split"""
+        collected = {"emails": [_email("email_001", 1), _email("email_002", 5)]}
+
+        assert len(pack_chunks(collected, max_tokens=10_000)) == 1
+
+    def test_reduce_deduplicates_by_id_keeping_highest_priority(self):
+        """Verify an id reported by several chunks appears once at its top priority"""
+        partials = [
+            {
+                "action_items": {"P1": [{"id": "email_001"}], "P2": [{"id": "x"}]},
+                "updates": {"email": {"P1": [{"id": "email_001"}]}},
+            },
+            {
+                "action_items": {"P0": [{"id": "email_001"}, {"id": "slack_001"}]},
+                "updates": {"email": {"P0": [{"id": "email_001"}]}},
+            },
+            {},
+        ]
+
+        reduced = reduce_reports(partials)
+
+        assert reduced["action_items"] == {
+            "P0": [{"id": "email_001"}, {"id": "slack_001"}],
+            "P1": [],
+            "P2": [{"id": "x"}],
+        }
+        assert reduced["updates"]["email"] == {"P0": [{"id": "email_001"}], "P1": []}
+        assert reduced["updates"]["slack"] == {"P0": [], "P1": []}
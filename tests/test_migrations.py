@@ -0,0 +1,128 @@
+"""
+Tests for the MCP server schema migrations
+"""
+
+import os
+import sqlite3
+import subprocess
+import sys
+
+from mcp_servers.migrations import MIGRATIONS, applied_version, migrate
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _create_events_db(path):
+    conn = sqlite3.connect(path)
+    conn.execute(
+        """
+        CREATE TABLE events (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            custom_id TEXT UNIQUE,
+            title TEXT NOT NULL,
+            description TEXT,
+            start_time TEXT NOT NULL,
+            end_time TEXT NOT NULL,
+            event_type TEXT DEFAULT 'meeting'
+        )
+    """
+    )
+    conn.commit()
+    conn.close()
+
+
+def _index_names(path):
+    conn = sqlite3.connect(path)
+    names = {
+        row[0]
+        for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+    }
+    conn.close()
+    return names
+
+
+class TestMigrations:
+    """Test class for versioned schema migrations"""
+
+    def test_migrate_creates_indexes_and_records_version(self, tmp_path):
+        """Verify pending migrations are applied and the version is recorded"""
+        db_path = str(tmp_path / "calendar.db")
+        _create_events_db(db_path)
+
+        version = migrate(db_path, "calendar")
+
+        assert version == MIGRATIONS["calendar"][-1].version
+        assert "idx_events_start_type" in _index_names(db_path)
+        conn = sqlite3.connect(db_path)
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == version
+        conn.close()
+
+    def test_migrate_reapplies_when_table_recreated(self, tmp_path):
+        """Verify indexes are restored after a seed script drops the table"""
+        db_path = str(tmp_path / "calendar.db")
+        _create_events_db(db_path)
+        migrate(db_path, "calendar")
+
+        conn = sqlite3.connect(db_path)
+        conn.execute("DROP TABLE events")
+        conn.commit()
+        conn.close()
+        _create_events_db(db_path)
+
+        conn = sqlite3.connect(db_path)
+        assert applied_version(conn, MIGRATIONS["calendar"]) == 0
+        conn.close()
+
+        migrate(db_path, "calendar")
+        assert "idx_events_start_type" in _index_names(db_path)
+
+    def test_migrate_skips_missing_database(self, tmp_path):
+        """Verify a missing database file is not created"""
+        db_path = tmp_path / "missing.db"
+        assert migrate(str(db_path), "emails") == 0
+        assert not db_path.exists()
+
+    def test_fts_index_backfilled_and_kept_in_sync(self, tmp_path):
+        """Verify existing rows are indexed and later writes reach the FTS table"""
+        db_path = str(tmp_path / "calendar.db")
+        _create_events_db(db_path)
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "INSERT INTO events (custom_id, title, start_time, end_time) "
+            "VALUES ('event_001', 'Budget deadline', '2024-02-01', '2024-02-01')"
+        )
+        conn.commit()
+        conn.close()
+
+        migrate(db_path, "calendar")
+
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "INSERT INTO events (custom_id, title, start_time, end_time) "
+            "VALUES ('event_002', 'Report due', '2024-02-02', '2024-02-02')"
+        )
+        conn.execute("DELETE FROM events WHERE custom_id = 'event_001'")
+        conn.commit()
+        matches = conn.execute(
+            "SELECT e.custom_id FROM events_fts JOIN events e ON e.id = events_fts.rowid "
+            "WHERE events_fts MATCH 'title : (deadline OR due)'"
+        ).fetchall()
+        conn.close()
+
+        assert matches == [("event_002",)]
+
+    def test_import_is_read_only_until_migrated_explicitly(self, tmp_path):
+        """Verify importing the servers leaves schemas alone and the CLI migrates"""
+        db_path = str(tmp_path / "calendar.db")
+        _create_events_db(db_path)
+        env = {**os.environ, "OOO_DATA_DIR": str(tmp_path)}
+
+        def run(*args):
+            subprocess.run([sys.executable, *args], cwd=REPO_ROOT, env=env, check=True)
+
+        run("-c", "from mcp_servers import calendar_mcp, email_mcp, slack_mcp")
+        assert "idx_events_start_type" not in _index_names(db_path)
+        assert not (tmp_path / "emails.db").exists()
+
+        run("-m", "mcp_servers.migrations")
+        assert "idx_events_start_type" in _index_names(db_path)
@@ -0,0 +1,140 @@
+"""
+Tests for cursor-based pagination of MCP tool results
+"""
+
+import asyncio
+import json
+import os
+import sqlite3
+
+import pytest
+
+from benchmarks.datasets import DATABASES, build_scaled_dataset
+from benchmarks.fake_llm import FakeChatModel
+from collection import collect_data
+from mcp_servers.db import DATA_DIR
+from mcp_servers.pagination import (
+    DEFAULT_PAGE_SIZE,
+    decode_offset,
+    keyset_page,
+    offset_page,
+)
+
+QUERY = """
+SELECT custom_id, timestamp, id
+FROM messages
+WHERE timestamp BETWEEN ? AND ?
+"""
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:")
+    conn.execute(
+        "CREATE TABLE messages (id INTEGER PRIMARY KEY, custom_id TEXT, timestamp TEXT)"
+    )
+    # Duplicate timestamps make sure the id tie-breaker is part of the keyset
+    conn.executemany(
+        "INSERT INTO messages (custom_id, timestamp) VALUES (?, ?)",
+        [(f"slack_{i:03d}", f"2024-02-{1 + i // 3:02d} 09:00:00") for i in range(20)],
+    )
+    yield conn
+    conn.close()
+
+
+class TestPagination:
+    """Test class for keyset and offset pagination"""
+
+    @pytest.mark.parametrize("descending", [False, True])
+    def test_keyset_pages_cover_every_row_once(self, conn, descending):
+        """Verify following next_cursor returns all rows exactly once, in order"""
+        params = ["2024-02-01", "2024-02-28"]
+        seen = []
+        cursor = None
+        while True:
+            page = keyset_page(
+                conn, QUERY, params, "timestamp", 6, cursor, descending=descending
+            )
+            rows = list(page)
+            assert len(rows) <= 6
+            seen.extend(row[0] for row in rows)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        expected = [f"slack_{i:03d}" for i in range(20)]
+        assert seen == (expected[::-1] if descending else expected)
+
+    def test_last_page_has_no_cursor(self, conn):
+        """Verify an exactly full final page does not advertise another page"""
+        page = keyset_page(
+            conn, QUERY, ["2024-02-01", "2024-02-28"], "timestamp", page_size=20
+        )
+        assert len(list(page)) == 20
+        assert page.next_cursor is None
+
+    def test_offset_page_cursor_advances(self):
+        """Verify offset cursors point just past the returned rows"""
+        page = offset_page(iter(range(10, 16)), page_size=5, offset=10)
+        assert list(page) == [10, 11, 12, 13, 14]
+        assert decode_offset(page.next_cursor) == 15
+
+    def test_invalid_cursor_rejected(self, conn):
+        """Verify malformed cursors raise ValueError"""
+        with pytest.raises(ValueError):
+            keyset_page(conn, QUERY, ["a", "b"], "timestamp", cursor="not-a-cursor")
+
+    @pytest.mark.skipif(
+        not os.path.exists(os.path.join(DATA_DIR, "emails.db")),
+        reason="seeded databases not found",
+    )
+    def test_get_emails_limit_is_an_alias_of_page_size(self):
+        """Verify the pre-paging limit argument still sizes get_emails pages"""
+        from mcp_servers.email_server import get_emails
+
+        args = ("2024-01-01", "2024-01-03")
+        by_limit = json.loads(get_emails(*args, limit=2, output_format="json"))
+        by_page_size = json.loads(get_emails(*args, page_size=2, output_format="json"))
+
+        assert by_limit == by_page_size
+        assert len(by_limit["items"]) == 2
+        assert by_limit["next_cursor"]
+
+
+class TestAgenticPaging:
+    """Test class for paged tool results in agentic collection"""
+
+    @pytest.mark.skipif(
+        not all(os.path.exists(os.path.join(DATA_DIR, db)) for db in DATABASES),
+        reason="seeded databases not found",
+    )
+    def test_agent_follows_cursors_past_the_default_page(self, tmp_path, monkeypatch):
+        """Verify agentic collection returns every row, not the first page"""
+        from main import OOOSummarizerAgent, parse_collected
+
+        start_date, end_date = "2024-01-01", "2024-01-03"
+        build_scaled_dataset(str(tmp_path), start_date, end_date, factor=20)
+        monkeypatch.setenv("OOO_DATA_DIR", str(tmp_path))
+        # page_size=None leaves the tools at DEFAULT_PAGE_SIZE
+        agent = OOOSummarizerAgent(
+            collection_mode="agentic",
+            use_cache=False,
+            llm=FakeChatModel(page_size=None),
+        )
+
+        async def collect_both_ways():
+            await agent.open_sessions()
+            try:
+                agentic = await agent.collect_data_agentic(start_date, end_date)
+                direct = await collect_data(agent.mcp_client, start_date, end_date)
+                return parse_collected(agentic), direct
+            finally:
+                await agent.close_sessions()
+
+        agentic, direct = asyncio.run(collect_both_ways())
+
+        assert len(direct["emails"]) > DEFAULT_PAGE_SIZE
+        for source, items in direct.items():
+            assert [item["id"] for item in agentic[source]] == [
+                item["id"] for item in items
+            ]
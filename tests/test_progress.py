@@ -0,0 +1,117 @@
+"""
+Tests for the NDJSON progress events
+"""
+
+import asyncio
+import io
+import json
+
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.tools import tool
+
+from collection import collect_data
+from main import emit_section
+from progress import emit, is_active, reporting
+from tests.test_collection import FakeClient, FakeConnector
+
+
+def _events(stream):
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+@tool
+def get_emails(start_date: str) -> str:
+    """List emails from a date"""
+    return json.dumps({"items": [{"id": "email_001"}, {"id": "email_002"}]})
+
+
+class TestProgress:
+    """Test class for progress reporting"""
+
+    def test_emit_writes_json_lines_only_while_reporting(self):
+        """Verify events carry their type and time, and emit is a no-op outside"""
+        stream = io.StringIO()
+        emit("run_started")
+        with reporting(stream):
+            assert is_active()
+            emit("run_started", start_date="2024-01-01")
+            emit("report", report={"summary": "ok"})
+        emit("error", message="ignored")
+
+        events = _events(stream)
+        assert [e["event"] for e in events] == ["run_started", "report"]
+        assert events[0]["start_date"] == "2024-01-01"
+        assert all(isinstance(e["t"], float) for e in events)
+        assert not is_active()
+
+    def test_langchain_runs_become_llm_and_tool_events(self):
+        """Verify model calls report tokens and tool calls report rows"""
+        model = GenericFakeChatModel(
+            messages=iter(
+                [
+                    AIMessage(
+                        content="hi",
+                        usage_metadata={
+                            "input_tokens": 12,
+                            "output_tokens": 3,
+                            "total_tokens": 15,
+                        },
+                    )
+                ]
+            )
+        )
+
+        async def run():
+            await model.ainvoke("hello")
+            await get_emails.ainvoke({"start_date": "2024-01-01"})
+
+        stream = io.StringIO()
+        with reporting(stream):
+            asyncio.run(run())
+
+        events = _events(stream)
+        assert [e["event"] for e in events] == [
+            "llm_call_started",
+            "llm_call_finished",
+            "tool_call_started",
+            "tool_call_finished",
+        ]
+        assert events[1]["input_tokens"] == 12
+        assert events[1]["output_tokens"] == 3
+        assert events[0]["id"] == events[1]["id"]
+        assert events[3]["tool"] == "get_emails"
+        assert events[3]["rows"] == 2
+
+    def test_direct_collection_reports_each_page(self):
+        """Verify direct collection emits a finished event per page with rows"""
+        connectors = {
+            "email": FakeConnector([{"items": [{"id": "email_001"}]}]),
+            "calendar": FakeConnector([{"items": []}]),
+            "slack": FakeConnector([{"items": [{"id": "m1"}, {"id": "m2"}]}]),
+        }
+        stream = io.StringIO()
+        with reporting(stream):
+            asyncio.run(
+                collect_data(FakeClient(connectors), "2024-01-01", "2024-01-03")
+            )
+
+        finished = {
+            e["tool"]: e["rows"]
+            for e in _events(stream)
+            if e["event"] == "tool_call_finished"
+        }
+        assert finished == {"get_emails": 1, "get_events": 0, "get_messages": 2}
+
+    def test_emit_section_skips_unparseable_responses(self):
+        """Verify sections are emitted from fenced JSON and bad replies are ignored"""
+        stream = io.StringIO()
+        with reporting(stream):
+            emit_section("summary", '```json\n{"summary": "All quiet"}\n```')
+            emit_section("summary", "not json")
+            emit_section("updates", '{"summary": "wrong key"}')
+
+        events = _events(stream)
+        assert len(events) == 1
+        assert events[0]["name"] == "summary"
+        assert events[0]["data"] == "All quiet"
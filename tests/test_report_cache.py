@@ -0,0 +1,77 @@
+"""
+Tests for the Streamlit app's report cache
+"""
+
+import os
+import sqlite3
+
+from report_cache import ReportCache, database_fingerprint, report_key
+
+
+def _setup(tmp_path):
+    data_dir = tmp_path / "databases"
+    prompt_dir = tmp_path / "prompts"
+    data_dir.mkdir()
+    prompt_dir.mkdir()
+    conn = sqlite3.connect(data_dir / "slack.db")
+    conn.execute("CREATE TABLE messages (id INTEGER PRIMARY KEY, message TEXT)")
+    conn.commit()
+    conn.close()
+    (prompt_dir / "summary_prompt.txt").write_text("Summarize the data")
+    return str(data_dir), str(prompt_dir)
+
+
+def _key(data_dir, prompt_dir, environ=None, dates=("2024-01-01", "2024-01-03")):
+    return report_key(*dates, data_dir, prompt_dir, environ or {})
+
+
+class TestReportCache:
+    """Test class for report keys and the report store"""
+
+    def test_key_is_stable_while_inputs_are_unchanged(self, tmp_path):
+        """Verify repeat views of a test case map to the same key"""
+        data_dir, prompt_dir = _setup(tmp_path)
+
+        assert _key(data_dir, prompt_dir) == _key(data_dir, prompt_dir)
+
+    def test_key_covers_dates_settings_and_prompts(self, tmp_path):
+        """Verify the date range, model and prompt text all change the key"""
+        data_dir, prompt_dir = _setup(tmp_path)
+        base = _key(data_dir, prompt_dir)
+
+        assert base != _key(data_dir, prompt_dir, dates=("2024-01-07", "2024-01-14"))
+        assert base != _key(data_dir, prompt_dir, {"OOO_MODEL": "gpt-4o"})
+        assert base == _key(data_dir, prompt_dir, {"UNRELATED": "1"})
+
+        with open(os.path.join(prompt_dir, "summary_prompt.txt"), "a") as f:
+            f.write(" briefly")
+        assert base != _key(data_dir, prompt_dir)
+
+    def test_database_writes_change_the_fingerprint(self, tmp_path):
+        """Verify a committed write is seen even if size and mtime stay put"""
+        data_dir, _ = _setup(tmp_path)
+        path = os.path.join(data_dir, "slack.db")
+        before = database_fingerprint(data_dir)
+        stat = os.stat(path)
+
+        conn = sqlite3.connect(path)
+        conn.execute("INSERT INTO messages (message) VALUES ('re-seeded')")
+        conn.commit()
+        conn.close()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert os.path.getsize(path) == stat.st_size
+        assert database_fingerprint(data_dir) != before
+
+    def test_reports_round_trip_and_clear(self, tmp_path):
+        """Verify stored reports come back as dicts until the cache is cleared"""
+        cache = ReportCache(str(tmp_path / "cache" / "reports.db"))
+        report = {"summary": "Quiet week ✅", "action_items": {}}
+
+        assert cache.get_report("k") is None
+        cache.set_report("k", report)
+        assert cache.get_report("k") == report
+
+        cache.clear()
+        assert cache.get_report("k") is None
+        cache.close()
@@ -0,0 +1,89 @@
+"""
+Tests for the single-call report schema validator
+"""
+
+import copy
+
+from report_schema import REPORT_SCHEMA, validate_report
+
+VALID_REPORT = {
+    "summary": "Production API is down; the client needs a fix today.",
+    "action_items": {
+        "P0": [
+            {
+                "id": "email_001",
+                "title": "Fix production API",
+                "due_date": "2024-01-03",
+                "source": "email",
+                "context": "Client reports an outage",
+            }
+        ],
+        "P1": [],
+        "P2": [],
+    },
+    "updates": {
+        "email": {"P0": [], "P1": []},
+        "calendar": {
+            "P0": [],
+            "P1": [
+                {
+                    "id": "event_005",
+                    "title": "Weekly Team Standup",
+                    "due_date": None,
+                    "source": "calendar",
+                    "context": "Regular meeting",
+                }
+            ],
+        },
+        "slack": {"P0": [], "P1": []},
+    },
+}
+
+
+class TestReportSchema:
+    """Test class for report validation"""
+
+    def test_valid_report_has_no_errors(self):
+        """Verify a well-formed report passes, including null due dates"""
+        assert validate_report(VALID_REPORT) == []
+
+    def test_missing_sections_are_reported(self):
+        """Verify missing summary and buckets produce errors"""
+        report = copy.deepcopy(VALID_REPORT)
+        report["summary"] = ""
+        del report["action_items"]["P2"]
+        del report["updates"]["slack"]
+
+        errors = validate_report(report)
+
+        assert "summary: expected a non-empty string" in errors
+        assert "action_items.P2: expected a list" in errors
+        assert "updates.slack: expected an object" in errors
+
+    def test_malformed_items_are_reported(self):
+        """Verify item fields are type-checked"""
+        report = copy.deepcopy(VALID_REPORT)
+        item = report["action_items"]["P0"][0]
+        item["source"] = "fax"
+        item["due_date"] = 20240103
+        del item["id"]
+
+        errors = validate_report(report)
+
+        assert "action_items.P0[0].id: expected a string" in errors
+        assert "action_items.P0[0].due_date: expected a string or null" in errors
+        assert any(error.startswith("action_items.P0[0].source") for error in errors)
+
+    def test_schema_is_strict(self):
+        """Verify every object in the schema is closed and fully required"""
+
+        def walk(schema):
+            if schema.get("type") == "object":
+                assert schema["additionalProperties"] is False
+                assert set(schema["required"]) == set(schema["properties"])
+                for child in schema["properties"].values():
+                    walk(child)
+            elif schema.get("type") == "array":
+                walk(schema["items"])
+
+        walk(REPORT_SCHEMA)
@@ -0,0 +1,75 @@
+"""
+Tests for rule-based noise scoring of collected data
+"""
+
+from scoring import filter_collected_data, filter_items, score_item
+
+
+class TestScoring:
+    """Test class for item scoring and noise filtering"""
+
+    def test_urgent_external_email_outscores_greeting(self):
+        """Verify urgent client mail scores above a leadership greeting"""
+        urgent = {
+            "id": "email_001",
+            "sender": "client@external.com",
+            "subject": "URGENT: Production Issue - API Down",
+            "body": "Need immediate attention.",
+        }
+        greeting = {
+            "id": "email_003",
+            "sender": "hr@company.com",
+            "subject": "Happy New Year 2024!",
+            "body": "Wishing everyone a prosperous new year!",
+        }
+
+        assert score_item(urgent, "emails") > 0
+        assert score_item(greeting, "emails") < 0
+
+    def test_keywords_match_whole_words(self):
+        """Verify keywords do not match inside longer words"""
+        item = {"message": "The download finished", "channel": "#general"}
+
+        assert score_item(item, "slack_messages") == 0
+
+    def test_mentions_direct_messages_and_event_types(self):
+        """Verify mention, DM and event_type features contribute to the score"""
+        mention = {"message": "Can you review?", "channel": "#dev", "is_mention": True}
+        direct = {"message": "Can you review?", "channel": "D123"}
+        deadline = {"title": "Submit report", "event_type": "deadline"}
+        social = {"title": "Bowling night", "event_type": "social"}
+
+        assert score_item(mention, "slack_messages") > 0
+        assert score_item(direct, "slack_messages") > score_item(
+            mention, "slack_messages"
+        )
+        assert score_item(deadline, "calendar_events") > 0
+        assert score_item(social, "calendar_events") < 0
+
+    def test_filter_drops_noise_and_sorts_by_score(self):
+        """Verify noise is dropped and the rest is ordered by score"""
+        items = [
+            {"id": "slack_002", "message": "Status update posted", "channel": "#dev"},
+            {"id": "slack_003", "message": "Coffee break anyone?", "channel": "#fun"},
+            {"id": "slack_001", "message": "URGENT: build blocked", "channel": "#dev"},
+        ]
+
+        kept, dropped = filter_items(items, "slack_messages")
+
+        assert dropped == 1
+        assert [item["id"] for item in kept] == ["slack_001", "slack_002"]
+        assert all("score" in item for item in kept)
+
+    def test_filter_collected_data_passes_other_keys_through(self):
+        """Verify unknown keys are preserved and each source is counted"""
+        data = {
+            "emails": [{"id": "email_001", "subject": "Weekly newsletter"}],
+            "calendar_events": [],
+            "notes": "kept as is",
+        }
+
+        filtered, dropped = filter_collected_data(data)
+
+        assert filtered["emails"] == []
+        assert filtered["notes"] == "kept as is"
+        assert dropped == {"emails": 1, "calendar_events": 0}
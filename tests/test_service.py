@@ -0,0 +1,156 @@
+"""
+Tests for the long-running report service
+"""
+
+import asyncio
+import json
+
+from benchmarks.fake_llm import FakeAgent
+from service import ReportService
+
+
+async def _wait_for(service, job_id):
+    for _ in range(100):
+        status, job = await service.handle("GET", f"/reports/{job_id}", b"")
+        if job["status"] in ("done", "error"):
+            return status, job
+        await asyncio.sleep(0.01)
+    raise AssertionError("job did not finish")
+
+
+async def _http(port, request):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(request)
+    await writer.drain()
+    # Signal the end of the request, so a short body cannot hang the server
+    writer.write_eof()
+    response = await reader.read()
+    writer.close()
+    head, _, body = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(body)
+
+
+class TestService:
+    """Test class for request routing, job processing and HTTP framing"""
+
+    def test_submit_and_poll_report(self):
+        """Verify a posted job is processed by a worker on the warm agent"""
+
+        async def scenario():
+            agent = FakeAgent()
+            service = ReportService(agent, workers=2)
+            await service.start()
+            try:
+                assert agent.sessions_open
+                status, accepted = await service.handle(
+                    "POST",
+                    "/reports",
+                    b'{"start": "2024-01-01", "end": "2024-01-03", "user": "jane"}',
+                )
+                assert status == 202
+                status, job = await _wait_for(service, accepted["id"])
+                return agent, status, job
+            finally:
+                await service.stop()
+
+        agent, status, job = asyncio.run(scenario())
+
+        assert status == 200
+        assert job["status"] == "done"
+        assert job["report"]["summary"] == "2024-01-01..2024-01-03"
+        assert [
+            (call["start"], call["end"], call["user"], call["emit_stdout"])
+            for call in agent.calls
+        ] == [("2024-01-01", "2024-01-03", "jane", False)]
+        assert not agent.sessions_open
+
+    def test_errors_and_validation(self):
+        """Verify failed jobs, bad bodies and unknown routes are reported"""
+
+        async def scenario():
+            service = ReportService(FakeAgent(fail_on={"bad"}), workers=1)
+            await service.start()
+            try:
+                _, accepted = await service.handle(
+                    "POST", "/reports", b'{"start": "bad", "end": "x"}'
+                )
+                results = [await _wait_for(service, accepted["id"])]
+                for method, path, body in [
+                    ("POST", "/reports", b"not json"),
+                    ("POST", "/reports", b'{"start": "2024-01-01"}'),
+                    ("GET", "/reports", b""),
+                    ("GET", "/reports/missing", b""),
+                    ("GET", "/nope", b""),
+                ]:
+                    results.append(await service.handle(method, path, body))
+                return results
+            finally:
+                await service.stop()
+
+        failed, *responses = asyncio.run(scenario())
+
+        assert failed[1]["status"] == "error"
+        assert failed[1]["error"] == "report for bad failed"
+        assert [status for status, _ in responses] == [400, 400, 405, 404, 404]
+
+    def test_http_round_trip(self):
+        """Verify requests and responses are framed correctly over a socket"""
+
+        async def scenario():
+            service = ReportService(FakeAgent(), workers=1)
+            await service.start()
+            server = await asyncio.start_server(
+                service.handle_connection, "127.0.0.1", 0
+            )
+            port = server.sockets[0].getsockname()[1]
+            try:
+                body = b'{"start": "2024-01-01", "end": "2024-01-03"}'
+                posted = await _http(
+                    port,
+                    b"POST /reports HTTP/1.1\r\nHost: x\r\n"
+                    + f"Content-Length: {len(body)}\r\n\r\n".encode()
+                    + body,
+                )
+                health = await _http(port, b"GET /health HTTP/1.1\r\nHost: x\r\n\r\n")
+                return posted, health
+            finally:
+                server.close()
+                await server.wait_closed()
+                await service.stop()
+
+        (post_status, accepted), (health_status, health) = asyncio.run(scenario())
+
+        assert post_status == 202
+        assert accepted["status"] == "queued"
+        assert health_status == 200
+        assert health["status"] == "ok"
+
+    def test_invalid_content_length_is_rejected(self):
+        """Verify non-numeric, negative and overstated lengths get a 400"""
+
+        async def scenario():
+            service = ReportService(FakeAgent(), workers=1)
+            await service.start()
+            server = await asyncio.start_server(
+                service.handle_connection, "127.0.0.1", 0
+            )
+            port = server.sockets[0].getsockname()[1]
+            try:
+                return [
+                    await _http(
+                        port,
+                        b"POST /reports HTTP/1.1\r\nHost: x\r\n"
+                        + f"Content-Length: {length}\r\n\r\n".encode()
+                        + b'{"start": "2024-01-01"}',
+                    )
+                    for length in ("abc", "-5", "+5", "1e3", "999")
+                ]
+            finally:
+                server.close()
+                await server.wait_closed()
+                await service.stop()
+
+        responses = asyncio.run(scenario())
+
+        assert [status for status, _ in responses] == [400] * 5
+        assert "Content-Length" in responses[0][1]["error"]
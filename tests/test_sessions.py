@@ -0,0 +1,51 @@
+"""
+Tests for MCP session ownership across reports
+"""
+
+import asyncio
+import os
+
+import pytest
+
+from benchmarks.fake_llm import FakeChatModel
+from main import OOOSummarizerAgent
+from mcp_servers.db import DATA_DIR
+
+DATABASES = ("emails.db", "calendar.db", "slack.db")
+REPORT_TIMEOUT = 120  # seconds; a leaked session hangs instead of failing
+
+
+class TestOwnedSessions:
+    """Test class for reports that open and close their own sessions"""
+
+    @pytest.mark.skipif(
+        not all(os.path.exists(os.path.join(DATA_DIR, db)) for db in DATABASES),
+        reason="seeded databases not found",
+    )
+    @pytest.mark.parametrize("collection_mode", ["direct", "agentic"])
+    def test_back_to_back_reports_on_the_default_transport(
+        self, tmp_path, collection_mode
+    ):
+        """Verify a second report on the same agent starts fresh stdio sessions"""
+        agent = OOOSummarizerAgent(
+            collection_mode=collection_mode, use_cache=False, llm=FakeChatModel()
+        )
+
+        async def two_reports():
+            # Both reports run in one task, as they do for a caller awaiting
+            # them in turn
+            return [
+                await agent.generate_report(
+                    "2024-01-01",
+                    "2024-01-03",
+                    output_path=str(tmp_path / f"report_{run}.json"),
+                    emit_stdout=False,
+                )
+                for run in range(2)
+            ]
+
+        first, second = asyncio.run(asyncio.wait_for(two_reports(), REPORT_TIMEOUT))
+
+        assert first["action_items"]["P0"]
+        assert second == first
+        assert not agent.mcp_client.get_all_active_sessions()
@@ -0,0 +1,62 @@
+"""
+Tests for the startup import-time profiler
+"""
+
+import subprocess
+import sys
+
+from startup_profile import aggregate, parse_importtime
+
+SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 |   _io
+import time:       200 |        300 | encodings
+some unrelated stderr line
+import time:       400 |        400 |     langchain_core.messages
+import time:       600 |       1000 |   langchain_core
+import time:       500 |       1500 | langchain_openai
+import time:       100 |        100 | encodings
+"""
+
+
+class TestStartupProfile:
+    """Test class for import-time parsing and aggregation"""
+
+    def test_parse_reads_timings_and_depth(self):
+        """Verify each importtime line becomes a timing with its nesting depth"""
+        timings = parse_importtime(SAMPLE)
+
+        assert [t.module for t in timings] == [
+            "_io",
+            "encodings",
+            "langchain_core.messages",
+            "langchain_core",
+            "langchain_openai",
+            "encodings",
+        ]
+        assert [t.depth for t in timings] == [1, 0, 2, 1, 0, 0]
+        assert timings[3].self_us == 600
+        assert timings[3].cumulative_us == 1000
+
+    def test_aggregate_groups_packages_across_processes(self):
+        """Verify self time is summed per package and top-level imports per module"""
+        summary = aggregate(parse_importtime(SAMPLE))
+
+        assert summary["import_total_ms"] == 1.9
+        assert summary["modules_imported"] == 6
+        assert summary["by_package"][0] == {"package": "langchain_core", "ms": 1.0}
+        assert summary["top_level_imports"] == [
+            {"module": "langchain_openai", "ms": 1.5},
+            {"module": "encodings", "ms": 0.4},
+        ]
+
+    def test_parses_real_interpreter_output(self):
+        """Verify the parser understands this interpreter's -X importtime format"""
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import json"],
+            capture_output=True,
+            text=True,
+        )
+
+        modules = {t.module for t in parse_importtime(result.stderr)}
+        assert "json" in modules
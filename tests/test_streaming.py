@@ -0,0 +1,111 @@
+"""
+Tests for streaming urgent items out of partial LLM responses
+"""
+
+import asyncio
+import io
+import json
+
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+
+from main import OOOSummarizerAgent
+from progress import reporting
+from streaming import PartialReport, PriorityItemParser
+
+ACTION_ITEMS = {
+    "action_items": {
+        "P0": [
+            {"id": "email_001", "title": 'Fix "prod" {outage}', "tags": ["a", {}]},
+            {"id": "slack_002", "title": "Approve rollback"},
+        ],
+        "P1": [{"id": "email_003", "title": "Review plan"}],
+        "P2": [],
+    }
+}
+UPDATES = {
+    "updates": {
+        "email": {"P0": [{"id": "email_001", "title": "Outage"}], "P1": []},
+        "slack": {"P0": [], "P1": [{"id": "slack_009", "title": "Standup"}]},
+    }
+}
+
+
+def _fenced(payload):
+    return "Here you go:\n```json\n" + json.dumps(payload, indent=2) + "\n```\n"
+
+
+def _feed_in_chunks(parser, text, size):
+    items = []
+    for start in range(0, len(text), size):
+        items.extend(parser.feed(text[start : start + size]))
+    return items
+
+
+class TestPriorityItemParser:
+    """Test class for the incremental P0 item parser"""
+
+    def test_items_complete_in_order_however_the_text_is_chunked(self):
+        """Verify every P0 item comes out whole with its path, for any chunking"""
+        text = _fenced(ACTION_ITEMS) + 'Also {"P0": [{"id": "ignored"}]}'
+        expected = [
+            (("action_items", "P0"), item)
+            for item in ACTION_ITEMS["action_items"]["P0"]
+        ]
+
+        for size in (1, 3, 7, len(text)):
+            assert _feed_in_chunks(PriorityItemParser(), text, size) == expected
+
+    def test_item_is_returned_by_the_chunk_that_closes_it(self):
+        """Verify an item is available before the response is complete"""
+        text = json.dumps(UPDATES)
+        close = text.index("}") + 1
+        parser = PriorityItemParser()
+
+        assert parser.feed(text[:close]) == [
+            (("updates", "email", "P0"), {"id": "email_001", "title": "Outage"})
+        ]
+        assert parser.feed(text[close:]) == []
+
+
+class TestPartialReport:
+    """Test class for announcing and writing streamed items"""
+
+    def test_writes_items_and_emits_events_without_duplicates(self, tmp_path):
+        """Verify the report file and progress events follow the items"""
+        output_path = str(tmp_path / "reports" / "report.json")
+        partial = PartialReport(output_path)
+        stream = io.StringIO()
+
+        with reporting(stream):
+            partial.feed(PriorityItemParser(), _fenced(UPDATES))
+            partial.feed(PriorityItemParser(), _fenced(UPDATES))
+
+        with open(output_path) as f:
+            written = json.load(f)
+        assert written == {
+            "partial": True,
+            "updates": {"email": {"P0": [{"id": "email_001", "title": "Outage"}]}},
+        }
+        events = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert [e["event"] for e in events] == ["priority_item"]
+        assert events[0]["path"] == ["updates", "email", "P0"]
+
+    def test_agent_streams_prompt_responses_into_the_partial_report(self, tmp_path):
+        """Verify run_prompt returns the full text and records P0 items on the way"""
+        response = _fenced(ACTION_ITEMS)
+        llm = GenericFakeChatModel(messages=iter([AIMessage(content=response)]))
+        agent = OOOSummarizerAgent(
+            collection_mode="direct", use_cache=False, stream=True, llm=llm
+        )
+        partial = PartialReport(str(tmp_path / "report.json"))
+
+        result = asyncio.run(
+            agent.run_prompt("prompts/action_items_prompt.txt", "{}", partial=partial)
+        )
+
+        assert result == response
+        assert partial.count == 2
+        assert (
+            partial.report["action_items"]["P0"] == ACTION_ITEMS["action_items"]["P0"]
+        )
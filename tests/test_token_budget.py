@@ -0,0 +1,65 @@
+"""
+Tests for token counting, field truncation and budgeted packing
+"""
+
+import json
+
+from token_budget import ELLIPSIS, count_tokens, pack_items, truncate_field
+
+
+def _email(item_id, score, body="Short body."):
+    return {"id": item_id, "subject": item_id, "body": body, "score": score}
+
+
+class TestTokenBudget:
+    """Test class for the prompt packer"""
+
+    def test_truncate_prefers_sentence_then_word_boundary(self):
+        """Verify truncation cuts at a sentence end, else at a space"""
+        sentences = "First sentence here. Second sentence is longer than that."
+        words = "alpha beta gamma delta epsilon zeta eta theta"
+
+        assert truncate_field(sentences, 40) == "First sentence here." + ELLIPSIS
+        assert truncate_field(words, 20) == "alpha beta gamma" + ELLIPSIS
+        assert len(truncate_field(words, 20)) <= 20
+        assert truncate_field("short", 20) == "short"
+
+    def test_pack_keeps_highest_scores_within_budget(self):
+        """Verify low-scoring items are dropped first and reported"""
+        collected = {
+            "emails": [_email(f"email_{i:03d}", score=i) for i in range(10)],
+            "calendar_events": [],
+        }
+        budget = count_tokens(json.dumps({"emails": [], "calendar_events": []})) + 60
+
+        packed = pack_items(collected, budget_tokens=budget)
+
+        kept = [item["id"] for item in packed.data["emails"]]
+        assert kept
+        assert kept == sorted(kept)
+        assert min(int(i[-3:]) for i in kept) > max(
+            int(i[-3:]) for i in packed.dropped["emails"]
+        )
+        assert len(kept) + len(packed.dropped["emails"]) == 10
+        assert packed.tokens <= budget
+
+    def test_pack_without_budget_only_truncates(self):
+        """Verify a None budget keeps every item but still shortens fields"""
+        collected = {
+            "slack_messages": [
+                {"id": "slack_001", "message": "word " * 200},
+                {"id": "slack_002", "message": "ok"},
+            ],
+            "metadata": {"source": "test"},
+        }
+
+        packed = pack_items(collected, budget_tokens=None, max_field_chars=50)
+
+        assert [m["id"] for m in packed.data["slack_messages"]] == [
+            "slack_001",
+            "slack_002",
+        ]
+        assert len(packed.data["slack_messages"][0]["message"]) <= 50
+        assert packed.truncated_fields == 1
+        assert packed.dropped == {}
+        assert packed.data["metadata"] == {"source": "test"}
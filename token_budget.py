@@ -0,0 +1,155 @@
+"""
+Token budgeting for the analysis prompts
+
+Prompt size grows with mailbox volume, and so do latency and cost. This
+module counts tokens (with tiktoken when it is installed, otherwise a
+~4 characters per token estimate), shortens long free-text fields at a
+sentence or word boundary, and packs the highest-scoring items into a fixed
+budget. Whatever does not fit is reported rather than silently lost.
+"""
+
+import json
+import os
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Optional
+
+DEFAULT_PROMPT_TOKEN_BUDGET = int(os.getenv("OOO_PROMPT_TOKEN_BUDGET", "12000"))
+DEFAULT_MAX_FIELD_CHARS = int(os.getenv("OOO_MAX_FIELD_CHARS", "400"))
+TOKENIZER_ENCODING = "o200k_base"
+
+SOURCES = ("emails", "calendar_events", "slack_messages")
+TEXT_FIELDS = ("body", "message", "description")
+ELLIPSIS = "…"
+
+_SENTENCE_END = re.compile(r"[.!?](?=\s)")
+
+
+@lru_cache(maxsize=1)
+def _encoding():
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        return tiktoken.get_encoding(TOKENIZER_ENCODING)
+    except Exception:
+        # The encoding is downloaded on first use, which fails offline
+        return None
+
+
+def tokenizer_name() -> str:
+    """Name of the tokenizer count_tokens uses"""
+    if _encoding() is None:
+        return "estimate/4-chars"
+    return f"tiktoken/{TOKENIZER_ENCODING}"
+
+
+def count_tokens(text: str) -> int:
+    """Count tokens in text"""
+    encoding = _encoding()
+    if encoding is None:
+        return (len(text) + 3) // 4
+    return len(encoding.encode(text))
+
+
+def _compact(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+
+def truncate_field(text: str, max_chars: int = DEFAULT_MAX_FIELD_CHARS) -> str:
+    """
+    Shorten text to at most ``max_chars`` characters.
+
+    Cuts after the last complete sentence that fits when that keeps at least
+    half the allowance, otherwise at the last word boundary.
+    """
+    if max_chars <= 0 or len(text) <= max_chars:
+        return text
+
+    head = text[: max_chars - len(ELLIPSIS)]
+    sentence_ends = [match.end() for match in _SENTENCE_END.finditer(head + " ")]
+    if sentence_ends and sentence_ends[-1] >= len(head) // 2:
+        return head[: sentence_ends[-1]].rstrip() + ELLIPSIS
+
+    space = head.rfind(" ")
+    if space >= len(head) // 2:
+        head = head[:space]
+    return head.rstrip() + ELLIPSIS
+
+
+class PackedData(NamedTuple):
+    data: Dict[str, Any]
+    tokens: int
+    dropped: Dict[str, List[str]]
+    truncated_fields: int
+
+
+def pack_items(
+    collected: Dict[str, Any],
+    budget_tokens: Optional[int] = DEFAULT_PROMPT_TOKEN_BUDGET,
+    max_field_chars: int = DEFAULT_MAX_FIELD_CHARS,
+) -> PackedData:
+    """
+    Fit collected data into a token budget.
+
+    Long TEXT_FIELDS are truncated first. Items are then admitted in
+    descending "score" order (ties keep their original order) until the
+    budget is spent; admitted items keep their original order per source.
+
+    Args:
+        collected: Dict of source -> list of items
+        budget_tokens: Token budget for the serialized data, or None to only
+            truncate fields
+        max_field_chars: Character limit per free-text field (0 disables)
+
+    Returns:
+        PackedData with the packed data, its token count, dropped ids per
+        source and the number of truncated fields
+    """
+    truncated_fields = 0
+    candidates = []
+    for source in SOURCES:
+        for index, item in enumerate(collected.get(source) or []):
+            if not isinstance(item, dict):
+                continue
+            shortened = dict(item)
+            for field in TEXT_FIELDS:
+                value = shortened.get(field)
+                if isinstance(value, str):
+                    cut = truncate_field(value, max_field_chars)
+                    if cut != value:
+                        shortened[field] = cut
+                        truncated_fields += 1
+            candidates.append((source, index, shortened))
+
+    # Keys other than the sources (and their empty lists) always go through
+    packed = {key: value for key, value in collected.items() if key not in SOURCES}
+    packed.update({source: [] for source in SOURCES if source in collected})
+    used = count_tokens(_compact(packed))
+
+    admitted = []
+    dropped: Dict[str, List[str]] = {}
+    ranked = sorted(candidates, key=lambda c: c[2].get("score", 0), reverse=True)
+    for source, index, item in ranked:
+        # One extra token for the separating comma
+        cost = count_tokens(_compact(item)) + 1
+        if budget_tokens is not None and used + cost > budget_tokens:
+            dropped.setdefault(source, []).append(item.get("id"))
+            continue
+        used += cost
+        admitted.append((source, index, item))
+
+    for source, _, item in sorted(admitted, key=lambda c: (SOURCES.index(c[0]), c[1])):
+        packed.setdefault(source, []).append(item)
+
+    return PackedData(packed, used, dropped, truncated_fields)
+
+
+def template_tokens(*prompt_paths: str) -> int:
+    """Largest token count among prompt template files"""
+    sizes = []
+    for path in prompt_paths:
+        with open(path, "r") as f:
+            sizes.append(count_tokens(f.read()))
+    return max(sizes, default=0)